@@ -3,11 +3,12 @@
 from typing import Dict, List, Optional, Any
 from enum import Enum
 from dataclasses import dataclass
-import uuid
-from datetime import datetime
+import itertools
 import logging
 import asyncio
+from functools import lru_cache
 from ..api.agent_interface import AgentInterface, AgentState, AgentType, AgentCapabilities
+from .core.registry import AGENT_REGISTRY
 class AgentPersonality(Enum):
     FRIENDLY = "friendly"
     NEUTRAL = "neutral"
@@ -26,10 +27,38 @@ class AgentStats:
     charisma: float = 10.0
     luck: float = 10.0
 
+LEVEL_EXP_BASE = 100
+LEVEL_EXP_EXPONENT = 1.5
+
+STATS_TICK_INTERVAL = 0.1
+
+@lru_cache(maxsize=256)
+def _level_exp_threshold(level: int) -> int:
+
+    return int(LEVEL_EXP_BASE * level ** LEVEL_EXP_EXPONENT)
+
+def _level_for_experience(experience: int) -> int:
+
+    if experience < LEVEL_EXP_BASE:
+        return 1
+
+    level = int((experience / LEVEL_EXP_BASE) ** (1 / LEVEL_EXP_EXPONENT)) + 1
+
+    # Correct for float rounding around exact thresholds
+    while experience >= _level_exp_threshold(level):
+        level += 1
+    while level > 1 and experience < _level_exp_threshold(level - 1):
+        level -= 1
+
+    return level
+
 class BasicAgent:
 
+    _id_counter = itertools.count()
+    _effect_counter = itertools.count()
+
     def __init__(self, name: str, agent_type: AgentType = AgentType.NPC):
-        self.id = str(uuid.uuid4())
+        self.id = f"agent_{next(BasicAgent._id_counter)}"
         self.name = name
         self.type = agent_type
         self.state = AgentState.INITIALIZING
@@ -44,6 +73,8 @@ class BasicAgent:
 
         self.skills: Dict[str, Dict] = {}
         self.active_effects: List[Dict] = []
+        self._effect_timers: Dict[str, asyncio.TimerHandle] = {}
+        self._stats_task: Optional[asyncio.Task] = None
 
         self.relationships: Dict[str, float] = {}
         self.faction_standings: Dict[str, float] = {}
@@ -55,7 +86,7 @@ class BasicAgent:
         self.current_task: Optional[Dict] = None
 
         self.metrics: Dict[str, float] = {}
-        self.last_update: datetime = datetime.now()
+        self.last_update: float = 0.0
 
     async def initialize(self, interface: AgentInterface, config: Dict) -> Dict:
 
@@ -82,6 +113,7 @@ class BasicAgent:
 
             await self._initialize_systems(config)
 
+            self._schedule_stats_tick()
             self.state = AgentState.READY
 
             return {
@@ -93,6 +125,14 @@ class BasicAgent:
         except Exception as e:
             return {'success': False, 'reason': str(e)}
 
+    async def shutdown(self, interface: AgentInterface) -> Dict:
+
+        self.stop_timers()
+        self.state = AgentState.INACTIVE
+        AGENT_REGISTRY.release(self.id)
+
+        return await interface.deregister_agent(self.id)
+
     async def update(self, delta_time: float) -> Dict:
 
         try:
@@ -102,20 +142,79 @@ class BasicAgent:
                 'metrics': {}
             }
 
-            await self._update_stats(delta_time)
-            await self._update_effects(delta_time)
-
-            await self._update_ai(delta_time)
-            await self._process_goals(delta_time)
+            await asyncio.gather(
+                self._update_ai(delta_time),
+                self._process_goals(delta_time)
+            )
 
             self._update_metrics(delta_time)
 
-            self.last_update = datetime.now()
+            self.last_update = asyncio.get_running_loop().time()
             return {'success': True, 'updates': updates}
 
         except Exception as e:
             return {'success': False, 'reason': str(e)}
 
+    def apply_effect(self, effect: Dict) -> str:
+
+        effect_id = effect.setdefault('id', f"effect_{next(BasicAgent._effect_counter)}")
+        self.active_effects.append(effect)
+
+        if effect.get('duration') is not None:
+            self._effect_timers[effect_id] = asyncio.get_running_loop().call_later(
+                effect['duration'],
+                self._expire_effect,
+                effect_id
+            )
+
+        return effect_id
+
+    def remove_effect(self, effect_id: str) -> bool:
+
+        handle = self._effect_timers.pop(effect_id, None)
+        if handle is not None:
+            handle.cancel()
+
+        remaining = [effect for effect in self.active_effects if effect.get('id') != effect_id]
+        removed = len(remaining) != len(self.active_effects)
+        self.active_effects = remaining
+
+        return removed
+
+    def _expire_effect(self, effect_id: str):
+
+        self._effect_timers.pop(effect_id, None)
+        self.active_effects = [
+            effect for effect in self.active_effects
+            if effect.get('id') != effect_id
+        ]
+
+    def _schedule_stats_tick(self):
+
+        if self._stats_task is None:
+            self._stats_task = asyncio.get_running_loop().create_task(self._tick_stats())
+
+    async def _tick_stats(self):
+
+        # Stats and ongoing effects move on a fixed 100 ms cadence instead of per frame
+        while True:
+            await asyncio.sleep(STATS_TICK_INTERVAL)
+            try:
+                await self._update_stats(STATS_TICK_INTERVAL)
+                await self._update_effects(STATS_TICK_INTERVAL)
+            except Exception as e:
+                logging.error(f"Agent {self.id} stats tick error: {str(e)}")
+
+    def stop_timers(self):
+
+        if self._stats_task is not None:
+            self._stats_task.cancel()
+            self._stats_task = None
+
+        for handle in self._effect_timers.values():
+            handle.cancel()
+        self._effect_timers.clear()
+
     async def handle_interaction(self,
                                interaction_type: str,
                                source_id: str,
@@ -146,14 +245,16 @@ class BasicAgent:
         except Exception as e:
             return {'success': False, 'reason': str(e)}
 
-    def gain_experience(self, amount: int) -> Dict:
+    async def gain_experience(self, amount: int) -> Dict:
 
         try:
             old_level = self.level
             self.experience += amount
 
-            while self.experience >= self._get_next_level_exp():
-                self.level += 1
+            # Handlers read self.level, so each one runs with its own level applied
+            new_level = max(old_level, _level_for_experience(self.experience))
+            for level in range(old_level + 1, new_level + 1):
+                self.level = level
                 await self._handle_level_up()
 
             return {
@@ -165,4 +266,8 @@ class BasicAgent:
             }
 
         except Exception as e:
-            return {'success': False, 'reason': str(e)}
\ No newline at end of file
+            return {'success': False, 'reason': str(e)}
+
+    def _get_next_level_exp(self) -> int:
+
+        return _level_exp_threshold(self.level)
@@ -1,4 +1,5 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, astuple, fields
+import weakref
 from typing import List, Dict, Optional
 import numpy as np
 
@@ -11,13 +12,106 @@ class CombatStats:
     defense: float = 10.0
     critical_chance: float = 0.05
 
+COMBAT_STAT_FIELDS = tuple(f.name for f in fields(CombatStats))
+COMBAT_STATS_DTYPE = np.dtype([(name, np.float16) for name in COMBAT_STAT_FIELDS])
+
+class CombatStatsTable:
+
+    def __init__(self, capacity: int = 1024):
+        self.rows = np.zeros(max(capacity, 1), dtype=COMBAT_STATS_DTYPE)
+        self.count = 0
+        self._free_slots: List[int] = []
+
+    def __len__(self) -> int:
+        return self.count - len(self._free_slots)
+
+    def add(self, stats: CombatStats) -> int:
+
+        if self._free_slots:
+            slot = self._free_slots.pop()
+            self.rows[slot] = astuple(stats)
+            return slot
+
+        if self.count == len(self.rows):
+            grown = np.zeros(len(self.rows) * 2, dtype=COMBAT_STATS_DTYPE)
+            grown[:self.count] = self.rows[:self.count]
+            self.rows = grown
+
+        slot = self.count
+        self.rows[slot] = astuple(stats)
+        self.count += 1
+        return slot
+
+    def release(self, slot: int):
+
+        self.rows[slot] = 0
+        self._free_slots.append(slot)
+
+    def set(self, slot: int, stats: CombatStats):
+
+        self.rows[slot] = astuple(stats)
+
+    def get(self, slot: int) -> CombatStats:
+
+        return CombatStats(*(float(value) for value in self.rows[slot].item()))
+
+    def value(self, slot: int, name: str) -> float:
+
+        return float(self.rows[slot][name])
+
+    def columns(self, names, slots: Optional[np.ndarray] = None) -> np.ndarray:
+
+        rows = self.rows[:self.count] if slots is None else self.rows[slots]
+        return np.stack([rows[name] for name in names], axis=-1).astype(np.float32)
+
+COMBAT_STATS_TABLE = CombatStatsTable()
+
+# strength, agility, defense
+THREAT_WEIGHTS = np.array([1.5, 1.2, 1.0])
+
+_ACTIONS = ('attack', 'defend', 'retreat', 'special')
+
+COMBAT_HISTORY_FIELDS = ('damage_dealt', 'damage_received', 'duration', 'victory')
+COMBAT_HISTORY_SIZE = 100
+PATTERN_UPDATE_INTERVAL = 50
+
 class CombatSystem:
-    def __init__(self, agent_stats: CombatStats):
-        self.stats = agent_stats
+    def __init__(self,
+                 agent_stats: CombatStats,
+                 stats_table: Optional[CombatStatsTable] = None):
+        # The table row is the only copy of the stats; it is freed with the system
+        self.stats_table = stats_table if stats_table is not None else COMBAT_STATS_TABLE
+        self.stats_slot = self.stats_table.add(agent_stats)
+        self._release_slot = weakref.finalize(self, self.stats_table.release, self.stats_slot)
         self.current_health = agent_stats.health
         self.current_stamina = agent_stats.stamina
-        self.combat_history: List[Dict] = []
+        self._history = np.zeros((COMBAT_HISTORY_SIZE, len(COMBAT_HISTORY_FIELDS)), dtype=np.float32)
+        self._history_index = 0
+        self._history_count = 0
         self.learned_patterns: Dict = {}
+        self._action_weights = np.empty(len(_ACTIONS))
+
+    @property
+    def stats(self) -> CombatStats:
+
+        return self.stats_table.get(self.stats_slot)
+
+    @stats.setter
+    def stats(self, stats: CombatStats):
+
+        self.stats_table.set(self.stats_slot, stats)
+
+    def release(self):
+
+        self._release_slot()
+
+    @property
+    def combat_history(self) -> np.ndarray:
+
+        if self._history_count < COMBAT_HISTORY_SIZE:
+            return self._history[:self._history_count]
+
+        return np.roll(self._history, -self._history_index, axis=0)
 
     def evaluate_threat(self, opponent_stats: CombatStats) -> float:
 
@@ -25,31 +119,56 @@ class CombatSystem:
             opponent_stats.strength * 1.5 +
             opponent_stats.agility * 1.2 +
             opponent_stats.defense * 1.0
-        ) / self.stats.defense
+        ) / self.stats_table.value(self.stats_slot, 'defense')
         return min(max(threat_score, 0.0), 10.0)
 
+    def evaluate_threats(self, opponents: List[CombatStats]) -> np.ndarray:
+
+        if not opponents:
+            return np.zeros(0)
+
+        opponent_matrix = np.array(
+            [(o.strength, o.agility, o.defense) for o in opponents],
+            dtype=np.float64
+        )
+        threat_scores = opponent_matrix @ THREAT_WEIGHTS / self.stats_table.value(self.stats_slot, 'defense')
+        return np.clip(threat_scores, 0.0, 10.0)
+
+    def evaluate_threat_slots(self, slots: np.ndarray) -> np.ndarray:
+
+        opponent_matrix = self.stats_table.columns(('strength', 'agility', 'defense'), slots)
+        threat_scores = (opponent_matrix @ THREAT_WEIGHTS.astype(np.float32) /
+                         self.stats_table.value(self.stats_slot, 'defense'))
+        return np.clip(threat_scores, 0.0, 10.0)
+
     def choose_combat_action(self, 
                            opponent_stats: CombatStats,
                            distance: float,
                            environmental_factors: Dict) -> Dict:
 
         threat_level = self.evaluate_threat(opponent_stats)
-        stamina_ratio = self.current_stamina / self.stats.stamina
-        health_ratio = self.current_health / self.stats.health
+        stats = self.stats
+        stamina_ratio = self.current_stamina / stats.stamina
+        health_ratio = self.current_health / stats.health
 
-        action_weights = {
-            'attack': self._calculate_attack_weight(threat_level, stamina_ratio),
-            'defend': self._calculate_defend_weight(threat_level, health_ratio),
-            'retreat': self._calculate_retreat_weight(threat_level, health_ratio),
-            'special': self._calculate_special_weight(stamina_ratio, distance)
-        }
+        action_weights = self._action_weights
+        action_weights[0] = self._calculate_attack_weight(threat_level, stamina_ratio)
+        action_weights[1] = self._calculate_defend_weight(threat_level, health_ratio)
+        action_weights[2] = self._calculate_retreat_weight(threat_level, health_ratio)
+        action_weights[3] = self._calculate_special_weight(stamina_ratio, distance)
 
-        chosen_action = max(action_weights.items(), key=lambda x: x[1])[0]
+        chosen_action = _ACTIONS[int(action_weights.argmax())]
         return self._execute_action(chosen_action, opponent_stats, distance)
 
     def learn_from_combat(self, combat_result: Dict):
 
-        self.combat_history.append(combat_result)
-        if len(self.combat_history) > 100:
+        row = self._history[self._history_index]
+        for i, field in enumerate(COMBAT_HISTORY_FIELDS):
+            row[i] = float(combat_result.get(field, 0.0))
+
+        self._history_index = (self._history_index + 1) % COMBAT_HISTORY_SIZE
+        self._history_count += 1
+
+        if (self._history_count >= COMBAT_HISTORY_SIZE and
+                self._history_count % PATTERN_UPDATE_INTERVAL == 0):
             self._update_learned_patterns()
-            self.combat_history = self.combat_history[-50:]
\ No newline at end of file
@@ -1,39 +1,138 @@
 from enum import Enum
 from typing import Dict, List, Optional
 import numpy as np
+from ..core.registry import AgentRegistry, AGENT_REGISTRY
+
+DEFAULT_TRUST = 0.5
+DEFAULT_RELATIONSHIP = 0.0
+INITIAL_COLUMNS = 16
+DEFAULT_TRAIT = 0.5
 
 class SocialAction(Enum):
     COOPERATE = "cooperate"
     TRADE = "trade"
     SHARE_INFO = "share_info"
     FORM_ALLIANCE = "form_alliance"
-    BETRAY = "betray"    DEFEND_ALLY = "defend_ally"
+    BETRAY = "betray"
+    DEFEND_ALLY = "defend_ally"
 
 class SocialBehavior:
-    def __init__(self, personality_traits: Dict[str, float]):
+    def __init__(self,
+                 personality_traits: Dict[str, float],
+                 registry: Optional[AgentRegistry] = None):
         self.personality = personality_traits
-        self.relationships: Dict[str, float] = {}
-        self.trust_levels: Dict[str, float] = {}
+        self._refresh_traits()
+
+        # Dense columns for the agents this behaviour has met; the first len(known_agents)
+        # entries are live. The shared registry reports agents leaving the world
+        self.registry = registry if registry is not None else AGENT_REGISTRY
+        self._columns: Dict[str, int] = {}
+        self.known_agents: List[str] = []
+        self.trust_levels = np.full(INITIAL_COLUMNS, DEFAULT_TRUST, dtype=np.float32)
+        self.relationships = np.full(INITIAL_COLUMNS, DEFAULT_RELATIONSHIP, dtype=np.float32)
+        self.registry.add_listener(self)
+
         self.alliance_history: List[Dict] = []
         self.interaction_memory: Dict[str, List] = {}
 
+    def update_traits(self, **changes) -> Dict:
+
+        self.personality.update(changes)
+
+        self._refresh_traits()
+        return {'success': True, 'personality': self.personality}
+
+    def _refresh_traits(self):
+
+        # Traits change rarely; the scalars evaluate_interaction reads are cached until update_traits
+        self._cooperation = float(self.personality.get('COOPERATION', DEFAULT_TRAIT))
+        self._loyalty = float(self.personality.get('LOYALTY', DEFAULT_TRAIT))
+        self._risk_taking = float(self.personality.get('RISK_TAKING', DEFAULT_TRAIT))
+
     def evaluate_interaction(self, 
                            other_agent_id: str, 
                            interaction_type: str,
                            context: Dict) -> float:
 
-        trust = self.trust_levels.get(other_agent_id, 0.5)
-        relationship = self.relationships.get(other_agent_id, 0.0)
+        idx = self._columns.get(other_agent_id)
+        if idx is not None:
+            trust = float(self.trust_levels[idx])
+            relationship = float(self.relationships[idx])
+        else:
+            trust = DEFAULT_TRUST
+            relationship = DEFAULT_RELATIONSHIP
 
-        base_score = (trust * 0.6 + relationship * 0.4) * self.personality['COOPERATION']
+        base_score = (trust * 0.6 + relationship * 0.4) * self._cooperation
 
         if context.get('under_attack', False):
-            base_score *= (1 + self.personality['LOYALTY'])
+            base_score *= (1 + self._loyalty)
         if context.get('resource_scarcity', False):
-            base_score *= (1 - self.personality['RISK_TAKING'] * 0.5)
+            base_score *= (1 - self._risk_taking * 0.5)
 
         return base_score
 
+    def set_trust(self, other_agent_id: str, value: float):
+
+        idx = self._column(other_agent_id)
+        self.trust_levels[idx] = value
+
+    def set_relationship(self, other_agent_id: str, value: float):
+
+        idx = self._column(other_agent_id)
+        self.relationships[idx] = value
+
+    def blend_trust(self, new_scores: np.ndarray, alpha: float = 0.8):
+
+        # TS_t = alpha * TS_{t-1} + (1 - alpha) * score, one score per known_agents entry
+        trust = self.trust_levels[:len(self.known_agents)]
+        trust *= alpha
+        trust += (1.0 - alpha) * np.asarray(new_scores, dtype=np.float32)
+
+    def release_agent(self, agent_id: str):
+
+        idx = self._columns.pop(agent_id, None)
+        if idx is None:
+            return
+
+        # The last column moves into the freed one so live columns stay contiguous
+        last = len(self.known_agents) - 1
+        if idx != last:
+            moved_id = self.known_agents[last]
+            self.known_agents[idx] = moved_id
+            self._columns[moved_id] = idx
+            self.trust_levels[idx] = self.trust_levels[last]
+            self.relationships[idx] = self.relationships[last]
+
+        self.known_agents.pop()
+        self.trust_levels[last] = DEFAULT_TRUST
+        self.relationships[last] = DEFAULT_RELATIONSHIP
+
+    def _column(self, other_agent_id: str) -> int:
+
+        idx = self._columns.get(other_agent_id)
+        if idx is None:
+            idx = len(self.known_agents)
+            if idx == len(self.trust_levels):
+                self._grow()
+
+            self.registry.index(other_agent_id)
+            self._columns[other_agent_id] = idx
+            self.known_agents.append(other_agent_id)
+
+        return idx
+
+    def _grow(self):
+
+        capacity = len(self.trust_levels)
+        self.trust_levels = np.concatenate([
+            self.trust_levels,
+            np.full(capacity, DEFAULT_TRUST, dtype=np.float32)
+        ])
+        self.relationships = np.concatenate([
+            self.relationships,
+            np.full(capacity, DEFAULT_RELATIONSHIP, dtype=np.float32)
+        ])
+
     def decide_social_action(self, 
                            other_agent_id: str,
                            situation: Dict) -> SocialAction:
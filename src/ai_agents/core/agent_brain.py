@@ -2,49 +2,77 @@
 
 import numpy as np
 from tensorflow import keras
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+from collections import defaultdict
 import json
-from datetime import datetime
-from .personality import PersonalitySystem
+import time
+import asyncio
+from concurrent.futures import Future
+from .personality import shared_personality_system
 from .memory_system import MemorySystem
+from .inference import QuantizedNetwork, StackedNetworks
+
+BRAIN_HEADS = ('decision', 'perception', 'learning')
+
 class AgentBrain:
 
     def __init__(self, personality_traits: Dict[str, float]):
 
-        self.personality_system = PersonalitySystem()
+        self.personality_system = shared_personality_system()
+        self.personality_profile = self.personality_system.create_personality(personality_traits)
         self.memory_system = MemorySystem()
 
         self.decision_network = self._create_decision_network()
         self.perception_network = self._create_perception_network()
         self.learning_network = self._create_learning_network()
+        self.brain_network = self._create_brain_network()
+        self._initial_weights = self.brain_network.get_weights()
+        self._refresh_inference_networks()
+
+        self.current_state = {}
+        self.goals = []
+        self.personality = personality_traits
+        self.last_update = time.monotonic()
+
+        self.performance_metrics = {}
+
+    def reinit(self, personality_traits: Dict[str, float]):
+
+        # Resets a recycled pool slot for a new agent; the networks are reused but
+        # their weights go back to the initial ones so nothing learned carries over
+        self.personality_system.release_personality(self.personality_profile)
+        self.personality_profile = self.personality_system.create_personality(personality_traits)
+        self.memory_system = MemorySystem()
+
+        self.brain_network.set_weights(self._initial_weights)
+        self._refresh_inference_networks()
 
         self.current_state = {}
         self.goals = []
         self.personality = personality_traits
-        self.last_update = datetime.now()
+        self.last_update = time.monotonic()
 
         self.performance_metrics = {}
 
     def process_input(self, input_data: Dict) -> Dict:
 
-        try:
+        self._update_state(input_data)
 
-            self._update_state(input_data)
+        perception_result = self._process_perception(input_data)
 
-            perception_result = self._process_perception(input_data)
+        decision = self._make_decision(perception_result)
 
-            decision = self._make_decision(perception_result)
+        return self._finish_input(input_data, decision)
 
-            self._learn_from_experience(input_data, decision)
+    def _finish_input(self, input_data: Dict, decision: Dict) -> Dict:
 
-            return {
-                'success': True,
-                'decision': decision,
-                'state_update': self.current_state
-            }
+        self._learn_from_experience(input_data, decision)
 
-        except Exception as e:
-            return {'success': False, 'reason': str(e)}
+        return {
+            'success': True,
+            'decision': decision,
+            'state_update': self.current_state
+        }
 
     def update(self, delta_time: float) -> Dict:
 
@@ -65,22 +93,104 @@ class AgentBrain:
         updates['state_changes'].extend(personality_updates)
         updates['decisions'].extend(goal_updates)
 
-        self.last_update = datetime.now()
+        self.last_update = time.monotonic()
         return {'success': True, 'updates': updates}
 
-    def learn(self, training_data: Dict) -> Dict:
+    async def learn(self, training_data: Dict) -> Dict:
+
+        history = await asyncio.to_thread(self._train_brain_network, training_data)
 
-        try:
-            results = {
-                'decision_training': self._train_decision_network(training_data),
-                'perception_training': self._train_perception_network(training_data),
-                'learning_training': self._train_learning_network(training_data)
+        results = {
+            f'{head}_training': {
+                metric: values for metric, values in history.items()
+                if metric.startswith(head)
             }
+            for head in BRAIN_HEADS
+        }
+
+        self._refresh_inference_networks()
+
+        return {'success': True, 'training_results': results}
+
+    def _refresh_inference_networks(self):
+
+        self.inference_networks: Dict[str, QuantizedNetwork] = {
+            'decision': QuantizedNetwork.from_keras(self.decision_network),
+            'perception': QuantizedNetwork.from_keras(self.perception_network),
+            'learning': QuantizedNetwork.from_keras(self.learning_network)
+        }
+
+    def _forward(self, network: str, inputs: np.ndarray) -> np.ndarray:
+
+        return self.inference_networks[network].forward(inputs)
+
+    def _process_perception(self, input_data: Dict) -> np.ndarray:
+
+        return self._forward('perception', self._encode_perception(input_data))
+
+    def _make_decision(self, perception_result: np.ndarray) -> Dict:
+
+        return self._select_decision(self._forward('decision', self._encode_decision(perception_result)))
+
+    def _select_decision(self, scores: np.ndarray) -> Dict:
+
+        action = int(np.argmax(scores))
+        return {'action': action, 'confidence': float(scores[action]), 'scores': scores}
+
+    async def infer(self,
+                    network: str,
+                    inputs: np.ndarray,
+                    batch: Optional['AgentBrainBatch'] = None) -> np.ndarray:
 
-            return {'success': True, 'training_results': results}
+        if batch is None:
+            return self._forward(network, inputs)
 
-        except Exception as e:
-            return {'success': False, 'reason': str(e)}
+        return await asyncio.wrap_future(batch.submit(self, network, inputs))
+
+    def _create_brain_network(self) -> keras.Model:
+
+        # Heads keep their own weights but share one optimizer and train step
+        inputs = {
+            'decision': keras.Input(shape=(64,), name='decision_input'),
+            'perception': keras.Input(shape=(128,), name='perception_input'),
+            'learning': keras.Input(shape=(64,), name='learning_input')
+        }
+
+        outputs = {
+            'decision': self.decision_network(inputs['decision']),
+            'perception': self.perception_network(inputs['perception']),
+            'learning': self.learning_network(inputs['learning'])
+        }
+
+        model = keras.Model(inputs=inputs, outputs=outputs)
+
+        model.compile(
+            optimizer='adam',
+            loss={
+                'decision': 'categorical_crossentropy',
+                'perception': 'binary_crossentropy',
+                'learning': 'mse'
+            },
+            metrics={
+                'decision': ['accuracy'],
+                'perception': ['accuracy'],
+                'learning': ['mae']
+            }
+        )
+
+        return model
+
+    def _train_brain_network(self, training_data: Dict) -> Dict:
+
+        history = self.brain_network.fit(
+            {head: training_data['inputs'][head] for head in BRAIN_HEADS},
+            {head: training_data['targets'][head] for head in BRAIN_HEADS},
+            epochs=training_data.get('epochs', 1),
+            batch_size=training_data.get('batch_size', 32),
+            verbose=0
+        )
+
+        return history.history
 
     def _create_decision_network(self) -> keras.Model:
 
@@ -91,13 +201,7 @@ class AgentBrain:
             keras.layers.Dropout(0.2),
             keras.layers.Dense(32, activation='relu'),
             keras.layers.Dense(16, activation='softmax')
-        ])
-
-        model.compile(
-            optimizer='adam',
-            loss='categorical_crossentropy',
-            metrics=['accuracy']
-        )
+        ], name='decision')
 
         return model
 
@@ -110,13 +214,7 @@ class AgentBrain:
             keras.layers.Dropout(0.3),
             keras.layers.Dense(64, activation='relu'),
             keras.layers.Dense(32, activation='sigmoid')
-        ])
-
-        model.compile(
-            optimizer='adam',
-            loss='binary_crossentropy',
-            metrics=['accuracy']
-        )
+        ], name='perception')
 
         return model
 
@@ -128,12 +226,75 @@ class AgentBrain:
             keras.layers.Dense(64, activation='relu'),
             keras.layers.Dense(32, activation='relu'),
             keras.layers.Dense(16, activation='linear')
+        ], name='learning')
+
+        return model
+
+class AgentBrainBatch:
+
+    # Requests resolve on the next flush(); the owning tick loop flushes once per tick
+    def __init__(self):
+        self._pending: Dict[str, List[Tuple[QuantizedNetwork, np.ndarray, Future]]] = defaultdict(list)
+        # Last stacked parameters per network head, reused while the batch members stay the same
+        self._stacked: Dict[str, StackedNetworks] = {}
+
+    def __len__(self) -> int:
+        return sum(len(requests) for requests in self._pending.values())
+
+    def submit(self, brain: AgentBrain, network: str, inputs: np.ndarray) -> Future:
+
+        future = Future()
+        self._pending[network].append((brain.inference_networks[network], inputs, future))
+        return future
+
+    def process_inputs(self, brains: List[AgentBrain], inputs: List[Dict]) -> List[Dict]:
+
+        # Batched AgentBrain.process_input: one forward pass per network head for all brains
+        for brain, input_data in zip(brains, inputs):
+            brain._update_state(input_data)
+
+        perceptions = self._run(brains, 'perception', [
+            brain._encode_perception(input_data) for brain, input_data in zip(brains, inputs)
+        ])
+        scores = self._run(brains, 'decision', [
+            brain._encode_decision(perception) for brain, perception in zip(brains, perceptions)
         ])
 
-        model.compile(
-            optimizer='adam',
-            loss='mse',
-            metrics=['mae']
-        )
+        return [
+            brain._finish_input(input_data, brain._select_decision(decision_scores))
+            for brain, input_data, decision_scores in zip(brains, inputs, scores)
+        ]
+
+    def _run(self, brains: List[AgentBrain], network: str, inputs: List[np.ndarray]) -> List[np.ndarray]:
+
+        futures = [self.submit(brain, network, x) for brain, x in zip(brains, inputs)]
+        self.flush()
+        return [future.result() for future in futures]
+
+    def flush(self) -> int:
+
+        pending, self._pending = self._pending, defaultdict(list)
+        processed = 0
+
+        for network, requests in pending.items():
+            try:
+                networks = [request[0] for request in requests]
+                stacked = self._stacked.get(network)
+                if stacked is None or not stacked.matches(networks):
+                    stacked = StackedNetworks(networks)
+                    self._stacked[network] = stacked
+
+                outputs = stacked.forward(np.stack([request[1] for request in requests]))
+            except Exception as e:
+                for _, _, future in requests:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            for (_, _, future), output in zip(requests, outputs):
+                if not future.done():
+                    future.set_result(output)
+
+            processed += len(requests)
 
-        return model
\ No newline at end of file
+        return processed
@@ -0,0 +1,106 @@
+# src/ai_agents/core/inference.py
+
+from typing import List
+from dataclasses import dataclass
+import numpy as np
+
+@dataclass
+class QuantizedDense:
+    weights: np.ndarray  # int8, (inputs, outputs)
+    scales: np.ndarray   # float32 per output channel
+    bias: np.ndarray     # float32
+    activation: str
+
+class QuantizedNetwork:
+
+    def __init__(self, layers: List[QuantizedDense]):
+        self.layers = layers
+
+    @classmethod
+    def from_keras(cls, model) -> 'QuantizedNetwork':
+
+        layers = []
+
+        for layer in model.layers:
+            params = layer.get_weights()
+            if len(params) != 2:
+                continue  # Dropout and other weightless layers are inference no-ops
+
+            kernel, bias = params
+            max_abs = np.abs(kernel).max(axis=0)
+            scales = np.where(max_abs > 0, max_abs / 127.0, 1.0).astype(np.float32)
+            weights = np.clip(np.rint(kernel / scales), -127, 127).astype(np.int8)
+
+            layers.append(QuantizedDense(
+                weights=weights,
+                scales=scales,
+                bias=bias.astype(np.float32),
+                activation=layer.get_config().get('activation', 'linear')
+            ))
+
+        return cls(layers)
+
+    def forward(self, inputs: np.ndarray) -> np.ndarray:
+
+        x = np.asarray(inputs, dtype=np.float32)
+
+        for layer in self.layers:
+            x = np.matmul(x, layer.weights, dtype=np.float32)
+            x *= layer.scales
+            x += layer.bias
+            x = _apply_activation(x, layer.activation)
+
+        return x
+
+    @staticmethod
+    def forward_many(networks: List['QuantizedNetwork'], inputs: np.ndarray) -> np.ndarray:
+
+        return StackedNetworks(networks).forward(inputs)
+
+class StackedNetworks:
+
+    # Layer parameters of same-shaped networks stacked once, so repeated batches over the
+    # same members skip re-stacking; one input row per network
+    def __init__(self, networks: List[QuantizedNetwork]):
+        self.networks = list(networks)
+        self.layers = []
+
+        for depth, layer in enumerate(self.networks[0].layers):
+            layers = [network.layers[depth] for network in self.networks]
+            self.layers.append((
+                np.stack([l.weights for l in layers]),
+                np.stack([l.scales for l in layers])[:, np.newaxis, :],
+                np.stack([l.bias for l in layers])[:, np.newaxis, :],
+                layer.activation
+            ))
+
+    def matches(self, networks: List[QuantizedNetwork]) -> bool:
+
+        return (len(networks) == len(self.networks) and
+                all(a is b for a, b in zip(networks, self.networks)))
+
+    def forward(self, inputs: np.ndarray) -> np.ndarray:
+
+        x = np.asarray(inputs, dtype=np.float32)[:, np.newaxis, :]
+
+        for weights, scales, bias, activation in self.layers:
+            x = np.matmul(x, weights, dtype=np.float32)
+            x *= scales
+            x += bias
+            x = _apply_activation(x, activation)
+
+        return x[:, 0, :]
+
+def _apply_activation(x: np.ndarray, activation: str) -> np.ndarray:
+
+    if activation == 'relu':
+        return np.maximum(x, 0.0, out=x)
+    if activation == 'sigmoid':
+        return 1.0 / (1.0 + np.exp(-x))
+    if activation == 'softmax':
+        x = np.exp(x - x.max(axis=-1, keepdims=True))
+        return x / x.sum(axis=-1, keepdims=True)
+    if activation == 'linear':
+        return x
+
+    raise ValueError(f"Unsupported activation: {activation}")
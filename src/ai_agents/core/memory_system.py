@@ -1,15 +1,16 @@
 # src/ai_agents/core/memory_system.py
 
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Set
 from dataclasses import dataclass
-from datetime import datetime
+import time
 import numpy as np
 from collections import defaultdict
 import json
 
-@dataclassclass Memory:
+@dataclass
+class Memory:
     id: str
-    timestamp: datetime
+    timestamp: int  # time.monotonic_ns()
     category: str
     content: Dict
     importance: float
@@ -17,6 +18,16 @@ import json
     related_entities: List[str]
     tags: List[str]
 
+# importance, |emotional_value|, recency, tag overlap
+RELEVANCE_WEIGHTS = np.array([0.4, 0.2, 0.2, 0.2])
+RECENCY_DECAY_SECONDS = 3600.0
+
+_SCORING_FIELDS = np.dtype([
+    ('importance', np.float64),
+    ('emotional_value', np.float64),
+    ('timestamp', np.int64)
+])
+
 class MemorySystem:
 
     def __init__(self, capacity: int = 1000):
@@ -25,6 +36,11 @@ class MemorySystem:
         self.emotional_memory: Dict[str, List[Memory]] = defaultdict(list)
         self.procedural_memory: Dict[str, Dict] = {}
 
+        self._memory_lookup: Dict[str, Memory] = {}
+        self._tag_index: Dict[str, Set[str]] = defaultdict(set)
+        self._category_index: Dict[str, Set[str]] = defaultdict(set)
+        self._entity_index: Dict[str, Set[str]] = defaultdict(set)
+
         self.capacity = capacity
         self.importance_threshold = 0.5
         self.consolidation_interval = 100
@@ -38,88 +54,212 @@ class MemorySystem:
                   related_entities: List[str] = None,
                   tags: List[str] = None) -> Dict:
 
-        try:
-            memory = Memory(
-                id=f"mem_{self.memory_count}",
-                timestamp=datetime.now(),
-                category=category,
-                content=content,
-                importance=importance,
-                emotional_value=emotional_value,
-                related_entities=related_entities or [],
-                tags=tags or []
-            )
-
-            self.short_term_memory.append(memory)
-            self.memory_count += 1
+        memory = Memory(
+            id=f"mem_{self.memory_count}",
+            timestamp=time.monotonic_ns(),
+            category=category,
+            content=content,
+            importance=importance,
+            emotional_value=emotional_value,
+            related_entities=related_entities or [],
+            tags=tags or []
+        )
 
-            if len(self.short_term_memory) >= self.consolidation_interval:
-                self._consolidate_memories()
+        self.short_term_memory.append(memory)
+        self._index_memory(memory)
+        self.memory_count += 1
 
-            return {'success': True, 'memory_id': memory.id}
+        if len(self.short_term_memory) >= self.consolidation_interval:
+            self._consolidate_memories()
 
-        except Exception as e:
-            return {'success': False, 'reason': str(e)}
+        return {'success': True, 'memory_id': memory.id}
 
     def recall(self,
               query: Dict,
               limit: int = 10,
               threshold: float = 0.0) -> List[Memory]:
 
-        memories = []
+        if limit <= 0:
+            return []
 
-        stm_results = self._search_memories(
-            self.short_term_memory,
-            query,
-            threshold
-        )
-        memories.extend(stm_results)
+        candidates = self._indexed_candidates(query)
+
+        if candidates is not None:
+            memories = self._search_memories(candidates, query, threshold)
+        else:
+            memories = []
 
-        ltm_results = self._search_memories(
-            list(self.long_term_memory.values()),
-            query,
-            threshold
+            stm_results = self._search_memories(
+                self.short_term_memory,
+                query,
+                threshold
+            )
+            memories.extend(stm_results)
+
+            ltm_results = self._search_memories(
+                list(self.long_term_memory.values()),
+                query,
+                threshold
+            )
+            memories.extend(ltm_results)
+
+        if not memories:
+            return []
+
+        scores = self._score_memories(memories, query)
+
+        if len(memories) > limit:
+            top = np.argpartition(scores, -limit)[-limit:]
+        else:
+            top = np.arange(len(memories))
+        top = top[np.argsort(-scores[top], kind='stable')]
+
+        return [memories[i] for i in top]
+
+    def _score_memories(self, memories: List[Memory], query: Dict) -> np.ndarray:
+
+        count = len(memories)
+        importance_w, emotional_w, recency_w, tag_w = RELEVANCE_WEIGHTS
+
+        # Single pass over the objects; everything after this is fused in-place NumPy
+        fields = np.fromiter(
+            ((m.importance, m.emotional_value, m.timestamp) for m in memories),
+            dtype=_SCORING_FIELDS,
+            count=count
         )
-        memories.extend(ltm_results)
 
-        memories.sort(key=lambda x: self._calculate_relevance(x, query),
-                     reverse=True)
+        scores = fields['importance'] * importance_w
+        scores += np.abs(fields['emotional_value']) * emotional_w
+
+        recency = np.maximum(time.monotonic_ns() - fields['timestamp'], 0).astype(np.float64)
+        recency *= -1.0 / (RECENCY_DECAY_SECONDS * 1e9)
+        np.exp(recency, out=recency)
+        recency *= recency_w
+        scores += recency
+
+        query_tags = set(query.get('tags', ()))
+        if query_tags:
+            tag_hits: Dict[str, int] = defaultdict(int)
+            for tag in query_tags:
+                for mem_id in self._tag_index.get(tag, ()):
+                    tag_hits[mem_id] += 1
+
+            overlap = np.fromiter((tag_hits.get(m.id, 0) for m in memories),
+                                  dtype=np.float64, count=count)
+            overlap *= tag_w / len(query_tags)
+            scores += overlap
 
-        return memories[:limit]
+        return scores
+
+    def _calculate_relevance(self, memory: Memory, query: Dict) -> float:
+
+        return float(self._score_memories([memory], query)[0])
 
     def forget(self, conditions: Dict) -> Dict:
 
-        removed_count = 0
+        candidates = self._indexed_candidates(conditions)
+        if candidates is None:
+            candidates = list(self._memory_lookup.values())
 
-        self.short_term_memory = [
-            mem for mem in self.short_term_memory
-            if not self._matches_conditions(mem, conditions)
-        ]
+        to_remove = {
+            memory.id for memory in candidates
+            if self._matches_conditions(memory, conditions)
+        }
 
-        to_remove = []
-        for mem_id, memory in self.long_term_memory.items():
-            if self._matches_conditions(memory, conditions):
-                to_remove.append(mem_id)
-                removed_count += 1
+        if to_remove:
+            self.short_term_memory = [
+                mem for mem in self.short_term_memory
+                if mem.id not in to_remove
+            ]
 
-        for mem_id in to_remove:
-            del self.long_term_memory[mem_id]
+            for mem_id in to_remove:
+                self.long_term_memory.pop(mem_id, None)
+                self._unindex_memory(self._memory_lookup[mem_id])
 
         return {
             'success': True,
-            'removed_count': removed_count
+            'removed_count': len(to_remove)
         }
 
     def update_memory(self, memory_id: str, updates: Dict) -> Dict:
 
+        memory = self._memory_lookup.get(memory_id)
+        if memory is None:
+            return {'success': False, 'reason': 'Memory not found'}
+
+        self._unindex_memory(memory)
+        self._apply_updates(memory, updates)
+        self._index_memory(memory)
+
+        return {'success': True, 'memory': memory}
+
+    def _consolidate_memories(self):
+
+        # Important short-term memories move to long-term storage and keep their index
+        # entries; everything that leaves both stores is unindexed so recall can't return it
         for memory in self.short_term_memory:
-            if memory.id == memory_id:
-                self._apply_updates(memory, updates)
-                return {'success': True, 'memory': memory}
+            if memory.importance >= self.importance_threshold:
+                self.long_term_memory[memory.id] = memory
+            else:
+                self._unindex_memory(memory)
+        self.short_term_memory = []
+
+        overflow = len(self.long_term_memory) - self.capacity
+        if overflow > 0:
+            evicted = sorted(
+                self.long_term_memory.values(),
+                key=lambda memory: (memory.importance, memory.timestamp)
+            )[:overflow]
+
+            for memory in evicted:
+                del self.long_term_memory[memory.id]
+                self._unindex_memory(memory)
+
+    def _index_memory(self, memory: Memory):
+
+        self._memory_lookup[memory.id] = memory
+        self._category_index[memory.category].add(memory.id)
+        for tag in memory.tags:
+            self._tag_index[tag].add(memory.id)
+        for entity in memory.related_entities:
+            self._entity_index[entity].add(memory.id)
+
+    def _unindex_memory(self, memory: Memory):
+
+        self._memory_lookup.pop(memory.id, None)
+        _discard_from_index(self._category_index, memory.category, memory.id)
+        for tag in memory.tags:
+            _discard_from_index(self._tag_index, tag, memory.id)
+        for entity in memory.related_entities:
+            _discard_from_index(self._entity_index, entity, memory.id)
+
+    def _indexed_candidates(self, query: Dict) -> Optional[List[Memory]]:
+
+        # None means the query has no indexed keys and needs a full scan
+        candidate_ids: Optional[Set[str]] = None
+
+        if 'category' in query:
+            candidate_ids = set(self._category_index.get(query['category'], ()))
+
+        for key, index in (('tags', self._tag_index), ('related_entities', self._entity_index)):
+            if not query.get(key):
+                continue
+
+            matches = set()
+            for value in query[key]:
+                matches.update(index.get(value, ()))
+
+            candidate_ids = matches if candidate_ids is None else candidate_ids & matches
+
+        if candidate_ids is None:
+            return None
+
+        return [self._memory_lookup[mem_id] for mem_id in candidate_ids]
 
-        if memory_id in self.long_term_memory:
-            memory = self.long_term_memory[memory_id]
-            self._apply_updates(memory, updates)
-            return {'success': True, 'memory': memory}
+def _discard_from_index(index: Dict[str, Set[str]], key: str, mem_id: str):
 
-        return {'success': False, 'reason': 'Memory not found'}
\ No newline at end of file
+    ids = index.get(key)
+    if ids is not None:
+        ids.discard(mem_id)
+        if not ids:
+            del index[key]
\ No newline at end of file
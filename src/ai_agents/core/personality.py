@@ -5,9 +5,9 @@ import numpy as np
 from typing import Dict, List, Optional
 from dataclasses import dataclass
 import json
-import random
 
-class PersonalityTrait(Enum):    AGGRESSION = "aggression"
+class PersonalityTrait(Enum):
+    AGGRESSION = "aggression"
     COOPERATION = "cooperation"
     CURIOSITY = "curiosity"
     LOYALTY = "loyalty"
@@ -18,38 +18,133 @@ class PersonalityTrait(Enum):    AGGRESSION = "aggression"
     CONFIDENCE = "confidence"
     ADAPTABILITY = "adaptability"
 
+TRAIT_ORDER: List[PersonalityTrait] = list(PersonalityTrait)
+TRAIT_INDEX: Dict[PersonalityTrait, int] = {trait: i for i, trait in enumerate(TRAIT_ORDER)}
+
+DOMINANT_TRAIT_COUNT = 3
+# Type reported when no archetypes are loaded; otherwise a profile takes its nearest archetype
+FALLBACK_PERSONALITY_TYPE = 'balanced'
+TRAIT_BUCKETS = 16  # 4 bits per trait, 40-bit key for the 10 traits
+_TRAIT_KEY_SHIFTS = np.arange(len(TRAIT_ORDER), dtype=np.uint64) * np.uint64(4)
+
+# Traits live in [0, 1] and are stored as 256-level uint8 codes
+TRAIT_LEVELS = 255
+TRAIT_SCALE = np.float32(1.0 / TRAIT_LEVELS)
+# Sub-code remainders are kept in 1/256ths of a code
+TRAIT_RESIDUAL_STEPS = 256
+
+def quantize_traits(traits: np.ndarray) -> np.ndarray:
+
+    return np.rint(np.clip(traits, 0.0, 1.0) * TRAIT_LEVELS).astype(np.uint8)
+
+def dequantize_traits(codes: np.ndarray) -> np.ndarray:
+
+    return codes.astype(np.float32) * TRAIT_SCALE
+
 @dataclass
 class PersonalityProfile:
-    traits: Dict[PersonalityTrait, float]
+    slot: int  # row in PersonalitySystem.trait_table
     dominant_traits: List[PersonalityTrait]
     personality_type: str
     behavior_weights: Dict[str, float]
 
 class PersonalitySystem:
 
-    def __init__(self):
+    def __init__(self, capacity: int = 1024):
         self.trait_ranges = {trait: (0.0, 1.0) for trait in PersonalityTrait}
+        self._trait_low = np.array([self.trait_ranges[t][0] for t in TRAIT_ORDER], dtype=np.float32)
+        self._trait_high = np.array([self.trait_ranges[t][1] for t in TRAIT_ORDER], dtype=np.float32)
+        self._rng = np.random.default_rng()
         self.personality_types = self._load_personality_types()
         self.behavior_patterns = self._load_behavior_patterns()
+        self._action_modifiers: Dict[str, np.ndarray] = {}
+
+        self._archetype_names = list(self.personality_types)
+        self._archetype_matrix = np.array(
+            [[base.get(trait.value, 0.5) for trait in TRAIT_ORDER]
+             for base in self.personality_types.values()],
+            dtype=np.float32
+        ).reshape(len(self._archetype_names), len(TRAIT_ORDER))
+        self._archetype_rows = {name: i for i, name in enumerate(self._archetype_names)}
+        self._personality_type_cache: Dict[int, str] = {}
+
+        # One uint8 row per profile
+        self.trait_table = np.zeros((max(capacity, 1), len(TRAIT_ORDER)), dtype=np.uint8)
+        # Sub-code remainder of each trait, so small nudges still accumulate
+        self._trait_residual = np.zeros(self.trait_table.shape, dtype=np.int8)
+        self._free_slots: List[int] = []
+        self.profile_count = 0
+
+    def get_traits(self, profile: PersonalityProfile) -> np.ndarray:
+
+        return dequantize_traits(self.trait_table[profile.slot])
+
+    def get_trait(self, profile: PersonalityProfile, trait: PersonalityTrait) -> float:
+
+        return float(self.trait_table[profile.slot, TRAIT_INDEX[trait]]) / TRAIT_LEVELS
+
+    def trait_matrix(self, slots: Optional[np.ndarray] = None) -> np.ndarray:
+
+        if slots is None:
+            return dequantize_traits(self.trait_table[:self.profile_count])
+
+        return dequantize_traits(self.trait_table[slots])
+
+    def _allocate_slot(self) -> int:
+
+        if self._free_slots:
+            return self._free_slots.pop()
+
+        if self.profile_count == len(self.trait_table):
+            grown = np.zeros((len(self.trait_table) * 2, len(TRAIT_ORDER)), dtype=np.uint8)
+            grown[:self.profile_count] = self.trait_table
+            self.trait_table = grown
+
+            residual = np.zeros(grown.shape, dtype=np.int8)
+            residual[:self.profile_count] = self._trait_residual
+            self._trait_residual = residual
+
+        slot = self.profile_count
+        self.profile_count += 1
+        return slot
+
+    def release_personality(self, profile: PersonalityProfile):
+
+        self.trait_table[profile.slot] = 0
+        self._trait_residual[profile.slot] = 0
+        self._free_slots.append(profile.slot)
 
     def generate_personality(self, base_type: str = None) -> PersonalityProfile:
 
-        traits = {}
+        trait_count = len(TRAIT_ORDER)
 
-        if base_type and base_type in self.personality_types:
+        if base_type and base_type in self._archetype_rows:
 
-            base_traits = self.personality_types[base_type]
-            for trait in PersonalityTrait:
-                base_value = base_traits.get(trait.value, 0.5)
-                variation = random.uniform(-0.1, 0.1)
-                traits[trait] = max(0.0, min(1.0, base_value + variation))
+            base_traits = self._archetype_matrix[self._archetype_rows[base_type]]
+            variation = self._rng.uniform(-0.1, 0.1, trait_count).astype(np.float32)
+            traits = np.clip(base_traits + variation, 0.0, 1.0)
         else:
 
-            for trait in PersonalityTrait:
-                traits[trait] = random.uniform(
-                    self.trait_ranges[trait][0],
-                    self.trait_ranges[trait][1]
-                )
+            traits = self._rng.uniform(self._trait_low, self._trait_high).astype(np.float32)
+
+        return self._build_profile(traits)
+
+    def create_personality(self, trait_values: Dict[str, float]) -> PersonalityProfile:
+
+        # Accepts either trait names ('LOYALTY') or values ('loyalty'); missing traits sit at 0.5
+        traits = np.array(
+            [trait_values.get(trait.name, trait_values.get(trait.value, 0.5)) for trait in TRAIT_ORDER],
+            dtype=np.float32
+        )
+
+        return self._build_profile(traits)
+
+    def _build_profile(self, traits: np.ndarray) -> PersonalityProfile:
+
+        slot = self._allocate_slot()
+        self.trait_table[slot] = quantize_traits(traits)
+        self._trait_residual[slot] = 0
+        traits = dequantize_traits(self.trait_table[slot])
 
         dominant_traits = self._determine_dominant_traits(traits)
 
@@ -58,7 +153,7 @@ class PersonalitySystem:
         behavior_weights = self._calculate_behavior_weights(traits)
 
         return PersonalityProfile(
-            traits=traits,
+            slot=slot,
             dominant_traits=dominant_traits,
             personality_type=personality_type,
             behavior_weights=behavior_weights
@@ -69,14 +164,20 @@ class PersonalitySystem:
                     trait: PersonalityTrait,
                     amount: float) -> PersonalityProfile:
 
-        current_value = profile.traits[trait]
-        new_value = max(0.0, min(1.0, current_value + amount))
+        index = TRAIT_INDEX[trait]
+        steps = (int(self.trait_table[profile.slot, index]) * TRAIT_RESIDUAL_STEPS +
+                 int(self._trait_residual[profile.slot, index]) +
+                 round(amount * TRAIT_LEVELS * TRAIT_RESIDUAL_STEPS))
+        steps = max(0, min(TRAIT_LEVELS * TRAIT_RESIDUAL_STEPS, steps))
 
-        profile.traits[trait] = new_value
+        code = (steps + TRAIT_RESIDUAL_STEPS // 2) // TRAIT_RESIDUAL_STEPS
+        self.trait_table[profile.slot, index] = code
+        self._trait_residual[profile.slot, index] = steps - code * TRAIT_RESIDUAL_STEPS
+        traits = self.get_traits(profile)
 
-        profile.dominant_traits = self._determine_dominant_traits(profile.traits)
-        profile.personality_type = self._determine_personality_type(profile.traits)
-        profile.behavior_weights = self._calculate_behavior_weights(profile.traits)
+        profile.dominant_traits = self._determine_dominant_traits(traits)
+        profile.personality_type = self._determine_personality_type(traits)
+        profile.behavior_weights = self._calculate_behavior_weights(traits)
 
         return profile
 
@@ -84,18 +185,73 @@ class PersonalitySystem:
                                  profile: PersonalityProfile,
                                  context: Dict) -> Dict[str, float]:
 
-        weights = {}
+        possible_actions = context.get('possible_actions', {})
+        if not possible_actions:
+            return {}
+
+        actions = list(possible_actions)
+        count = len(actions)
+
+        base_weights = np.fromiter(possible_actions.values(), dtype=np.float32, count=count)
+        modifier_matrix = np.stack([self._get_action_modifiers(action) for action in actions])
+        context_modifiers = np.fromiter(
+            (self._get_context_modifier(action, context) for action in actions),
+            dtype=np.float32,
+            count=count
+        )
+
+        traits = self.get_traits(profile)
+        weights = (base_weights *
+                   np.prod(1.0 + modifier_matrix * traits, axis=1) *
+                   context_modifiers)
+        np.clip(weights, 0.0, 1.0, out=weights)
+
+        return dict(zip(actions, weights.tolist()))
+
+    def _determine_dominant_traits(self, traits: np.ndarray) -> List[PersonalityTrait]:
+
+        top = np.argpartition(traits, -DOMINANT_TRAIT_COUNT)[-DOMINANT_TRAIT_COUNT:]
+        top = top[np.argsort(-traits[top], kind='stable')]
+
+        return [TRAIT_ORDER[i] for i in top]
+
+    def _determine_personality_type(self, traits: np.ndarray) -> str:
+
+        buckets = np.minimum(traits * TRAIT_BUCKETS, TRAIT_BUCKETS - 1).astype(np.uint64)
+        key = int(np.bitwise_or.reduce(buckets << _TRAIT_KEY_SHIFTS))
+
+        personality_type = self._personality_type_cache.get(key)
+        if personality_type is None:
+            if self._archetype_names:
+                # Classify the bucket centre so every vector sharing a key agrees
+                centres = (buckets + 0.5) / TRAIT_BUCKETS
+                distances = np.square(self._archetype_matrix - centres).sum(axis=1)
+                personality_type = self._archetype_names[int(np.argmin(distances))]
+            else:
+                personality_type = FALLBACK_PERSONALITY_TYPE
+
+            self._personality_type_cache[key] = personality_type
+
+        return personality_type
+
+    def _get_action_modifiers(self, action: str) -> np.ndarray:
 
-        for action, base_weight in context.get('possible_actions', {}).items():
-            weight = base_weight
+        modifiers = self._action_modifiers.get(action)
+        if modifiers is None:
+            modifiers = np.array(
+                [self._get_trait_action_modifier(trait, action) for trait in TRAIT_ORDER],
+                dtype=np.float32
+            )
+            self._action_modifiers[action] = modifiers
 
-            for trait, value in profile.traits.items():
-                modifier = self._get_trait_action_modifier(trait, action)
-                weight *= (1 + modifier * value)
+        return modifiers
+_SHARED_PERSONALITY_SYSTEM: Optional[PersonalitySystem] = None
 
-            context_modifier = self._get_context_modifier(action, context)
-            weight *= context_modifier
+def shared_personality_system() -> PersonalitySystem:
 
-            weights[action] = max(0.0, min(1.0, weight))
+    # One trait table for the whole population; brains take a row each
+    global _SHARED_PERSONALITY_SYSTEM
+    if _SHARED_PERSONALITY_SYSTEM is None:
+        _SHARED_PERSONALITY_SYSTEM = PersonalitySystem()
 
-        return weights
\ No newline at end of file
+    return _SHARED_PERSONALITY_SYSTEM
@@ -0,0 +1,43 @@
+# src/ai_agents/core/registry.py
+
+from typing import Dict, List, Optional
+import weakref
+
+class AgentRegistry:
+
+    def __init__(self):
+        self.ids: Dict[str, int] = {}
+        self._free_indices: List[int] = []
+        # Owners of per-agent columns, told when an agent is released so they can drop it
+        self._listeners: weakref.WeakSet = weakref.WeakSet()
+
+    def __len__(self) -> int:
+        return len(self.ids) + len(self._free_indices)
+
+    def index(self, agent_id: str) -> int:
+
+        idx = self.ids.get(agent_id)
+        if idx is None:
+            idx = self._free_indices.pop() if self._free_indices else len(self.ids)
+            self.ids[agent_id] = idx
+        return idx
+
+    def get(self, agent_id: str) -> Optional[int]:
+
+        return self.ids.get(agent_id)
+
+    def release(self, agent_id: str):
+
+        idx = self.ids.pop(agent_id, None)
+        if idx is None:
+            return
+
+        for listener in list(self._listeners):
+            listener.release_agent(agent_id)
+        self._free_indices.append(idx)
+
+    def add_listener(self, listener):
+
+        self._listeners.add(listener)
+
+AGENT_REGISTRY = AgentRegistry()
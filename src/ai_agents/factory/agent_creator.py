@@ -1,30 +1,42 @@
 from typing import Dict, Optional
 from ..core.personality import PersonalityTrait
 from ..behaviors.combat import CombatStats
+from functools import lru_cache
+import copy
 import json
 import uuid
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+TEMPLATES_PATH = 'templates/agent_templates.json'
+
 class AgentTemplate:
     def __init__(self, template_data: Dict):
         self.name = template_data['name']
-        self.personality_baseline = template_data['personality']        self.combat_stats = template_data['combat_stats']
+        self.personality_baseline = template_data['personality']
+        self.combat_stats = template_data['combat_stats']
         self.behavior_patterns = template_data['behavior_patterns']
         self.specializations = template_data['specializations']
 
 class AgentCreator:
     def __init__(self):
-        self.templates = self._load_templates()
+        self._templates: Optional[Dict[str, AgentTemplate]] = None
         self.customization_options = self._get_customization_options()
         self.created_agents: Dict = {}
 
+    @property
+    def templates(self) -> Dict[str, AgentTemplate]:
+
+        if self._templates is None:
+            self._templates = self._load_templates()
+        return self._templates
+
     def _load_templates(self) -> Dict[str, AgentTemplate]:
 
-        with open('templates/agent_templates.json', 'r') as f:
-            templates_data = json.load(f)
-        return {
-            name: AgentTemplate(data) 
-            for name, data in templates_data.items()
-        }
+        return _load_templates_file(TEMPLATES_PATH)
 
     def create_agent(self,
                     template_name: Optional[str] = None,
@@ -34,8 +46,22 @@ class AgentCreator:
         base = template_name and self.templates[template_name] or self._create_base_agent()
 
         if custom_traits:
+            # Templates are shared between creators; customize a private copy
+            base = copy.deepcopy(base)
             self._apply_customization(base, custom_traits)
 
         agent_data = self._initialize_agent(base)
         self.created_agents[agent_id] = agent_data
-        return {'agent_id': agent_id, 'agent_data': agent_data}
\ No newline at end of file
+        return {'agent_id': agent_id, 'agent_data': agent_data}
+
+@lru_cache(maxsize=None)
+def _load_templates_file(path: str) -> Dict[str, AgentTemplate]:
+
+    with open(path, 'rb') as f:
+        raw = f.read()
+
+    templates_data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    return {
+        name: AgentTemplate(data)
+        for name, data in templates_data.items()
+    }
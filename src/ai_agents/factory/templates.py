@@ -5,9 +5,19 @@ from enum import Enum
 from dataclasses import dataclass
 import json
 import logging
+import os
+from functools import lru_cache
 from ..basic_agent import BasicAgent, AgentStats, AgentPersonality
 
-class TemplateType(Enum):    MERCHANT = "merchant"
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+DIALOGUE_TREE_DIR = 'templates/dialogue_trees'
+
+class TemplateType(Enum):
+    MERCHANT = "merchant"
     WARRIOR = "warrior"
     SCHOLAR = "scholar"
     CRAFTSMAN = "craftsman"
@@ -157,4 +167,20 @@ class AgentTemplates:
             agent.skills[ability] = {'level': 1, 'experience': 0}
 
         if customization:
-            self._apply_customization(agent, customization)
\ No newline at end of file
+            self._apply_customization(agent, customization)
+
+    def _load_dialogue_tree(self, tree_name: str) -> Dict:
+
+        return _read_dialogue_tree(tree_name)
+
+@lru_cache(maxsize=None)
+def _read_dialogue_tree(tree_name: str) -> Dict:
+
+    path = os.path.join(DIALOGUE_TREE_DIR, f"{tree_name}.json")
+    if not os.path.exists(path):
+        return {}
+
+    with open(path, 'rb') as f:
+        raw = f.read()
+
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
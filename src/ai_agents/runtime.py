@@ -0,0 +1,32 @@
+# src/ai_agents/runtime.py
+
+import asyncio
+
+try:
+    import uvloop
+except ImportError:
+    try:
+        import winloop as uvloop  # libuv loop for Windows, same API
+    except ImportError:
+        uvloop = None
+
+def install_event_loop_policy() -> bool:
+
+    if uvloop is None:
+        return False
+
+    if not isinstance(asyncio.get_event_loop_policy(), uvloop.EventLoopPolicy):
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
+def new_event_loop() -> asyncio.AbstractEventLoop:
+
+    install_event_loop_policy()
+    loop = asyncio.new_event_loop()
+
+    # Python 3.12+: coroutines that finish without suspending skip the scheduler
+    eager_task_factory = getattr(asyncio, 'eager_task_factory', None)
+    if eager_task_factory is not None:
+        loop.set_task_factory(eager_task_factory)
+
+    return loop
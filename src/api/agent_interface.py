@@ -1,17 +1,60 @@
 from typing import Dict, Optional, Set
 import logging
+import logging.handlers
+import atexit
+import queue
 from enum import Enum
 from datetime import datetime
 import asyncio
-from threading import Lock
+import time
+import uuid
 import weakref
+from collections import OrderedDict
+
+LOG_FILE = 'agent_interface.log'
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+logger = logging.getLogger(__name__)
+_log_listener: Optional[logging.handlers.QueueListener] = None
+
+def _start_log_listener():
+
+    # File writes happen on the listener thread, never on the event loop
+    global _log_listener
+    if _log_listener is not None:
+        return
+
+    file_handler = logging.handlers.RotatingFileHandler(
+        LOG_FILE,
+        maxBytes=10 * 1024 * 1024,
+        backupCount=3
+    )
+    file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+    _log_listener = logging.handlers.QueueListener(log_queue, file_handler)
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
 
 class AgentState(Enum):
-    INITIALIZING = "initializing"    ACTIVE = "active"
+    INITIALIZING = "initializing"
+    ACTIVE = "active"
     INACTIVE = "inactive"
     DISCONNECTED = "disconnected"
     ERROR = "error"
 
+class AgentConnection:
+
+    __slots__ = ('agent_id', 'data', '__weakref__')
+
+    def __init__(self, agent_id: str):
+        self.agent_id = agent_id
+        self.data: Dict = {}
+
 class AgentInterface:
 
     def __init__(self):
@@ -19,25 +62,45 @@ class AgentInterface:
         self.MAX_CONNECTIONS = 1000
         self.CONNECTION_TIMEOUT = 30  
         self.CLEANUP_INTERVAL = 300   
+        self.LOCK_STRIPES = 64
+
+        self._init_state()
+
+        self._setup_logging()
+
+    def _init_state(self):
 
-        self._lock = Lock()
+        # Guards the registry size check; per-agent work uses the stripe locks
+        self._lock = asyncio.Lock()
+        self._stripes = [asyncio.Lock() for _ in range(self.LOCK_STRIPES)]
 
         self.registered_agents: Dict[str, Dict] = {}
         self.agent_states: Dict[str, AgentState] = {}
 
-        self.active_connections: Dict[str, weakref.ref] = {}
-        self.connection_timestamps: Dict[str, datetime] = {}
+        # Entries vanish once the caller drops its connection object
+        self.active_connections: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
+        # time.monotonic(), oldest first; refreshed entries move to the end
+        self.connection_timestamps: 'OrderedDict[str, float]' = OrderedDict()
 
         self.event_handlers: Dict[str, Dict] = {}
         self.last_event_time: Dict[str, datetime] = {}
 
-        self._setup_logging()
+        # Agents whose handlers may be stale; _cleanup_old_events only visits these
+        self._dirty_event_agents: Set[str] = set()
+        self._last_cleanup_ts: Optional[float] = None
 
     async def initialize(self):
 
         self.cleanup_task = asyncio.create_task(self._periodic_cleanup())
         return self
 
+    async def reset(self):
+
+        # Back to the state of a freshly initialized interface; logging is kept
+        await self.cleanup()
+        self._init_state()
+        return await self.initialize()
+
     async def cleanup(self):
 
         if hasattr(self, 'cleanup_task'):
@@ -49,41 +112,54 @@ class AgentInterface:
 
     def _setup_logging(self):
 
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            filename='agent_interface.log'
-        )
+        _start_log_listener()
+        self._log = logger
 
     async def _periodic_cleanup(self):
 
+        next_deadline = time.monotonic() + self.CLEANUP_INTERVAL
+
         while True:
             try:
-                await asyncio.sleep(self.CLEANUP_INTERVAL)
+                await asyncio.sleep(max(0.0, next_deadline - time.monotonic()))
                 await self._cleanup_inactive_connections()
                 self._cleanup_old_events()
+                self._last_cleanup_ts = time.monotonic()
             except Exception as e:
-                logging.error(f"Cleanup error: {str(e)}")
+                self._log.error(f"Cleanup error: {str(e)}")
+
+            # Skip missed cycles instead of running them back to back
+            next_deadline = max(next_deadline + self.CLEANUP_INTERVAL, time.monotonic())
+
+    def _lock_for(self, agent_id: str) -> asyncio.Lock:
+
+        return self._stripes[hash(agent_id) % self.LOCK_STRIPES]
 
     async def _cleanup_inactive_connections(self):
 
-        current_time = datetime.now()
-        with self._lock:
-            for agent_id, timestamp in list(self.connection_timestamps.items()):
-                if (current_time - timestamp).seconds > self.CONNECTION_TIMEOUT:
-                    await self._disconnect_agent(agent_id)
+        current_time = time.monotonic()
+        expired = []
+        for agent_id, timestamp in self.connection_timestamps.items():
+            if current_time - timestamp <= self.CONNECTION_TIMEOUT:
+                break
+            expired.append(agent_id)
+
+        await asyncio.gather(*(
+            self._disconnect_agent(agent_id, idle_since=current_time - self.CONNECTION_TIMEOUT)
+            for agent_id in expired
+        ))
 
     def _cleanup_old_events(self):
 
-        current_time = datetime.now()
-        with self._lock:
-            for agent_id in list(self.event_handlers.keys()):
-                if agent_id not in self.registered_agents:
-                    del self.event_handlers[agent_id]
+        dirty, self._dirty_event_agents = self._dirty_event_agents, set()
+        for agent_id in dirty:
+            if agent_id not in self.registered_agents:
+                self.event_handlers.pop(agent_id, None)
+                self.last_event_time.pop(agent_id, None)
 
     async def register_agent(self, agent_data: Dict) -> Dict:
 
-        with self._lock:
+        async with self._lock:
             try:
                 agent_id = agent_data.get('id')
                 if not agent_id:
@@ -98,7 +174,7 @@ class AgentInterface:
                 self.registered_agents[agent_id] = agent_data
                 self.agent_states[agent_id] = AgentState.INITIALIZING
 
-                logging.info(f"Agent registered: {agent_id}")
+                self._log.info(f"Agent registered: {agent_id}")
 
                 return {
                     'success': True,
@@ -107,30 +183,31 @@ class AgentInterface:
                 }
 
             except Exception as e:
-                logging.error(f"Agent registration error: {str(e)}")
+                self._log.error(f"Agent registration error: {str(e)}")
                 return {'success': False, 'reason': str(e)}
 
     async def connect_agent(self, agent_id: str) -> Dict:
 
-        with self._lock:
+        async with self._lock_for(agent_id):
             try:
                 if agent_id not in self.registered_agents:
                     return {'success': False, 'reason': 'Agent not registered'}
 
-                connection_obj = type('Connection', (), {'data': {}})()
+                connection_obj = AgentConnection(agent_id)
 
                 self.agent_states[agent_id] = AgentState.ACTIVE
-                self.connection_timestamps[agent_id] = datetime.now()
-                self.active_connections[agent_id] = weakref.ref(connection_obj)
+                self.connection_timestamps[agent_id] = time.monotonic()
+                self.connection_timestamps.move_to_end(agent_id)
+                self.active_connections[agent_id] = connection_obj
 
                 return {
                     'success': True,
-                    'connection': self.active_connections[agent_id],
-                    'session_id': f"session_{agent_id}_{datetime.now().timestamp()}"
+                    'connection': connection_obj,
+                    'session_id': f"{agent_id}:{uuid.uuid4().hex}"
                 }
 
             except Exception as e:
-                logging.error(f"Agent connection error: {str(e)}")
+                self._log.error(f"Agent connection error: {str(e)}")
                 return {'success': False, 'reason': str(e)}
 
     async def _establish_connection(self, agent_id: str) -> Dict:
@@ -142,11 +219,7 @@ class AgentInterface:
                 timeout=self.CONNECTION_TIMEOUT
             )
 
-            return {
-                'success': True,
-                'connection': weakref.ref({}),  
-                'session_id': f"session_{agent_id}_{datetime.now().timestamp()}"
-            }
+            return await self.connect_agent(agent_id)
 
         except asyncio.TimeoutError:
             return {'success': False, 'reason': 'Connection timeout'}
@@ -155,40 +228,61 @@ class AgentInterface:
 
     async def _connect_agent_internal(self, agent_id: str):
 
-        await asyncio.sleep(0.1) 
+        # Transport handshake goes here; no artificial delay on the connect path
+        return None
+
+    async def _disconnect_agent(self, agent_id: str, idle_since: Optional[float] = None):
 
-    async def _disconnect_agent(self, agent_id: str):
+        async with self._lock_for(agent_id):
+            # With idle_since, only disconnect if the agent has not reconnected since the expiry scan
+            if idle_since is not None:
+                timestamp = self.connection_timestamps.get(agent_id)
+                if timestamp is None or timestamp >= idle_since:
+                    return
 
-        with self._lock:
-            if agent_id in self.active_connections:
-                del self.active_connections[agent_id]
+            self.active_connections.pop(agent_id, None)
             if agent_id in self.connection_timestamps:
                 del self.connection_timestamps[agent_id]
             if agent_id in self.agent_states:
                 self.agent_states[agent_id] = AgentState.DISCONNECTED
 
+    async def deregister_agent(self, agent_id: str) -> Dict:
+
+        if agent_id not in self.registered_agents:
+            return {'success': False, 'reason': 'Agent not registered'}
+
+        await self._disconnect_agent(agent_id)
+
+        async with self._lock:
+            self.registered_agents.pop(agent_id, None)
+            self.agent_states.pop(agent_id, None)
+
+        self._dirty_event_agents.add(agent_id)
+        self._log.info(f"Agent deregistered: {agent_id}")
+
+        return {'success': True, 'agent_id': agent_id}
+
     def register_event_handler(self, agent_id: str, event_type: str, handler: callable) -> Dict:
 
-        with self._lock:
-            try:
-                if agent_id not in self.registered_agents:
-                    return {'success': False, 'reason': 'Agent not found'}
+        try:
+            if agent_id not in self.registered_agents:
+                return {'success': False, 'reason': 'Agent not found'}
 
-                if not callable(handler):
-                    return {'success': False, 'reason': 'Invalid handler'}
+            if not callable(handler):
+                return {'success': False, 'reason': 'Invalid handler'}
 
-                if agent_id not in self.event_handlers:
-                    self.event_handlers[agent_id] = {}
+            if agent_id not in self.event_handlers:
+                self.event_handlers[agent_id] = {}
 
-                self.event_handlers[agent_id][event_type] = handler
-                self.last_event_time[agent_id] = datetime.now()
+            self.event_handlers[agent_id][event_type] = handler
+            self.last_event_time[agent_id] = datetime.now()
 
-                return {
-                    'success': True,
-                    'agent_id': agent_id,
-                    'event_type': event_type
-                }
+            return {
+                'success': True,
+                'agent_id': agent_id,
+                'event_type': event_type
+            }
 
-            except Exception as e:
-                logging.error(f"Event handler registration error: {str(e)}")
-                return {'success': False, 'reason': str(e)}
+        except Exception as e:
+            self._log.error(f"Event handler registration error: {str(e)}")
+            return {'success': False, 'reason': str(e)}
@@ -5,9 +5,14 @@ from enum import Enum
 from dataclasses import dataclass
 import uuid
 from datetime import datetime
+from collections import deque
 import logging
 import asyncio
-import jsonfrom .metrics_collector import MetricsCollector
+import weakref
+from .metrics_collector import MetricsCollector
+from ..ai_agents.runtime import new_event_loop
+
+SESSION_BATCH_SIZE = 128
 
 class PlatformState(Enum):
     STARTING = "starting"
@@ -42,6 +47,11 @@ class VeraiPlatform:
 
         self.registered_agents: Dict[str, Dict] = {}
         self.active_sessions: Dict[str, Dict] = {}
+        # Round-robin order of session ids; stale ids are dropped when popped
+        self._session_wheel: deque = deque()
+        # Serializes check-and-insert for one agent id across awaits; a lock is dropped
+        # once no coroutine holds or waits on it
+        self._agent_locks: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
 
         self.metrics_collector = MetricsCollector()
         self.resource_manager = self._initialize_resource_manager()
@@ -80,17 +90,25 @@ class VeraiPlatform:
 
             agent_id = agent_data['id']
 
-            validation = await self._validate_agent(agent_data)
-            if not validation['valid']:
-                return {'success': False, 'reason': validation['reason']}
+            async with self._agent_lock(agent_id):
+                if agent_id in self.registered_agents:
+                    return {
+                        'success': True,
+                        'agent_id': agent_id,
+                        'registration': self.registered_agents[agent_id]
+                    }
 
-            self.registered_agents[agent_id] = {
-                'data': agent_data,
-                'registered_at': datetime.now(),
-                'status': 'registered'
-            }
+                validation = await self._validate_agent(agent_data)
+                if not validation['valid']:
+                    return {'success': False, 'reason': validation['reason']}
 
-            await self.metrics_collector.initialize_agent_metrics(agent_id)
+                self.registered_agents[agent_id] = {
+                    'data': agent_data,
+                    'registered_at': datetime.now(),
+                    'status': 'registered'
+                }
+
+                await self.metrics_collector.initialize_agent_metrics(agent_id)
 
             return {
                 'success': True,
@@ -110,26 +128,29 @@ class VeraiPlatform:
             if agent_id not in self.registered_agents:
                 return {'success': False, 'reason': 'Agent not registered'}
 
-            validation = await self._validate_session_request(
-                agent_id,
-                session_type,
-                session_config
-            )
-
-            if not validation['valid']:
-                return validation
-
-            session_id = str(uuid.uuid4())
-            session = {
-                'id': session_id,
-                'agent_id': agent_id,
-                'type': session_type,
-                'config': session_config,
-                'start_time': datetime.now(),
-                'state': 'initializing'
-            }
-
-            self.active_sessions[session_id] = session
+            # Per-agent session limits are checked and applied atomically
+            async with self._agent_lock(agent_id):
+                validation = await self._validate_session_request(
+                    agent_id,
+                    session_type,
+                    session_config
+                )
+
+                if not validation['valid']:
+                    return validation
+
+                session_id = str(uuid.uuid4())
+                session = {
+                    'id': session_id,
+                    'agent_id': agent_id,
+                    'type': session_type,
+                    'config': session_config,
+                    'start_time': datetime.now(),
+                    'state': 'initializing'
+                }
+
+                self.active_sessions[session_id] = session
+                self._session_wheel.appendleft(session_id)
 
             await self._initialize_session(session)
 
@@ -148,17 +169,41 @@ class VeraiPlatform:
             updates = {
                 'sessions': [],
                 'events': [],
+                'failed_events': [],
                 'metrics': {}
             }
 
-            for session_id, session in self.active_sessions.items():
-                session_update = await self._update_session(session)
+            sessions = self._next_session_batch()
+            session_updates = await asyncio.gather(
+                *(self._update_session(session) for session in sessions),
+                return_exceptions=True
+            )
+
+            for session, session_update in zip(sessions, session_updates):
+                if isinstance(session_update, Exception):
+                    session_update = {
+                        'success': False,
+                        'session_id': session['id'],
+                        'reason': str(session_update)
+                    }
                 updates['sessions'].append(session_update)
+                self._session_wheel.append(session['id'])
+
+            events = [self.event_queue.get_nowait() for _ in range(self.event_queue.qsize())]
+            # The queue is already drained, so one failing handler must not drop the other events
+            event_results = await asyncio.gather(
+                *(self._process_event(event) for event in events),
+                return_exceptions=True
+            )
 
-            while not self.event_queue.empty():
-                event = await self.event_queue.get()
-                await self._process_event(event)
-                updates['events'].append(event)
+            for event, event_result in zip(events, event_results):
+                if isinstance(event_result, Exception):
+                    updates['failed_events'].append({
+                        'event': event,
+                        'reason': str(event_result)
+                    })
+                else:
+                    updates['events'].append(event)
 
             updates['metrics'] = await self.metrics_collector.collect_metrics()
 
@@ -186,4 +231,46 @@ class VeraiPlatform:
             }
 
         except Exception as e:
-            return {'success': False, 'reason': str(e)}
\ No newline at end of file
+            return {'success': False, 'reason': str(e)}
+
+    def _next_session_batch(self) -> List[Dict]:
+
+        batch = []
+        while self._session_wheel and len(batch) < SESSION_BATCH_SIZE:
+            session = self.active_sessions.get(self._session_wheel.popleft())
+            if session is not None:
+                batch.append(session)
+
+        return batch
+
+    def _agent_lock(self, agent_id: str) -> asyncio.Lock:
+
+        lock = self._agent_locks.get(agent_id)
+        if lock is None:
+            lock = self._agent_locks[agent_id] = asyncio.Lock()
+        return lock
+
+async def _serve(platform: VeraiPlatform) -> Dict:
+
+    result = await platform.start()
+    if not result['success']:
+        return result
+
+    while platform.state == PlatformState.RUNNING:
+        await platform.update()
+        await asyncio.sleep(platform.config.update_interval)
+
+    return {'success': True, 'platform_id': platform.platform_id, 'state': platform.state}
+
+def run_platform(config: Optional[PlatformConfig] = None) -> Dict:
+
+    # Process entry point: the uvloop / winloop policy is installed once, right before the
+    # platform's loop is built, instead of as a side effect of importing this module
+    loop = new_event_loop()
+    asyncio.set_event_loop(loop)
+
+    try:
+        return loop.run_until_complete(_serve(VeraiPlatform(config)))
+    finally:
+        asyncio.set_event_loop(None)
+        loop.close()
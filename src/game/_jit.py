@@ -0,0 +1,21 @@
+# src/game/_jit.py
+
+# Optional numba support shared by the array kernels. Each kernel is written twice: a
+# *_loops version with explicit loops for numba, and a *_numpy twin that is used when numba is missing
+from typing import Callable
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+    prange = range
+
+HAVE_NUMBA = njit is not None
+
+def select_kernel(loops: Callable, numpy_version: Callable) -> Callable:
+
+    # The explicit loops only pay off compiled; without numba the NumPy version is faster
+    if njit is None:
+        return numpy_version
+
+    return njit(cache=True, fastmath=True, parallel=True)(loops)
@@ -0,0 +1,41 @@
+# src/game/_kernels.py
+
+# Small scalar functions on hot paths, kept free of dynamic features so mypyc can compile this module as-is
+from typing import Final, Tuple
+
+# Reputation tier lower bounds, ascending; the tier index is how many bounds a value has reached
+TIER_BOUNDS: Final = (15.0, 30.0, 45.0, 60.0, 75.0, 90.0)
+
+# impact = base + scaled * intensity, in WeatherEffect order; channels a weather leaves alone stay in base, unscaled
+IMPACT_BASE: Final = (
+    (1.0, 1.0, 1.0, 1.0, 0.0),  # CLEAR
+    (0.0, 0.0, 0.0, 1.0, 0.0),  # RAIN
+    (0.0, 0.0, 1.0, 0.0, 0.0),  # STORM
+    (1.0, 1.0, 0.0, 0.0, 0.0),  # MYSTIC_AURA
+    (1.0, 1.0, 1.0, 1.0, 0.0)   # CORRUPTED_MIST
+)
+IMPACT_SCALED: Final = (
+    (0.0, 0.0, 0.0, 0.0, 0.0),
+    (0.7, 0.8, 1.2, 0.0, 0.0),
+    (0.4, 0.6, 0.0, 1.3, -0.2),
+    (0.0, 0.0, 1.3, 1.5, 0.1),
+    (0.0, 0.0, 0.0, 0.0, 0.0)
+)
+
+def get_reputation_tier(value: float) -> int:
+
+    tier = 0
+    for bound in TIER_BOUNDS:
+        if value < bound:
+            break
+        tier += 1
+    return tier
+
+def weather_impact_row(effect_idx: int, intensity: float) -> Tuple[float, ...]:
+
+    base = IMPACT_BASE[effect_idx]
+    scaled = IMPACT_SCALED[effect_idx]
+    return tuple([b + s * intensity for b, s in zip(base, scaled)])
+
+def calc_trust_change(success: bool, impact: float) -> float:
+    return (0.05 if success else -0.05) * impact
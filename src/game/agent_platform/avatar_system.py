@@ -1,13 +1,15 @@
 # src/game/agent_platform/avatar_system.py
 
 from typing import Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 from PIL import Image
 import json
 from enum import Enum
 
 class AvatarFeature(Enum):
-    BODY = "body"    HEAD = "head"
+    BODY = "body"
+    HEAD = "head"
     EARS = "ears"
     EYES = "eyes"
     NOSE = "nose"
@@ -17,6 +19,52 @@ class AvatarFeature(Enum):
     ACCESSORIES = "accessories"
     SPECIAL_EFFECTS = "special_effects"
 
+VARIANT_WORKERS = 4
+
+# Drawn bottom to top in this order; special effects are overlays and go on the variants instead
+_BASE_FEATURES = tuple(feature for feature in AvatarFeature if feature is not AvatarFeature.SPECIAL_EFFECTS)
+
+# Shared by every AvatarSystem so instances do not each leave a thread pool behind
+_variant_executor: Optional[ThreadPoolExecutor] = None
+
+def _get_variant_executor() -> ThreadPoolExecutor:
+
+    global _variant_executor
+    if _variant_executor is None:
+        _variant_executor = ThreadPoolExecutor(max_workers=VARIANT_WORKERS, thread_name_prefix='avatar_variant')
+    return _variant_executor
+
+def _feature_layers(value) -> List[np.ndarray]:
+
+    if value is None:
+        return []
+    if isinstance(value, np.ndarray):
+        return [value]
+    return list(value)
+
+def _to_premultiplied(layer: np.ndarray) -> np.ndarray:
+
+    pixels = layer.astype(np.float32) * np.float32(1.0 / 255.0)
+    pixels[..., :3] *= pixels[..., 3:4]
+    return pixels
+
+def _from_premultiplied(pixels: np.ndarray) -> np.ndarray:
+
+    alpha = pixels[..., 3:4]
+    rgb = np.divide(pixels[..., :3], alpha, out=np.zeros_like(pixels[..., :3]), where=alpha > 0)
+    return np.rint(np.concatenate([rgb, alpha], axis=-1) * 255.0).astype(np.uint8)
+
+def _compose_layers(base: np.ndarray, layers: List[np.ndarray]) -> np.ndarray:
+
+    # Premultiplied "over": out = layer + out * (1 - layer_alpha)
+    composed = base.copy()
+    for layer in layers:
+        pixels = _to_premultiplied(layer)
+        composed *= 1.0 - pixels[..., 3:4]
+        composed += pixels
+
+    return composed
+
 class AvatarSystem:
 
     def __init__(self):
@@ -81,4 +129,29 @@ class AvatarSystem:
             }
 
         except Exception as e:
-            return {'success': False, 'reason': str(e)}
\ No newline at end of file
+            return {'success': False, 'reason': str(e)}
+
+    def _generate_variants(self, avatar: Dict) -> Dict[str, np.ndarray]:
+
+        # avatar[feature.value]: (H, W, 4) uint8 RGBA layer, or a list of them, per AvatarFeature.
+        # 'default' carries the special effects on top of the features, 'plain' leaves them off
+        layers = [layer for feature in _BASE_FEATURES for layer in _feature_layers(avatar.get(feature.value))]
+        if not layers:
+            return {}
+
+        base = _compose_layers(np.zeros(layers[0].shape, dtype=np.float32), layers)
+        effects = _feature_layers(avatar.get(AvatarFeature.SPECIAL_EFFECTS.value))
+
+        variant_overlays = {'default': effects, 'plain': []}
+
+        executor = _get_variant_executor()
+        futures = {
+            name: executor.submit(self._render_variant, base, overlays)
+            for name, overlays in variant_overlays.items()
+        }
+
+        return {name: future.result() for name, future in futures.items()}
+
+    def _render_variant(self, base: np.ndarray, overlays: List[np.ndarray]) -> np.ndarray:
+
+        return _from_premultiplied(_compose_layers(base, overlays))
@@ -4,10 +4,13 @@ from typing import Dict, List, Optional, Tuple
 import numpy as np
 from enum import Enum
 import json
+from types import MappingProxyType
+from functools import lru_cache
 
 class PersonalityTrait(Enum):
     AGGRESSION = "aggression"
-    COURAGE = "courage"    WISDOM = "wisdom"
+    COURAGE = "courage"
+    WISDOM = "wisdom"
     CHARISMA = "charisma"
     LOYALTY = "loyalty"
     CREATIVITY = "creativity"
@@ -22,6 +25,235 @@ class SuperPower(Enum):
     TIME_CONTROL = "time_control"
     SHAPE_SHIFTING = "shape_shifting"
 
+def _freeze(definitions: Dict) -> MappingProxyType:
+
+    return MappingProxyType({key: MappingProxyType(value) for key, value in definitions.items()})
+
+TRAIT_DEFINITIONS = _freeze({
+    PersonalityTrait.AGGRESSION: {
+        'min': 0.0,
+        'max': 1.0,
+        'default': 0.5,
+        'description': 'Tendency towards aggressive behavior'
+    },
+    PersonalityTrait.COURAGE: {
+        'min': 0.0,
+        'max': 1.0,
+        'default': 0.6,
+        'description': 'Bravery and willingness to face danger'
+    },
+    PersonalityTrait.WISDOM: {
+        'min': 0.0,
+        'max': 1.0,
+        'default': 0.5,
+        'description': 'Decision making and knowledge application'
+    },
+    PersonalityTrait.CHARISMA: {
+        'min': 0.0,
+        'max': 1.0,
+        'default': 0.5,
+        'description': 'Social influence and leadership'
+    },
+    PersonalityTrait.LOYALTY: {
+        'min': 0.0,
+        'max': 1.0,
+        'default': 0.7,
+        'description': 'Faithfulness to allies and causes'
+    },
+    PersonalityTrait.CREATIVITY: {
+        'min': 0.0,
+        'max': 1.0,
+        'default': 0.5,
+        'description': 'Ability to think outside the box'
+    },
+    PersonalityTrait.DISCIPLINE: {
+        'min': 0.0,
+        'max': 1.0,
+        'default': 0.5,
+        'description': 'Self-control and organization'
+    },
+    PersonalityTrait.EMPATHY: {
+        'min': 0.0,
+        'max': 1.0,
+        'default': 0.5,
+        'description': 'Understanding and sharing feelings'
+    }
+})
+
+POWER_DEFINITIONS = _freeze({
+    SuperPower.TELEKINESIS: {
+        'energy_cost': 10,
+        'cooldown': 5,
+        'range': 20,
+        'description': 'Move objects with mind power',
+        'effectiveness': 0.75
+    },
+    SuperPower.SUPER_SPEED: {
+        'energy_cost': 15,
+        'cooldown': 3,
+        'range': 50,
+        'description': 'Move at superhuman speeds',
+        'effectiveness': 0.8
+    },
+    SuperPower.ENERGY_BLAST: {
+        'energy_cost': 25,
+        'cooldown': 8,
+        'range': 30,
+        'description': 'Release powerful energy blasts',
+        'effectiveness': 0.9
+    },
+    SuperPower.HEALING: {
+        'energy_cost': 20,
+        'cooldown': 10,
+        'range': 5,
+        'description': 'Heal self or allies',
+        'effectiveness': 0.85
+    },
+    SuperPower.TIME_CONTROL: {
+        'energy_cost': 50,
+        'cooldown': 30,
+        'range': 15,
+        'description': 'Manipulate the flow of time',
+        'effectiveness': 1.0
+    },
+    SuperPower.SHAPE_SHIFTING: {
+        'energy_cost': 30,
+        'cooldown': 15,
+        'range': 0,
+        'description': 'Transform into different forms',
+        'effectiveness': 0.7
+    }
+})
+
+PERSONALITY_TEMPLATES = _freeze({
+    'hero': {
+        PersonalityTrait.COURAGE: 0.8,
+        PersonalityTrait.WISDOM: 0.7,
+        PersonalityTrait.LOYALTY: 0.9,
+        PersonalityTrait.CHARISMA: 0.6,
+        PersonalityTrait.AGGRESSION: 0.4,
+        PersonalityTrait.CREATIVITY: 0.6,
+        PersonalityTrait.DISCIPLINE: 0.7,
+        PersonalityTrait.EMPATHY: 0.8
+    },
+    'antihero': {
+        PersonalityTrait.COURAGE: 0.7,
+        PersonalityTrait.WISDOM: 0.6,
+        PersonalityTrait.LOYALTY: 0.5,
+        PersonalityTrait.CHARISMA: 0.7,
+        PersonalityTrait.AGGRESSION: 0.6,
+        PersonalityTrait.CREATIVITY: 0.8,
+        PersonalityTrait.DISCIPLINE: 0.5,
+        PersonalityTrait.EMPATHY: 0.4
+    },
+    'mentor': {
+        PersonalityTrait.COURAGE: 0.6,
+        PersonalityTrait.WISDOM: 0.9,
+        PersonalityTrait.LOYALTY: 0.8,
+        PersonalityTrait.CHARISMA: 0.7,
+        PersonalityTrait.AGGRESSION: 0.3,
+        PersonalityTrait.CREATIVITY: 0.7,
+        PersonalityTrait.DISCIPLINE: 0.8,
+        PersonalityTrait.EMPATHY: 0.9
+    }
+})
+
+TRAIT_ORDER: List[PersonalityTrait] = list(PersonalityTrait)
+TRAIT_INDEX: Dict[PersonalityTrait, int] = {trait: i for i, trait in enumerate(TRAIT_ORDER)}
+TRAIT_FALLBACK = 0.5
+
+POWER_ORDER: List[SuperPower] = list(SuperPower)
+POWER_INDEX: Dict[SuperPower, int] = {power: i for i, power in enumerate(POWER_ORDER)}
+
+POWER_DTYPE = np.dtype([
+    ('energy_cost', np.int32),
+    ('cooldown', np.int32),
+    ('range', np.int32),
+    ('effectiveness', np.float64)
+])
+
+# One record per power, rows follow POWER_ORDER
+POWER_TABLE = np.array(
+    [tuple(POWER_DEFINITIONS[power][field] for field in POWER_DTYPE.names) for power in POWER_ORDER],
+    dtype=POWER_DTYPE
+)
+POWER_EFFECTIVENESS = POWER_TABLE['effectiveness']
+
+INFLUENCE_CATEGORIES = ('combat', 'social', 'mobility', 'utility')
+
+POWER_CATEGORIES: Dict[SuperPower, Tuple[str, float]] = {
+    SuperPower.TELEKINESIS: ('combat', 0.8),
+    SuperPower.SUPER_SPEED: ('mobility', 0.9),
+    SuperPower.ENERGY_BLAST: ('combat', 0.8),
+    SuperPower.HEALING: ('utility', 0.7),
+    SuperPower.TIME_CONTROL: ('utility', 0.7),
+    SuperPower.SHAPE_SHIFTING: ('social', 0.6)
+}
+
+# Rows follow POWER_ORDER, columns INFLUENCE_CATEGORIES
+POWER_INFLUENCE_WEIGHTS = np.zeros((len(POWER_ORDER), len(INFLUENCE_CATEGORIES)))
+for _power, (_category, _weight) in POWER_CATEGORIES.items():
+    POWER_INFLUENCE_WEIGHTS[POWER_INDEX[_power], INFLUENCE_CATEGORIES.index(_category)] = _weight
+
+# Trait that shifts a power's effectiveness around its 0.5 midpoint
+POWER_TRAIT_COUPLING: Dict[SuperPower, PersonalityTrait] = {
+    SuperPower.TELEKINESIS: PersonalityTrait.DISCIPLINE,
+    SuperPower.ENERGY_BLAST: PersonalityTrait.AGGRESSION,
+    SuperPower.HEALING: PersonalityTrait.EMPATHY,
+    SuperPower.TIME_CONTROL: PersonalityTrait.WISDOM
+}
+
+# Column of the coupled trait per power, -1 when uncoupled
+POWER_TRAIT_COLUMNS = np.array(
+    [TRAIT_INDEX[POWER_TRAIT_COUPLING[power]] if power in POWER_TRAIT_COUPLING else -1
+     for power in POWER_ORDER]
+)
+
+TENDENCY_NAMES = ('aggressive', 'cautious', 'social', 'loyal', 'creative',
+                  'disciplined', 'empathetic', 'risk_taking', 'leadership')
+
+# tendencies = TENDENCY_WEIGHTS @ trait_vector + TENDENCY_BIAS, columns follow TRAIT_ORDER
+TENDENCY_WEIGHTS = np.array([
+    [1.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0],
+    [0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 0.0, 0.0],
+    [0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 0.0],
+    [0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0],
+    [0.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0],
+    [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0],
+    [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 1.0],
+    [0.7, 0.0, -0.3, 0.0, 0.0, 0.0, 0.0, 0.0],
+    [0.0, 0.0, 0.0, 0.6, 0.0, 0.0, 0.4, 0.0]
+])
+TENDENCY_BIAS = np.array([0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.3, 0.0])
+
+PATTERN_NAMES = ('combat', 'exploration', 'social', 'trading', 'learning')
+
+# patterns = PATTERN_WEIGHTS @ [trait_vector, risk_taking, social] + PATTERN_BIAS
+PATTERN_WEIGHTS = np.array([
+    [0.4, 0.3, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.3, 0.0],
+    [0.0, 0.3, 0.0, 0.0, 0.0, 0.4, -0.3, 0.0, 0.0, 0.0],
+    [0.0, 0.0, 0.0, 0.4, 0.0, 0.0, 0.0, 0.3, 0.0, 0.3],
+    [-0.3, 0.0, 0.4, 0.3, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0],
+    [0.0, 0.0, 0.4, 0.0, 0.0, 0.3, 0.3, 0.0, 0.0, 0.0]
+])
+PATTERN_BIAS = np.array([0.0, 0.3, 0.0, 0.3, 0.0])
+
+PERSONALITY_CACHE_SIZE = 1024
+
+def _copy_personality_result(result: Dict) -> Dict:
+
+    # Cached results are shared; hand every caller its own nested dicts
+    if not result['success']:
+        return dict(result)
+
+    personality = result['personality']
+    return {
+        'success': True,
+        'personality': {key: dict(value) for key, value in personality.items()},
+        'behavior_patterns': dict(result['behavior_patterns']),
+        'power_config': {power: dict(config) for power, config in result['power_config'].items()}
+    }
+
 class PersonalityEngine:
 
     def __init__(self):
@@ -30,267 +262,96 @@ class PersonalityEngine:
         self.power_definitions = self._load_power_definitions()
         self.personality_templates = self._load_personality_templates()
 
+        # Templates reuse the same trait/power combinations constantly
+        self._build_personality_cached = lru_cache(maxsize=PERSONALITY_CACHE_SIZE)(self._build_personality)
+
+    def _trait_vector(self, traits) -> np.ndarray:
+
+        if isinstance(traits, np.ndarray):
+            return traits
+
+        vector = np.full(len(TRAIT_ORDER), TRAIT_FALLBACK)
+        for trait, value in traits.items():
+            index = TRAIT_INDEX.get(trait)
+            if index is not None:
+                vector[index] = value
+
+        return vector
+
     def _load_trait_definitions(self) -> Dict:
 
-        return {
-            PersonalityTrait.AGGRESSION: {
-                'min': 0.0,
-                'max': 1.0,
-                'default': 0.5,
-                'description': 'Tendency towards aggressive behavior'
-            },
-            PersonalityTrait.COURAGE: {
-                'min': 0.0,
-                'max': 1.0,
-                'default': 0.6,
-                'description': 'Bravery and willingness to face danger'
-            },
-            PersonalityTrait.WISDOM: {
-                'min': 0.0,
-                'max': 1.0,
-                'default': 0.5,
-                'description': 'Decision making and knowledge application'
-            },
-            PersonalityTrait.CHARISMA: {
-                'min': 0.0,
-                'max': 1.0,
-                'default': 0.5,
-                'description': 'Social influence and leadership'
-            },
-            PersonalityTrait.LOYALTY: {
-                'min': 0.0,
-                'max': 1.0,
-                'default': 0.7,
-                'description': 'Faithfulness to allies and causes'
-            },
-            PersonalityTrait.CREATIVITY: {
-                'min': 0.0,
-                'max': 1.0,
-                'default': 0.5,
-                'description': 'Ability to think outside the box'
-            },
-            PersonalityTrait.DISCIPLINE: {
-                'min': 0.0,
-                'max': 1.0,
-                'default': 0.5,
-                'description': 'Self-control and organization'
-            },
-            PersonalityTrait.EMPATHY: {
-                'min': 0.0,
-                'max': 1.0,
-                'default': 0.5,
-                'description': 'Understanding and sharing feelings'
-            }
-        }
+        return TRAIT_DEFINITIONS
 
     def _load_power_definitions(self) -> Dict:
 
-        return {
-            SuperPower.TELEKINESIS: {
-                'energy_cost': 10,
-                'cooldown': 5,
-                'range': 20,
-                'description': 'Move objects with mind power',
-                'effectiveness': 0.75
-            },
-            SuperPower.SUPER_SPEED: {
-                'energy_cost': 15,
-                'cooldown': 3,
-                'range': 50,
-                'description': 'Move at superhuman speeds',
-                'effectiveness': 0.8
-            },
-            SuperPower.ENERGY_BLAST: {
-                'energy_cost': 25,
-                'cooldown': 8,
-                'range': 30,
-                'description': 'Release powerful energy blasts',
-                'effectiveness': 0.9
-            },
-            SuperPower.HEALING: {
-                'energy_cost': 20,
-                'cooldown': 10,
-                'range': 5,
-                'description': 'Heal self or allies',
-                'effectiveness': 0.85
-            },
-            SuperPower.TIME_CONTROL: {
-                'energy_cost': 50,
-                'cooldown': 30,
-                'range': 15,
-                'description': 'Manipulate the flow of time',
-                'effectiveness': 1.0
-            },
-            SuperPower.SHAPE_SHIFTING: {
-                'energy_cost': 30,
-                'cooldown': 15,
-                'range': 0,
-                'description': 'Transform into different forms',
-                'effectiveness': 0.7
-            }
-        }
+        return POWER_DEFINITIONS
 
     def _load_personality_templates(self) -> Dict:
 
-        return {
-            'hero': {
-                PersonalityTrait.COURAGE: 0.8,
-                PersonalityTrait.WISDOM: 0.7,
-                PersonalityTrait.LOYALTY: 0.9,
-                PersonalityTrait.CHARISMA: 0.6,
-                PersonalityTrait.AGGRESSION: 0.4,
-                PersonalityTrait.CREATIVITY: 0.6,
-                PersonalityTrait.DISCIPLINE: 0.7,
-                PersonalityTrait.EMPATHY: 0.8
-            },
-            'antihero': {
-                PersonalityTrait.COURAGE: 0.7,
-                PersonalityTrait.WISDOM: 0.6,
-                PersonalityTrait.LOYALTY: 0.5,
-                PersonalityTrait.CHARISMA: 0.7,
-                PersonalityTrait.AGGRESSION: 0.6,
-                PersonalityTrait.CREATIVITY: 0.8,
-                PersonalityTrait.DISCIPLINE: 0.5,
-                PersonalityTrait.EMPATHY: 0.4
-            },
-            'mentor': {
-                PersonalityTrait.COURAGE: 0.6,
-                PersonalityTrait.WISDOM: 0.9,
-                PersonalityTrait.LOYALTY: 0.8,
-                PersonalityTrait.CHARISMA: 0.7,
-                PersonalityTrait.AGGRESSION: 0.3,
-                PersonalityTrait.CREATIVITY: 0.7,
-                PersonalityTrait.DISCIPLINE: 0.8,
-                PersonalityTrait.EMPATHY: 0.9
-            }
-        }
+        return PERSONALITY_TEMPLATES
 
     def _configure_powers(self, powers: List[SuperPower], personality: Dict) -> Dict:
 
-        power_config = {}
-        for power in powers:
-            if power in self.power_definitions:
-                base_power = self.power_definitions[power].copy()
+        selected = list(dict.fromkeys(power for power in powers if power in POWER_INDEX))
+        if not selected:
+            return {}
 
-                effectiveness_mod = self._calculate_power_effectiveness(power, personality)
-                base_power['effectiveness'] *= effectiveness_mod
+        rows = POWER_TABLE[[POWER_INDEX[power] for power in selected]]
+        trait_vector = self._trait_vector(personality.get('core_traits', {}))
 
-                energy_mod = self._calculate_energy_modifier(power, personality)
-                base_power['energy_cost'] = max(1, int(base_power['energy_cost'] * energy_mod))
+        columns = POWER_TRAIT_COLUMNS[[POWER_INDEX[power] for power in selected]]
+        effectiveness_mod = np.where(columns >= 0, trait_vector[columns] - 0.5, 0.0) + 1.0
+        np.clip(effectiveness_mod, 0.5, 1.5, out=effectiveness_mod)
 
-                power_config[power] = base_power
+        effectiveness = rows['effectiveness'] * effectiveness_mod
+        energy_mod = self._calculate_energy_modifier(personality)
+        energy_cost = np.maximum(1, (rows['energy_cost'] * energy_mod).astype(np.int64))
 
-        return power_config
+        return {
+            power: {
+                'energy_cost': int(energy_cost[i]),
+                'cooldown': int(rows['cooldown'][i]),
+                'range': int(rows['range'][i]),
+                'description': POWER_DEFINITIONS[power]['description'],
+                'effectiveness': float(effectiveness[i])
+            }
+            for i, power in enumerate(selected)
+        }
 
     def _calculate_power_influence(self, powers: List[SuperPower]) -> Dict[str, float]:
 
-        influence = {
-            'combat': 0.0,
-            'social': 0.0,
-            'mobility': 0.0,
-            'utility': 0.0
-        }
-
-        for power in powers:
-            if power in self.power_definitions:
-                power_data = self.power_definitions[power]
+        indices = [POWER_INDEX[power] for power in powers if power in POWER_INDEX]
+        counts = np.bincount(indices, minlength=len(POWER_ORDER))
 
-                if power in [SuperPower.ENERGY_BLAST, SuperPower.TELEKINESIS]:
-                    influence['combat'] += power_data['effectiveness'] * 0.8
-                elif power in [SuperPower.HEALING, SuperPower.TIME_CONTROL]:
-                    influence['utility'] += power_data['effectiveness'] * 0.7
-                elif power in [SuperPower.SUPER_SPEED]:
-                    influence['mobility'] += power_data['effectiveness'] * 0.9
-                elif power in [SuperPower.SHAPE_SHIFTING]:
-                    influence['social'] += power_data['effectiveness'] * 0.6
+        influence = (counts * POWER_EFFECTIVENESS) @ POWER_INFLUENCE_WEIGHTS
 
-        max_value = max(influence.values())
+        max_value = influence.max()
         if max_value > 0:
-            influence = {k: v/max_value for k, v in influence.items()}
+            influence /= max_value
 
-        return influence
+        return dict(zip(INFLUENCE_CATEGORIES, influence.tolist()))
 
     def _analyze_behavior_tendencies(self, traits: Dict[PersonalityTrait, float]) -> Dict[str, float]:
 
-        tendencies = {
-            'aggressive': traits.get(PersonalityTrait.AGGRESSION, 0.5),
-            'cautious': traits.get(PersonalityTrait.WISDOM, 0.5),
-            'social': traits.get(PersonalityTrait.CHARISMA, 0.5),
-            'loyal': traits.get(PersonalityTrait.LOYALTY, 0.5),
-            'creative': traits.get(PersonalityTrait.CREATIVITY, 0.5),
-            'disciplined': traits.get(PersonalityTrait.DISCIPLINE, 0.5),
-            'empathetic': traits.get(PersonalityTrait.EMPATHY, 0.5)
-        }
-
-        tendencies['risk_taking'] = (tendencies['aggressive'] * 0.7 + 
-                                   (1 - tendencies['cautious']) * 0.3)
-        tendencies['leadership'] = (tendencies['social'] * 0.6 + 
-                                  tendencies['disciplined'] * 0.4)
+        tendencies = TENDENCY_WEIGHTS @ self._trait_vector(traits) + TENDENCY_BIAS
 
-        return tendencies
+        return dict(zip(TENDENCY_NAMES, tendencies.tolist()))
 
     def _configure_behavior_patterns(self, personality: Dict) -> Dict[str, float]:
 
         core_traits = personality.get('core_traits', {})
         tendencies = personality.get('behavior_tendencies', {})
 
-        patterns = {
-            'combat': self._calculate_combat_tendency(core_traits, tendencies),
-            'exploration': self._calculate_exploration_tendency(core_traits, tendencies),
-            'social': self._calculate_social_tendency(core_traits, tendencies),
-            'trading': self._calculate_trading_tendency(core_traits, tendencies),
-            'learning': self._calculate_learning_tendency(core_traits, tendencies)
-        }
-
-        return patterns
-
-    def _calculate_combat_tendency(self, traits: Dict, tendencies: Dict) -> float:
+        features = np.empty(len(TRAIT_ORDER) + 2)
+        features[:len(TRAIT_ORDER)] = self._trait_vector(core_traits)
+        features[-2] = tendencies.get('risk_taking', TRAIT_FALLBACK)
+        features[-1] = tendencies.get('social', TRAIT_FALLBACK)
 
-        return (traits.get(PersonalityTrait.AGGRESSION, 0.5) * 0.4 +
-                traits.get(PersonalityTrait.COURAGE, 0.5) * 0.3 +
-                tendencies.get('risk_taking', 0.5) * 0.3)
+        patterns = PATTERN_WEIGHTS @ features + PATTERN_BIAS
 
-    def _calculate_exploration_tendency(self, traits: Dict, tendencies: Dict) -> float:
+        return dict(zip(PATTERN_NAMES, patterns.tolist()))
 
-        return (traits.get(PersonalityTrait.CREATIVITY, 0.5) * 0.4 +
-                traits.get(PersonalityTrait.COURAGE, 0.5) * 0.3 +
-                (1 - traits.get(PersonalityTrait.DISCIPLINE, 0.5)) * 0.3)
-
-    def _calculate_social_tendency(self, traits: Dict, tendencies: Dict) -> float:
-
-        return (traits.get(PersonalityTrait.CHARISMA, 0.5) * 0.4 +
-                traits.get(PersonalityTrait.EMPATHY, 0.5) * 0.3 +
-                tendencies.get('social', 0.5) * 0.3)
-
-    def _calculate_trading_tendency(self, traits: Dict, tendencies: Dict) -> float:
-
-        return (traits.get(PersonalityTrait.WISDOM, 0.5) * 0.4 +
-                traits.get(PersonalityTrait.CHARISMA, 0.5) * 0.3 +
-                (1 - traits.get(PersonalityTrait.AGGRESSION, 0.5)) * 0.3)
-
-    def _calculate_learning_tendency(self, traits: Dict, tendencies: Dict) -> float:
-
-        return (traits.get(PersonalityTrait.WISDOM, 0.5) * 0.4 +
-                traits.get(PersonalityTrait.DISCIPLINE, 0.5) * 0.3 +
-                traits.get(PersonalityTrait.CREATIVITY, 0.5) * 0.3)
-
-    def _calculate_power_effectiveness(self, power: SuperPower, personality: Dict) -> float:
-
-        core_traits = personality.get('core_traits', {})
-        base_effectiveness = 1.0
-
-        if power == SuperPower.TELEKINESIS:
-            base_effectiveness += (core_traits.get(PersonalityTrait.DISCIPLINE, 0.5) - 0.5)
-        elif power == SuperPower.ENERGY_BLAST:
-            base_effectiveness += (core_traits.get(PersonalityTrait.AGGRESSION, 0.5) - 0.5)
-        elif power == SuperPower.HEALING:
-            base_effectiveness += (core_traits.get(PersonalityTrait.EMPATHY, 0.5) - 0.5)
-        elif power == SuperPower.TIME_CONTROL:
-            base_effectiveness += (core_traits.get(PersonalityTrait.WISDOM, 0.5) - 0.5)
-
-        return max(0.5, min(1.5, base_effectiveness))
-
-    def _calculate_energy_modifier(self, power: SuperPower, personality: Dict) -> float:
+    def _calculate_energy_modifier(self, personality: Dict) -> float:
 
         core_traits = personality.get('core_traits', {})
         base_modifier = 1.0
@@ -310,28 +371,41 @@ class PersonalityEngine:
 
         try:
 
-            if not self._validate_traits(base_traits):
-                return {'success': False, 'reason': 'Invalid trait values'}
+            result = self._build_personality_cached(
+                frozenset(base_traits.items()),
+                tuple(special_powers)
+            )
 
-            personality = {
-                'core_traits': base_traits,
-                'power_influence': self._calculate_power_influence(special_powers),
-                'behavior_tendencies': self._analyze_behavior_tendencies(base_traits)
-            }
+            return _copy_personality_result(result)
 
-            behavior_patterns = self._configure_behavior_patterns(personality)
+        except Exception as e:
+            return {'success': False, 'reason': str(e)}
 
-            power_config = self._configure_powers(special_powers, personality)
+    def _build_personality(self,
+                           frozen_traits: frozenset,
+                           special_powers: Tuple[SuperPower, ...]) -> Dict:
 
-            return {
-                'success': True,
-                'personality': personality,
-                'behavior_patterns': behavior_patterns,
-                'power_config': power_config
-            }
+        base_traits = dict(frozen_traits)
 
-        except Exception as e:
-            return {'success': False, 'reason': str(e)}
+        if not self._validate_traits(base_traits):
+            return {'success': False, 'reason': 'Invalid trait values'}
+
+        personality = {
+            'core_traits': base_traits,
+            'power_influence': self._calculate_power_influence(special_powers),
+            'behavior_tendencies': self._analyze_behavior_tendencies(base_traits)
+        }
+
+        behavior_patterns = self._configure_behavior_patterns(personality)
+
+        power_config = self._configure_powers(special_powers, personality)
+
+        return {
+            'success': True,
+            'personality': personality,
+            'behavior_patterns': behavior_patterns,
+            'power_config': power_config
+        }
 
     def _validate_traits(self, traits: Dict[PersonalityTrait, float]) -> bool:
 
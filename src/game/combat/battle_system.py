@@ -1,13 +1,15 @@
 # src/game/combat/battle_system.py
 
 from typing import Dict, List, Optional, Tuple
-from enum import Enum
-from dataclasses import dataclass
-import uuid
-from datetime import datetime
+from enum import Enum, IntEnum
+from types import MappingProxyType
 import logging
 import random
+import numpy as np
+from ..ids import next_uuid, monotonic_stamp
 from .skills import SkillSystem, SkillType, SkillEffect
+from .participants import ParticipantTable, BattleRoster, BattleParticipant
+from .results import ResultPool
 class BattleState(Enum):
     PREPARING = "preparing"
     IN_PROGRESS = "in_progress"
@@ -22,16 +24,23 @@ class BattleType(Enum):
     BOSS = "boss"               
     TOURNAMENT = "tournament"    
 
-@dataclass
-class BattleParticipant:
-    id: str
-    team_id: str
-    position: Tuple[float, float, float]
-    health: float
-    energy: float
-    status_effects: List[Dict]
-    active_skills: List[str]
-    cooldowns: Dict[str, float]
+class ActionKind(IntEnum):
+    LIGHT = 0
+    HEAVY = 1
+    SPECIAL = 2
+    SKILL = 3
+    MOVE = 4
+
+# Action names arrive as strings from callers; everything past process_action uses ActionKind
+_ACTION_MAP: Dict[str, ActionKind] = {kind.name.lower(): kind for kind in ActionKind}
+
+# Shared result for actions that land nothing; read-only so it can't leak state between calls
+_EMPTY_RESULT = MappingProxyType({
+    'effects': (),
+    'damage_dealt': MappingProxyType({}),
+    'status_effects': (),
+    'position_changes': ()
+})
 
 class BattleSystem:
 
@@ -41,6 +50,13 @@ class BattleSystem:
         self.skill_system = SkillSystem()
         self.battle_queue: List[Dict] = []
 
+        # Every battle's participants live in one table, tagged by battle slot
+        self._participants = ParticipantTable()
+        self._battle_slots: List[Optional[str]] = []
+        self._free_battle_slots: List[int] = []
+
+        self._results = ResultPool()
+
         self.metrics: Dict[str, float] = {}
 
     def create_battle(self,
@@ -49,7 +65,7 @@ class BattleSystem:
                      settings: Dict) -> Dict:
 
         try:
-            battle_id = str(uuid.uuid4())
+            battle_id = next_uuid()
 
             validation = self._validate_battle_setup(
                 battle_type,
@@ -60,12 +76,15 @@ class BattleSystem:
             if not validation['valid']:
                 return {'success': False, 'reason': validation['reason']}
 
+            slot = self._claim_battle_slot(battle_id)
+
             battle = {
                 'id': battle_id,
+                'slot': slot,
                 'type': battle_type,
                 'state': BattleState.PREPARING,
-                'start_time': datetime.now(),
-                'participants': {},
+                'start_time': monotonic_stamp(),
+                'participants': BattleRoster(self._participants, slot),
                 'teams': {},
                 'rounds': [],
                 'current_round': 0,
@@ -88,29 +107,35 @@ class BattleSystem:
         except Exception as e:
             return {'success': False, 'reason': str(e)}
 
-    def update(self, delta_time: float) -> Dict:
+    def update(self, delta_time: float, out_events: Optional[List[Dict]] = None) -> Dict:
 
         updates = {
             'completed_battles': [],
             'battle_updates': [],
-            'events': []
+            'events': out_events if out_events is not None else []
         }
 
-        try:
-            for battle_id, battle in self.active_battles.items():
-                if battle['state'] == BattleState.IN_PROGRESS:
+        in_progress = [
+            battle for battle in self.active_battles.values()
+            if battle['state'] == BattleState.IN_PROGRESS
+        ]
 
-                    battle_update = self._update_battle(battle, delta_time)
-                    updates['battle_updates'].append(battle_update)
+        battle_updates = self._tick_battles(in_progress, delta_time)
+        teams_alive = self._participants.teams_alive(len(self._battle_slots))
 
-                    if self._check_battle_end(battle):
-                        self._end_battle(battle)
-                        updates['completed_battles'].append(battle_id)
+        for battle in in_progress:
+            battle_update = battle_updates[battle['slot']]
+            battle_update['state_changes'].extend(
+                self._update_environment(battle, delta_time)
+            )
+            updates['battle_updates'].append(battle_update)
 
-            return {'success': True, 'updates': updates}
+            if teams_alive[battle['slot']] <= 1 or self._check_battle_end(battle):
+                self._end_battle(battle)
+                self._release_battle_slot(battle)
+                updates['completed_battles'].append(battle['id'])
 
-        except Exception as e:
-            return {'success': False, 'reason': str(e)}
+        return {'success': True, 'updates': updates}
 
     def process_action(self,
                       battle_id: str,
@@ -119,82 +144,106 @@ class BattleSystem:
                       targets: List[str],
                       action_data: Dict) -> Dict:
 
-        try:
-            battle = self.active_battles.get(battle_id)
-            if not battle:
-                return {'success': False, 'reason': 'Battle not found'}
+        battle = self.active_battles.get(battle_id)
+        if not battle:
+            return {'success': False, 'reason': 'Battle not found'}
 
-            validation = self._validate_action(
-                battle,
-                actor_id,
-                action_type,
-                targets,
-                action_data
-            )
+        action_kind = _ACTION_MAP.get(action_type)
+        if action_kind is None:
+            return {'success': False, 'reason': f'Unknown action type: {action_type}'}
 
-            if not validation['valid']:
-                return {'success': False, 'reason': validation['reason']}
+        validation = self._validate_action(
+            battle,
+            actor_id,
+            action_kind,
+            targets,
+            action_data
+        )
 
-            result = self._execute_action(
-                battle,
-                actor_id,
-                action_type,
-                targets,
-                action_data
-            )
+        if not validation['valid']:
+            return {'success': False, 'reason': validation['reason']}
 
-            self._update_battle_state(battle, result)
+        result = self._execute_action(
+            battle,
+            actor_id,
+            action_kind,
+            targets,
+            action_data
+        )
 
-            return {
-                'success': True,
-                'result': result,
-                'battle_state': battle['state']
-            }
+        self._update_battle_state(battle, result)
 
-        except Exception as e:
-            return {'success': False, 'reason': str(e)}
+        return {
+            'success': True,
+            'result': result,
+            'battle_state': battle['state']
+        }
 
-    def _update_battle(self, battle: Dict, delta_time: float) -> Dict:
+    def release_updates(self, updates: Dict):
 
-        updates = {
-            'battle_id': battle['id'],
-            'state_changes': [],
-            'effects_processed': []
-        }
+        # Hands the per-battle dicts from update() back once the caller has consumed them
+        for battle_update in updates['battle_updates']:
+            self._results.push(battle_update)
+
+    def _tick_battles(self, battles: List[Dict], delta_time: float) -> Dict[int, Dict]:
 
-        self._update_cooldowns(battle, delta_time)
+        # Ticks every running battle in one pass over the shared table, keyed by slot
+        updates = {}
+        for battle in battles:
+            update = self._results.pop()
+            update['battle_id'] = battle['id']
+            update['state_changes'] = []
+            update['effects_processed'] = []
+            updates[battle['slot']] = update
 
-        status_updates = self._process_status_effects(battle, delta_time)
-        updates['effects_processed'].extend(status_updates)
+        # Trailing False covers released rows, whose battle_idx is -1
+        battle_active = np.zeros(len(self._battle_slots) + 1, dtype=bool)
+        battle_active[list(updates)] = True
 
-        position_updates = self._update_positions(battle, delta_time)
-        updates['state_changes'].extend(position_updates)
+        table = self._participants
+        moved, expired = table.tick(delta_time, battle_active)
 
-        environment_updates = self._update_environment(battle, delta_time)
-        updates['state_changes'].extend(environment_updates)
+        for row in moved:
+            updates[table.battle_idx[row]]['state_changes'].append({
+                'participant_id': table.ids[row],
+                'position': tuple(table.positions[row].tolist())
+            })
+
+        for row, kind in expired:
+            updates[table.battle_idx[row]]['effects_processed'].append({
+                'participant_id': table.ids[row],
+                'effect': kind,
+                'expired': True
+            })
 
         return updates
 
     def _execute_action(self,
                        battle: Dict,
                        actor_id: str,
-                       action_type: str,
+                       action_kind: ActionKind,
                        targets: List[str],
                        action_data: Dict) -> Dict:
 
-        results = {
-            'effects': [],
-            'damage_dealt': {},
-            'status_effects': [],
-            'position_changes': []
-        }
+        targets = battle['participants'].alive_ids(targets)
+        if not targets:
+            return _EMPTY_RESULT
 
         base_effects = self._calculate_action_effects(
             battle,
             actor_id,
-            action_type,
+            action_kind,
             action_data
         )
+        if not base_effects['effects']:
+            return _EMPTY_RESULT
+
+        results = {
+            'effects': [],
+            'damage_dealt': {},
+            'status_effects': [],
+            'position_changes': []
+        }
 
         for target_id in targets:
             target_results = self._apply_effects_to_target(
@@ -210,10 +259,33 @@ class BattleSystem:
 
         environment_effects = self._process_environment_effects(
             battle,
-            action_type,
+            action_kind,
             action_data
         )
 
         results['effects'].extend(environment_effects)
 
         return results
+
+    def _add_participant(self, battle: Dict, participant: Dict):
+
+        battle['participants'].add(participant)
+        team_id = participant.get('team_id', participant['id'])
+        battle['teams'].setdefault(team_id, []).append(participant['id'])
+
+    def _claim_battle_slot(self, battle_id: str) -> int:
+
+        if self._free_battle_slots:
+            slot = self._free_battle_slots.pop()
+            self._battle_slots[slot] = battle_id
+        else:
+            slot = len(self._battle_slots)
+            self._battle_slots.append(battle_id)
+
+        return slot
+
+    def _release_battle_slot(self, battle: Dict):
+
+        battle['participants'].release()
+        self._battle_slots[battle['slot']] = None
+        self._free_battle_slots.append(battle['slot'])
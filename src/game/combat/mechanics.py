@@ -2,12 +2,13 @@
 
 from typing import Dict, List, Tuple
 import numpy as np
-from enum import Enum
+from enum import Enum, IntEnum
 
 class AttackType(Enum):
     LIGHT = "light"
     HEAVY = "heavy"
-    SPECIAL = "special"    AERIAL = "aerial"
+    SPECIAL = "special"
+    AERIAL = "aerial"
     EXECUTION = "execution"
 
 class ComboPhase(Enum):
@@ -15,12 +16,65 @@ class ComboPhase(Enum):
     LINKER = "linker"
     ENDER = "ender"
 
+class AerialMove(IntEnum):
+    AIR_DASH = 0
+    AIR_SLAM = 1
+    AERIAL_EXECUTION = 2
+
+# Indexed by AerialMove
+AERIAL_STAMINA_COST = (15, 25, 40)
+AERIAL_DAMAGE_MULTIPLIER = (1.2, 1.6, 2.0)
+AERIAL_HEIGHT_REQUIREMENT = (2.0, 4.0, 3.0)
+AERIAL_MOMENTUM_FACTOR = (1.5, 2.0, 2.5)
+
+ATTACK_ORDER: List[AttackType] = list(AttackType)
+ATTACK_INDEX: Dict[AttackType, int] = {attack: i for i, attack in enumerate(ATTACK_ORDER)}
+EXECUTION_INDEX = ATTACK_INDEX[AttackType.EXECUTION]
+
+# Per-hit damage factor by ATTACK_ORDER; the execution slot is filled per call
+ATTACK_TYPE_MULTIPLIERS = np.array([
+    1.5 if attack == AttackType.HEAVY else 1.3 if attack == AttackType.AERIAL else 1.0
+    for attack in ATTACK_ORDER
+])
+
+def execution_mask(health_pct: np.ndarray,
+                   levels: np.ndarray,
+                   difficulty_modifier: float = 1.0) -> np.ndarray:
+
+    # 25% health base threshold plus 1% per level, for a whole roster at once
+    return np.asarray(health_pct) <= (0.25 + 0.01 * np.asarray(levels)) * difficulty_modifier
+
+def _compile_combo_evaluator(attacks: List[AttackType]):
+
+    # Folds the ramp and per-type factors of a fixed recipe into two literals:
+    # damage = base * (fixed + execution_weight * execution_multiplier)
+    fixed = 0.0
+    execution_weight = 0.0
+    for i, attack in enumerate(attacks):
+        ramp = 1.0 + 0.05 * i * (i + 1)
+        if attack == AttackType.EXECUTION:
+            execution_weight += ramp
+        else:
+            fixed += ramp * ATTACK_TYPE_MULTIPLIERS[ATTACK_INDEX[attack]]
+
+    source = (
+        "def evaluator(base_damage, execution_multiplier=1.0):\n"
+        f"    return base_damage * ({float(fixed)!r} + {execution_weight!r} * execution_multiplier)\n"
+    )
+    namespace: Dict = {}
+    exec(source, namespace)
+    return namespace['evaluator']
+
 class CombatMechanics:
 
     def __init__(self):
         self.combo_sequences = self._initialize_combo_sequences()
-        self.aerial_moves = self._initialize_aerial_moves()
+        for recipe in self.combo_sequences.values():
+            recipe['evaluator'] = _compile_combo_evaluator(
+                [attack for attack, _ in recipe['sequence']]
+            )
         self.execution_conditions = self._initialize_execution_conditions()
+        self._sequence_codes: Dict[Tuple[AttackType, ...], np.ndarray] = {}
 
     def _initialize_combo_sequences(self) -> Dict:
 
@@ -54,68 +108,53 @@ class CombatMechanics:
             }
         }
 
-    def _initialize_aerial_moves(self) -> Dict:
-
-        return {
-            'air_dash': {
-                'stamina_cost': 15,
-                'damage_multiplier': 1.2,
-                'height_requirement': 2.0,
-                'momentum_factor': 1.5
-            },
-            'air_slam': {
-                'stamina_cost': 25,
-                'damage_multiplier': 1.6,
-                'height_requirement': 4.0,
-                'momentum_factor': 2.0
-            },
-            'aerial_execution': {
-                'stamina_cost': 40,
-                'damage_multiplier': 2.0,
-                'height_requirement': 3.0,
-                'momentum_factor': 2.5
-            }
-        }
-
     def calculate_combo_damage(self,
                              base_damage: float,
                              combo_sequence: List[AttackType],
                              execution_multiplier: float = 1.0) -> float:
 
-        total_damage = 0
-        combo_multiplier = 1.0
+        codes = self._sequence_codes_for(combo_sequence)
+        if not len(codes):
+            return 0
+
+        # The ramp accumulates 0.1 * i per hit: 1 + 0.05 * i * (i + 1)
+        hits = np.arange(len(codes), dtype=np.float64)
+        combo_multipliers = 1.0 + 0.05 * hits * (hits + 1.0)
 
-        for i, attack in enumerate(combo_sequence):
+        type_multipliers = np.where(
+            codes == EXECUTION_INDEX,
+            execution_multiplier,
+            ATTACK_TYPE_MULTIPLIERS[codes]
+        )
 
-            combo_multiplier += 0.1 * i
+        return float(base_damage * np.dot(combo_multipliers, type_multipliers))
 
-            attack_damage = base_damage * combo_multiplier
+    def calculate_recipe_damage(self,
+                              recipe_name: str,
+                              base_damage: float,
+                              execution_multiplier: float = 1.0) -> float:
 
-            if attack == AttackType.HEAVY:
-                attack_damage *= 1.5
-            elif attack == AttackType.AERIAL:
-                attack_damage *= 1.3
-            elif attack == AttackType.EXECUTION:
-                attack_damage *= execution_multiplier
+        return self.combo_sequences[recipe_name]['evaluator'](base_damage, execution_multiplier)
 
-            total_damage += attack_damage
+    def _sequence_codes_for(self, combo_sequence: List[AttackType]) -> np.ndarray:
 
-        return total_damage
+        key = tuple(combo_sequence)
+        codes = self._sequence_codes.get(key)
+        if codes is None:
+            codes = np.array([ATTACK_INDEX[attack] for attack in key], dtype=np.int8)
+            self._sequence_codes[key] = codes
+
+        return codes
 
     def validate_aerial_move(self,
-                           move_name: str,
+                           move: AerialMove,
                            player_height: float,
                            current_stamina: float) -> bool:
 
-        if move_name not in self.aerial_moves:
-            return False
-
-        move = self.aerial_moves[move_name]
-
-        if player_height < move['height_requirement']:
+        if player_height < AERIAL_HEIGHT_REQUIREMENT[move]:
             return False
 
-        if current_stamina < move['stamina_cost']:
+        if current_stamina < AERIAL_STAMINA_COST[move]:
             return False
 
         return True
@@ -125,9 +164,4 @@ class CombatMechanics:
                                    player_level: int,
                                    difficulty_modifier: float = 1.0) -> bool:
 
-        base_threshold = 0.25  # 25% health
-        level_bonus = 0.01 * player_level  # 1% per level
-
-        final_threshold = (base_threshold + level_bonus) * difficulty_modifier
-
-        return target_health_percentage <= final_threshold
\ No newline at end of file
+        return bool(execution_mask(target_health_percentage, player_level, difficulty_modifier))
\ No newline at end of file
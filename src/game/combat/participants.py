@@ -0,0 +1,422 @@
+# src/game/combat/participants.py
+
+from typing import Dict, Iterator, List, Optional, Tuple
+from dataclasses import dataclass
+import numpy as np
+
+from .._jit import prange, select_kernel
+
+def _tick_kernel_numpy(positions: np.ndarray,
+                       velocities: np.ndarray,
+                       cooldowns: np.ndarray,
+                       status_remaining: np.ndarray,
+                       status_owner: np.ndarray,
+                       active: np.ndarray,
+                       delta_time: float) -> np.ndarray:
+
+    cooldowns[active] = np.maximum(cooldowns[active] - delta_time, 0.0)
+    status_remaining[active[status_owner]] -= delta_time
+
+    moving = active & velocities.any(axis=1)
+    positions[moving] += velocities[moving] * delta_time
+
+    return moving
+
+def _tick_kernel_loops(positions: np.ndarray,
+                       velocities: np.ndarray,
+                       cooldowns: np.ndarray,
+                       status_remaining: np.ndarray,
+                       status_owner: np.ndarray,
+                       active: np.ndarray,
+                       delta_time: float) -> np.ndarray:
+
+    count = positions.shape[0]
+    moving = np.zeros(count, dtype=np.bool_)
+
+    for row in prange(count):
+        if not active[row]:
+            continue
+
+        for column in range(cooldowns.shape[1]):
+            remaining = cooldowns[row, column] - delta_time
+            cooldowns[row, column] = remaining if remaining > 0.0 else 0.0
+
+        vx = velocities[row, 0]
+        vy = velocities[row, 1]
+        vz = velocities[row, 2]
+        if vx != 0.0 or vy != 0.0 or vz != 0.0:
+            positions[row, 0] += vx * delta_time
+            positions[row, 1] += vy * delta_time
+            positions[row, 2] += vz * delta_time
+            moving[row] = True
+
+    for index in prange(status_remaining.shape[0]):
+        if active[status_owner[index]]:
+            status_remaining[index] -= delta_time
+
+    return moving
+
+_tick_kernel = select_kernel(_tick_kernel_loops, _tick_kernel_numpy)
+
+@dataclass(slots=True)
+class BattleParticipant:
+    id: str
+    team_id: str
+    position: Tuple[float, float, float]
+    health: float
+    energy: float
+    status_effects: List[Dict]
+    active_skills: List[str]
+    cooldowns: Dict[str, float]
+
+class StatusEffectTable:
+
+    def __init__(self, capacity: int = 16):
+        capacity = max(capacity, 1)
+
+        self.count = 0
+        self.remaining = np.zeros(capacity, dtype=np.float32)
+        self.magnitude = np.zeros(capacity, dtype=np.float32)
+        self.owner_row = np.zeros(capacity, dtype=np.int32)
+        self.kind = np.zeros(capacity, dtype=np.int8)
+
+        self.kind_codes: Dict[str, int] = {}
+        self.kind_names: List[str] = []
+
+    def __len__(self) -> int:
+        return self.count
+
+    def add(self, owner_row: int, kind: str, duration: float, magnitude: float = 0.0):
+
+        if self.count == len(self.remaining):
+            self._grow(self.count * 2)
+
+        code = self.kind_codes.get(kind)
+        if code is None:
+            code = len(self.kind_names)
+            self.kind_codes[kind] = code
+            self.kind_names.append(kind)
+
+        index = self.count
+        self.remaining[index] = duration
+        self.magnitude[index] = magnitude
+        self.owner_row[index] = owner_row
+        self.kind[index] = code
+        self.count += 1
+
+    def for_owner(self, owner_row: int) -> List[Dict]:
+
+        rows = np.flatnonzero(self.owner_row[:self.count] == owner_row)
+        return [
+            {
+                'type': self.kind_names[self.kind[i]],
+                'duration': float(self.remaining[i]),
+                'magnitude': float(self.magnitude[i])
+            }
+            for i in rows
+        ]
+
+    def collect_expired(self, owner_active: Optional[np.ndarray] = None) -> List[Tuple[int, str]]:
+
+        # owner_active limits collection to effects whose owner row is flagged; others wait for their battle
+        count = self.count
+        if not count:
+            return []
+
+        expired = self.remaining[:count] <= 0.0
+        if owner_active is not None:
+            expired &= owner_active[self.owner_row[:count]]
+
+        expired_rows = np.flatnonzero(expired)
+        if not len(expired_rows):
+            return []
+
+        events = [
+            (int(self.owner_row[i]), self.kind_names[self.kind[i]])
+            for i in expired_rows
+        ]
+
+        self._keep(~expired)
+        return events
+
+    def remove_owners(self, owner_rows: List[int]):
+
+        if self.count:
+            self._keep(~np.isin(self.owner_row[:self.count], owner_rows))
+
+    def _keep(self, keep: np.ndarray):
+
+        count = self.count
+        kept = int(np.count_nonzero(keep))
+        for column in (self.remaining, self.magnitude, self.owner_row, self.kind):
+            column[:kept] = column[:count][keep]
+        self.count = kept
+
+    def _grow(self, capacity: int):
+
+        for name in ('remaining', 'magnitude', 'owner_row', 'kind'):
+            current = getattr(self, name)
+            grown = np.zeros(capacity, dtype=current.dtype)
+            grown[:self.count] = current[:self.count]
+            setattr(self, name, grown)
+
+class ParticipantTable:
+
+    # Participants of every battle share one set of columns; battle_idx says whose row it is
+    def __init__(self, capacity: int = 64, cooldown_slots: int = 8):
+        capacity = max(capacity, 1)
+
+        self.count = 0
+        self.free_rows: List[int] = []
+        self.ids: List[str] = [''] * capacity
+        self.team_ids: List[str] = [''] * capacity
+        self.active_skills: List[List[str]] = [[] for _ in range(capacity)]
+
+        self.battle_idx = np.full(capacity, -1, dtype=np.int32)
+        self.team_idx = np.zeros(capacity, dtype=np.int32)
+        self.health = np.zeros(capacity, dtype=np.float32)
+        self.energy = np.zeros(capacity, dtype=np.float32)
+        self.positions = np.zeros((capacity, 3), dtype=np.float32)
+        self.velocities = np.zeros((capacity, 3), dtype=np.float32)
+
+        # One column per skill seen in any battle
+        self.skill_columns: Dict[str, int] = {}
+        self.cooldowns = np.zeros((capacity, max(cooldown_slots, 1)), dtype=np.float32)
+
+        self.effects = StatusEffectTable(capacity * 2)
+
+    def add(self, participant: Dict, battle_idx: int, team_idx: int) -> int:
+
+        if self.free_rows:
+            row = self.free_rows.pop()
+        else:
+            if self.count == len(self.health):
+                self._grow_rows(self.count * 2)
+            row = self.count
+            self.count += 1
+
+        self.ids[row] = participant['id']
+        self.team_ids[row] = participant.get('team_id', participant['id'])
+        self.active_skills[row] = list(participant.get('active_skills', []))
+
+        self.battle_idx[row] = battle_idx
+        self.team_idx[row] = team_idx
+        self.health[row] = participant.get('health', 100.0)
+        self.energy[row] = participant.get('energy', 100.0)
+        self.positions[row] = participant.get('position', (0.0, 0.0, 0.0))
+        self.velocities[row] = participant.get('velocity', (0.0, 0.0, 0.0))
+
+        self.cooldowns[row] = 0.0
+        for skill_id, remaining in participant.get('cooldowns', {}).items():
+            column = self.skill_column(skill_id)
+            self.cooldowns[row, column] = remaining
+
+        for effect in participant.get('status_effects', []):
+            self.effects.add(
+                row,
+                effect['type'],
+                effect.get('duration', 0.0),
+                effect.get('magnitude', 0.0)
+            )
+
+        return row
+
+    def release(self, rows: List[int]):
+
+        self.battle_idx[rows] = -1
+        self.velocities[rows] = 0.0
+        self.effects.remove_owners(rows)
+        self.free_rows.extend(rows)
+
+    def skill_column(self, skill_id: str) -> int:
+
+        column = self.skill_columns.get(skill_id)
+        if column is None:
+            column = len(self.skill_columns)
+            if column == self.cooldowns.shape[1]:
+                grown = np.zeros((len(self.cooldowns), column * 2), dtype=np.float32)
+                grown[:, :column] = self.cooldowns
+                self.cooldowns = grown
+            self.skill_columns[skill_id] = column
+
+        return column
+
+    def tick(self,
+             delta_time: float,
+             battle_active: np.ndarray) -> Tuple[np.ndarray, List[Tuple[int, str]]]:
+
+        # One pass over every battle's rows; returns (moved rows, expired effects).
+        # battle_active carries a trailing False so released rows (battle_idx -1) stay put.
+        count = self.count
+        effects = self.effects
+        active = battle_active[self.battle_idx[:count]]
+        moving = _tick_kernel(
+            self.positions[:count],
+            self.velocities[:count],
+            self.cooldowns[:count],
+            effects.remaining[:effects.count],
+            effects.owner_row[:effects.count],
+            active,
+            delta_time
+        )
+
+        return np.flatnonzero(moving), effects.collect_expired(active)
+
+    def teams_alive(self, battle_count: int) -> np.ndarray:
+
+        # Number of teams with a living member, per battle slot
+        count = self.count
+        alive = (self.battle_idx[:count] >= 0) & (self.health[:count] > 0.0)
+        if not alive.any():
+            return np.zeros(battle_count, dtype=np.int64)
+
+        battles = self.battle_idx[:count][alive].astype(np.int64)
+        teams = self.team_idx[:count][alive]
+        stride = int(teams.max()) + 1
+        alive_teams = np.unique(battles * stride + teams)
+
+        return np.bincount(alive_teams // stride, minlength=battle_count)
+
+    def _grow_rows(self, capacity: int):
+
+        extra = capacity - len(self.health)
+        self.ids.extend([''] * extra)
+        self.team_ids.extend([''] * extra)
+        self.active_skills.extend([] for _ in range(extra))
+
+        for name in ('battle_idx', 'team_idx', 'health', 'energy', 'positions', 'velocities', 'cooldowns'):
+            current = getattr(self, name)
+            grown = np.zeros((capacity,) + current.shape[1:], dtype=current.dtype)
+            grown[:self.count] = current[:self.count]
+            setattr(self, name, grown)
+        self.battle_idx[self.count:] = -1
+
+class BattleRoster:
+
+    # Dict-like view of one battle's rows in the shared ParticipantTable
+    def __init__(self, table: ParticipantTable, battle_idx: int):
+        self.table = table
+        self.battle_idx = battle_idx
+        self.id_to_row: Dict[str, int] = {}
+        self.team_codes: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.id_to_row)
+
+    def __contains__(self, participant_id: str) -> bool:
+        return participant_id in self.id_to_row
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.id_to_row)
+
+    def __getitem__(self, participant_id: str) -> 'ParticipantView':
+        return ParticipantView(self.table, self.id_to_row[participant_id])
+
+    def keys(self) -> List[str]:
+        return list(self.id_to_row)
+
+    def values(self) -> List['ParticipantView']:
+        return [ParticipantView(self.table, row) for row in self.id_to_row.values()]
+
+    def items(self) -> List[Tuple[str, 'ParticipantView']]:
+        return [(pid, ParticipantView(self.table, row)) for pid, row in self.id_to_row.items()]
+
+    def add(self, participant: Dict) -> int:
+
+        team_id = participant.get('team_id', participant['id'])
+        team_idx = self.team_codes.setdefault(team_id, len(self.team_codes))
+
+        row = self.table.add(participant, self.battle_idx, team_idx)
+        self.id_to_row[participant['id']] = row
+        return row
+
+    def alive_ids(self, participant_ids: List[str]) -> List[str]:
+
+        rows = np.fromiter(
+            (self.id_to_row[pid] for pid in participant_ids),
+            dtype=np.intp,
+            count=len(participant_ids)
+        )
+        alive = self.table.health[rows] > 0.0
+        return [pid for pid, is_alive in zip(participant_ids, alive) if is_alive]
+
+    def release(self):
+
+        self.table.release(list(self.id_to_row.values()))
+        self.id_to_row.clear()
+
+class ParticipantView:
+
+    __slots__ = ('table', 'row')
+
+    def __init__(self, table: ParticipantTable, row: int):
+        self.table = table
+        self.row = row
+
+    @property
+    def id(self) -> str:
+        return self.table.ids[self.row]
+
+    @property
+    def team_id(self) -> str:
+        return self.table.team_ids[self.row]
+
+    @property
+    def health(self) -> float:
+        return float(self.table.health[self.row])
+
+    @health.setter
+    def health(self, value: float):
+        self.table.health[self.row] = value
+
+    @property
+    def energy(self) -> float:
+        return float(self.table.energy[self.row])
+
+    @energy.setter
+    def energy(self, value: float):
+        self.table.energy[self.row] = value
+
+    @property
+    def position(self) -> Tuple[float, float, float]:
+        return tuple(self.table.positions[self.row].tolist())
+
+    @position.setter
+    def position(self, value: Tuple[float, float, float]):
+        self.table.positions[self.row] = value
+
+    @property
+    def status_effects(self) -> List[Dict]:
+        return self.table.effects.for_owner(self.row)
+
+    def add_status_effect(self, kind: str, duration: float, magnitude: float = 0.0):
+
+        self.table.effects.add(self.row, kind, duration, magnitude)
+
+    @property
+    def active_skills(self) -> List[str]:
+        return self.table.active_skills[self.row]
+
+    @property
+    def cooldowns(self) -> Dict[str, float]:
+        row = self.table.cooldowns[self.row]
+        return {skill_id: float(row[column]) for skill_id, column in self.table.skill_columns.items()}
+
+    def snapshot(self) -> BattleParticipant:
+
+        # Detached copy of the row, for callers that keep participant state past the tick
+        return BattleParticipant(
+            id=self.id,
+            team_id=self.team_id,
+            position=self.position,
+            health=self.health,
+            energy=self.energy,
+            status_effects=self.status_effects,
+            active_skills=list(self.active_skills),
+            cooldowns=self.cooldowns
+        )
+
+    def set_cooldown(self, skill_id: str, remaining: float):
+
+        column = self.table.skill_column(skill_id)
+        self.table.cooldowns[self.row, column] = remaining
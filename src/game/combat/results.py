@@ -0,0 +1,26 @@
+# src/game/combat/results.py
+
+from typing import Dict, List
+
+RESULT_POOL_SIZE = 256
+
+class ResultPool:
+
+    # Recycles result dicts; whoever consumes a result pushes it back once done with it
+    __slots__ = ('_free', 'max_size')
+
+    def __init__(self, max_size: int = RESULT_POOL_SIZE):
+        self._free: List[Dict] = []
+        self.max_size = max_size
+
+    def __len__(self) -> int:
+        return len(self._free)
+
+    def pop(self) -> Dict:
+        return self._free.pop() if self._free else {}
+
+    def push(self, result: Dict):
+
+        if len(self._free) < self.max_size:
+            result.clear()
+            self._free.append(result)
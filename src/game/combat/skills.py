@@ -2,12 +2,14 @@
 
 from typing import Dict, List, Optional, Tuple
 from enum import Enum
-from dataclasses import dataclass
-import uuid
+from dataclasses import dataclass, field
 import math
 import random
+import numpy as np
+from ..ids import next_uuid
 
-class SkillType(Enum):    ATTACK = "attack"           
+class SkillType(Enum):
+    ATTACK = "attack"           
     DEFENSE = "defense"         
     SUPPORT = "support"         
     CONTROL = "control"        
@@ -41,6 +43,24 @@ class SkillData:
     effects: List[Dict]
     requirements: Dict
 
+    # Compiled from effects by SkillSystem._compile_skill_tables; not init fields, so copies start uncompiled
+    _base_values: Optional[np.ndarray] = field(default=None, init=False, repr=False, compare=False)
+    _scaling_keys: Tuple[str, ...] = field(default=(), init=False, repr=False, compare=False)
+    _scaling_matrix: Optional[np.ndarray] = field(default=None, init=False, repr=False, compare=False)
+
+def _scaling_table(effects: List[Dict], key: str) -> Tuple[Tuple[str, ...], np.ndarray]:
+
+    # (effects, stats) matrix of per-stat coefficients, zero where an effect ignores a stat
+    stats = tuple(dict.fromkeys(stat for effect in effects for stat in effect.get(key, {})))
+    columns = {stat: i for i, stat in enumerate(stats)}
+
+    matrix = np.zeros((len(effects), len(stats)))
+    for row, effect in enumerate(effects):
+        for stat, scaling in effect.get(key, {}).items():
+            matrix[row, columns[stat]] = scaling
+
+    return stats, matrix
+
 class SkillSystem:
 
     def __init__(self):
@@ -51,7 +71,7 @@ class SkillSystem:
     def create_skill(self, skill_config: Dict) -> Dict:
 
         try:
-            skill_id = str(uuid.uuid4())
+            skill_id = next_uuid()
 
             validation = self._validate_skill_config(skill_config)
             if not validation['valid']:
@@ -71,6 +91,7 @@ class SkillSystem:
                 requirements=skill_config.get('requirements', {})
             )
 
+            self._compile_skill_tables(skill)
             self.skills[skill_id] = skill
 
             return {
@@ -88,44 +109,94 @@ class SkillSystem:
                               target_stats: Dict,
                               environment: Dict) -> Dict:
 
-        try:
-            skill = self.skills.get(skill_id)
-            if not skill:
-                return {'success': False, 'reason': 'Skill not found'}
+        skill = self.skills.get(skill_id)
+        if not skill:
+            return {'success': False, 'reason': 'Skill not found'}
 
-            effects = []
+        effects = []
+        base_values = self._base_effect_values(skill, caster_stats).tolist()
 
-            for effect in skill.effects:
+        for effect, base_value in zip(skill.effects, base_values):
 
-                base_value = self._calculate_base_effect(
-                    effect,
-                    skill,
-                    caster_stats
-                )
+            modified_value = self._apply_modifiers(
+                base_value,
+                effect,
+                caster_stats,
+                target_stats,
+                environment
+            )
 
-                modified_value = self._apply_modifiers(
+            effects.append({
+                'type': effect['type'],
+                'value': modified_value,
+                'duration': effect.get('duration', 0),
+                'conditions': effect.get('conditions', [])
+            })
+
+        return {
+            'success': True,
+            'effects': effects,
+            'energy_cost': self._calculate_energy_cost(skill, caster_stats)
+        }
+
+    def calculate_skill_effects_batch(self,
+                                    skill_id: str,
+                                    caster_stats: Dict,
+                                    target_stats: Dict[str, np.ndarray],
+                                    environment: Dict) -> Dict:
+
+        # target_stats holds one array per stat, one entry per target
+        skill = self.skills.get(skill_id)
+        if not skill:
+            return {'success': False, 'reason': 'Skill not found'}
+
+        target_count = len(next(iter(target_stats.values()))) if target_stats else 0
+
+        # Caster-side scaling is shared by every target; modifiers run per target exactly as in
+        # calculate_skill_effects, so both paths give the same values
+        base_values = self._base_effect_values(skill, caster_stats).tolist()
+        stat_names = list(target_stats)
+        stat_columns = [np.asarray(target_stats[stat]).tolist() for stat in stat_names]
+
+        values = np.empty((len(skill.effects), target_count))
+        for target_index, row in enumerate(zip(*stat_columns)):
+            target = dict(zip(stat_names, row))
+            for effect_index, (effect, base_value) in enumerate(zip(skill.effects, base_values)):
+                values[effect_index, target_index] = self._apply_modifiers(
                     base_value,
                     effect,
                     caster_stats,
-                    target_stats,
+                    target,
                     environment
                 )
 
-                effects.append({
-                    'type': effect['type'],
-                    'value': modified_value,
-                    'duration': effect.get('duration', 0),
-                    'conditions': effect.get('conditions', [])
-                })
+        return {
+            'success': True,
+            'effect_types': [effect['type'] for effect in skill.effects],
+            'durations': [effect.get('duration', 0) for effect in skill.effects],
+            'effects': values,
+            'energy_cost': self._calculate_energy_cost(skill, caster_stats)
+        }
 
-            return {
-                'success': True,
-                'effects': effects,
-                'energy_cost': self._calculate_energy_cost(skill, caster_stats)
-            }
+    def _base_effect_values(self, skill: SkillData, caster_stats: Dict) -> np.ndarray:
 
-        except Exception as e:
-            return {'success': False, 'reason': str(e)}
+        if skill._base_values is None:
+            self._compile_skill_tables(skill)
+
+        caster_vector = np.fromiter(
+            (caster_stats.get(stat, 0.0) for stat in skill._scaling_keys),
+            dtype=np.float64,
+            count=len(skill._scaling_keys)
+        )
+        return skill._base_values * skill.base_power + skill._scaling_matrix @ caster_vector
+
+    def _compile_skill_tables(self, skill: SkillData):
+
+        skill._base_values = np.array(
+            [effect['base_value'] for effect in skill.effects],
+            dtype=np.float64
+        )
+        skill._scaling_keys, skill._scaling_matrix = _scaling_table(skill.effects, 'scaling')
 
     def evolve_skill(self,
                     skill_id: str,
@@ -141,6 +212,7 @@ class SkillSystem:
                 return {'success': False, 'reason': 'Evolution requirements not met'}
 
             evolved_skill = self._perform_evolution(skill, evolution_path)
+            self._compile_skill_tables(evolved_skill)
 
             self.skills[skill_id] = evolved_skill
 
@@ -178,16 +250,3 @@ class SkillSystem:
 
         except Exception as e:
             return {'success': False, 'reason': str(e)}
-
-    def _calculate_base_effect(self,
-                             effect: Dict,
-                             skill: SkillData,
-                             caster_stats: Dict) -> float:
-
-        base_value = effect['base_value'] * skill.base_power
-
-        for stat, scaling in effect.get('scaling', {}).items():
-            if stat in caster_stats:
-                base_value += caster_stats[stat] * scaling
-
-        return base_value
@@ -1,17 +1,88 @@
 # src/game/combat/system.py
 
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Mapping, Optional, Tuple
 import numpy as np
 from dataclasses import dataclass
-from enum import Enum
+from enum import Enum, IntEnum
+from math import sqrt as _sqrt
+from types import MappingProxyType
+from random import random as _rand
+import os
 import uuid
+import weakref
+
+from .participants import ParticipantTable
+from .results import ResultPool
 
 class CombatStyle(Enum):
-    AGGRESSIVE = "aggressive"    DEFENSIVE = "defensive"
+    AGGRESSIVE = "aggressive"
+    DEFENSIVE = "defensive"
     TACTICAL = "tactical"
     AERIAL = "aerial"
     BALANCED = "balanced"
 
+class AttackKind(IntEnum):
+    LIGHT = 0
+    HEAVY = 1
+    SPECIAL = 2
+    EXECUTION = 3
+    NORMAL = 4
+
+_ATK_MULT = (0.7, 1.3, 1.5, 2.0, 1.0)
+
+F_IN_COMBAT = 1
+F_COMBO = 2
+F_AERIAL_OK = 4
+F_STAMINA_REGEN = 8
+F_VULN = 16
+
+CRIT_ROLL_BATCH = 4096
+
+class _RollBuffer:
+
+    # Uniform [0, 1) rolls drawn 4096 at a time and handed out in slices
+    def __init__(self, size: int = CRIT_ROLL_BATCH):
+        self._rng = np.random.default_rng()
+        self._rolls = self._rng.random(size)
+        self._cursor = 0
+        _ROLL_BUFFERS.add(self)
+
+    def reseed(self):
+
+        # Fresh entropy and an exhausted buffer, so the next take() draws new rolls
+        self._rng = np.random.default_rng()
+        self._cursor = len(self._rolls)
+
+    def take(self, count: int) -> np.ndarray:
+
+        if self._cursor + count > len(self._rolls):
+            self._rolls = self._rng.random(max(count, len(self._rolls)))
+            self._cursor = 0
+
+        rolls = self._rolls[self._cursor:self._cursor + count]
+        self._cursor += count
+        return rolls
+
+# Forked workers would otherwise replay their parent's queued rolls and generator state
+_ROLL_BUFFERS: 'weakref.WeakSet[_RollBuffer]' = weakref.WeakSet()
+
+def _reseed_roll_buffers():
+
+    for buffer in list(_ROLL_BUFFERS):
+        buffer.reseed()
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reseed_roll_buffers)
+
+_FLAG_NAMES = (
+    ('in_combat', F_IN_COMBAT),
+    ('executing_combo', F_COMBO),
+    ('can_aerial', F_AERIAL_OK),
+    ('stamina_regenerating', F_STAMINA_REGEN),
+    ('vulnerable', F_VULN)
+)
+_FLAG_BY_NAME = dict(_FLAG_NAMES)
+
 @dataclass
 class CombatStats:
     health: float = 100.0
@@ -44,26 +115,117 @@ class CombatSystem:
         self.aerial_hits: int = 0
         self.perfect_blocks: int = 0
 
-        self.state = {
-            'in_combat': False,
-            'executing_combo': False,
-            'can_aerial': True,
-            'stamina_regenerating': True,
-            'vulnerable': False
-        }
+        self._flags = F_AERIAL_OK | F_STAMINA_REGEN
+
+        self._results = ResultPool()
+
+        # Row-indexed positions come from the battle's participant table once bound
+        self._participants: Optional[ParticipantTable] = None
+        self._scratch_position = np.zeros(3, dtype=np.float32)
+        self._scratch_velocity = np.zeros(3, dtype=np.float32)
+        self._crit_rolls = _RollBuffer()
+
+    @property
+    def state(self) -> Mapping[str, bool]:
+
+        # Read-only snapshot of the flag bits; writes go through set_state
+        return MappingProxyType({name: bool(self._flags & flag) for name, flag in _FLAG_NAMES})
+
+    def set_state(self, name: str, value: bool):
+
+        flag = _FLAG_BY_NAME.get(name)
+        if flag is None:
+            raise KeyError(f'Unknown combat state flag: {name}')
+
+        if value:
+            self._flags |= flag
+        else:
+            self._flags &= ~flag
+
+    def bind_participants(self, participants: ParticipantTable):
+
+        self._participants = participants
 
     def initiate_combat(self, targets: List[str]) -> Dict:
 
         self.current_targets = targets
-        self.state['in_combat'] = True
+        self._flags |= F_IN_COMBAT
         return self._prepare_combat_engagement()
 
     def execute_attack(self, 
                       target_id: str,
-                      attack_type: str,
+                      attack_type: AttackKind,
                       position: Tuple[float, float, float],
                       context: Dict) -> Dict:
 
+        self._scratch_position[:] = position
+        result = self._execute_attack(target_id, attack_type, self._scratch_position, context)
+        if result['success']:
+            result['position'] = position
+        return result
+
+    def execute_attack_row(self,
+                          target_row: int,
+                          attack_type: AttackKind,
+                          context: Dict) -> Dict:
+
+        participants = self._participants
+        result = self._execute_attack(
+            participants.ids[target_row],
+            attack_type,
+            participants.positions[target_row],
+            context
+        )
+        if result['success']:
+            result['target_row'] = target_row
+        return result
+
+    def execute_attack_rows(self,
+                           target_rows: np.ndarray,
+                           attack_type: AttackKind,
+                           context: Dict) -> Dict:
+
+        # One attack landing on several targets: crits and range falloff computed per target at once
+        participants = self._participants
+        rows = np.array([
+            row for row in target_rows
+            if self._validate_attack(participants.ids[row], attack_type, context)
+        ], dtype=np.intp)
+        if not len(rows):
+            return {'success': False, 'reason': 'Invalid attack parameters'}
+
+        base_damage = self.stats.strength * 0.5 * _ATK_MULT[attack_type]
+        crits = self._crit_rolls.take(len(rows)) < self.stats.critical_chance
+        damage = np.where(crits, base_damage * 2, base_damage)
+
+        positions = participants.positions[rows]
+        distances = np.sqrt(np.einsum('ij,ij->i', positions, positions))
+        damage[distances > 5.0] *= 0.8
+
+        if self._flags & F_COMBO:
+            damage *= self.stats.combo_multiplier
+            self.combo_counter += 1
+
+        if self.aerial_state:
+            damage *= (1 + self.stats.aerial_bonus)
+            self.aerial_hits += 1
+
+        self.damage_dealt += float(damage.sum())
+
+        result = self._results.pop()
+        result['success'] = True
+        result['target_rows'] = rows
+        result['damage'] = damage
+        result['critical'] = crits
+        result['combo'] = self.combo_counter
+        return result
+
+    def _execute_attack(self,
+                       target_id: str,
+                       attack_type: AttackKind,
+                       position: np.ndarray,
+                       context: Dict) -> Dict:
+
         if not self._validate_attack(target_id, attack_type, context):
             return {'success': False, 'reason': 'Invalid attack parameters'}
 
@@ -73,7 +235,7 @@ class CombatSystem:
             context
         )
 
-        if self.state['executing_combo']:
+        if self._flags & F_COMBO:
             damage *= self.stats.combo_multiplier
             self.combo_counter += 1
 
@@ -83,13 +245,12 @@ class CombatSystem:
 
         self.damage_dealt += damage
 
-        return {
-            'success': True,
-            'damage': damage,
-            'effects': effects,
-            'combo': self.combo_counter,
-            'position': position
-        }
+        result = self._results.pop()
+        result['success'] = True
+        result['damage'] = damage
+        result['effects'] = effects
+        result['combo'] = self.combo_counter
+        return result
 
     def defend(self, 
               attack_vector: Dict,
@@ -106,19 +267,48 @@ class CombatSystem:
         mitigated_damage = attack_vector['damage'] * (1 - damage_reduction)
         self.damage_received += mitigated_damage
 
-        return {
-            'success': True,
-            'damage_mitigated': attack_vector['damage'] - mitigated_damage,
-            'perfect_block': reaction_time < 0.2,
-            'counter_available': counter_opportunity
-        }
+        result = self._results.pop()
+        result['success'] = True
+        result['damage_mitigated'] = attack_vector['damage'] - mitigated_damage
+        result['perfect_block'] = reaction_time < 0.2
+        result['counter_available'] = counter_opportunity
+        return result
 
     def execute_aerial_maneuver(self, 
                               maneuver_type: str,
                               position: Tuple[float, float, float],
                               velocity: Tuple[float, float, float]) -> Dict:
 
-        if not self.state['can_aerial']:
+        self._scratch_position[:] = position
+        self._scratch_velocity[:] = velocity
+        result = self._execute_aerial_maneuver(
+            maneuver_type,
+            self._scratch_position,
+            self._scratch_velocity
+        )
+        if result['success']:
+            result['position'] = position
+            result['velocity'] = velocity
+        return result
+
+    def execute_aerial_maneuver_row(self, row: int, maneuver_type: str) -> Dict:
+
+        participants = self._participants
+        result = self._execute_aerial_maneuver(
+            maneuver_type,
+            participants.positions[row],
+            participants.velocities[row]
+        )
+        if result['success']:
+            result['row'] = row
+        return result
+
+    def _execute_aerial_maneuver(self,
+                                maneuver_type: str,
+                                position: np.ndarray,
+                                velocity: np.ndarray) -> Dict:
+
+        if not self._flags & F_AERIAL_OK:
             return {'success': False, 'reason': 'Aerial maneuver not available'}
 
         stamina_cost = self._calculate_aerial_stamina_cost(maneuver_type)
@@ -134,37 +324,30 @@ class CombatSystem:
             velocity
         )
 
-        return {
-            'success': True,
-            'maneuver': maneuver_type,
-            'effects': effects,
-            'position': position,
-            'velocity': velocity
-        }
+        result = self._results.pop()
+        result['success'] = True
+        result['maneuver'] = maneuver_type
+        result['effects'] = effects
+        return result
 
-    def _calculate_attack_impact(self,
-                               attack_type: str,
-                               position: Tuple[float, float, float],
-                               context: Dict) -> Tuple[float, List[str]]:
+    def release_result(self, result: Dict):
 
-        base_damage = self.stats.strength * 0.5
+        self._results.push(result)
 
-        multipliers = {
-            'light': 0.7,
-            'heavy': 1.3,
-            'special': 1.5,
-            'execution': 2.0
-        }
+    def _calculate_attack_impact(self,
+                               attack_type: AttackKind,
+                               position: np.ndarray,
+                               context: Dict) -> Tuple[float, List[str]]:
 
-        damage = base_damage * multipliers.get(attack_type, 1.0)
+        damage = self.stats.strength * 0.5 * _ATK_MULT[attack_type]
 
-        if np.random.random() < self.stats.critical_chance:
+        if _rand() < self.stats.critical_chance:
             damage *= 2
             effects = ['critical']
         else:
             effects = []
 
-        distance = np.linalg.norm(position)
+        distance = _sqrt(position.dot(position))
         if distance > 5.0:  # Long-range attack
             damage *= 0.8
 
@@ -1,13 +1,13 @@
 # src/game/game.py
 
 from typing import Dict, List, Optional, Any
-from datetime import datetime
-import uuid
 import logging
 from enum import Enum
 
+from .ids import next_uuid, monotonic_stamp
 from .world.environment import EnvironmentSystem
-from .world.physics import PhysicsSystemfrom .world.interaction import InteractionSystem
+from .world.physics import PhysicsSystem
+from .world.interaction import InteractionSystem
 from .social.relationships import RelationshipSystem
 from .social.faction import FactionSystem
 from .combat.system import CombatSystem
@@ -19,6 +19,19 @@ from .agent_platform.sharing import AgentSharing
 from .agent_platform.avatar_system import AvatarSystem
 from .agent_platform.personality_engine import PersonalityEngine
 
+SLOW_METRICS_INTERVAL = 1.0
+
+# (attribute, method) of each subsystem update, visited in this order once per frame
+SUBSYSTEM_UPDATES = (
+    ('environment', 'update'),
+    ('physics', 'update'),
+    ('interaction', 'update_all'),
+    ('relationships', 'update'),
+    ('factions', 'update'),
+    ('combat', 'update'),
+    ('simulation', 'update')
+)
+
 class GameState(Enum):
     INITIALIZING = "initializing"
     RUNNING = "running"
@@ -29,9 +42,9 @@ class GameState(Enum):
 class Game:
 
     def __init__(self, config: Optional[Dict] = None):
-        self.game_id = str(uuid.uuid4())
+        self.game_id = next_uuid()
         self.state = GameState.INITIALIZING
-        self.start_time = datetime.now()
+        self.start_time = monotonic_stamp()
         self.config = config or self._default_config()
 
         self.players = []
@@ -57,8 +70,19 @@ class Game:
         self.current_time = 0.0
         self.time_scale = 1.0
         self.performance_metrics: Dict[str, float] = {}
+
+        # Memory/CPU sampling is costly; refreshed every SLOW_METRICS_INTERVAL seconds
+        self._metrics_accum_time = 0.0
+        self._slow_metrics: Dict[str, float] = {}
         self.event_log: List[Dict] = []
 
+        # Reused every frame; subsystems append to it directly
+        self._frame_events: List[Dict] = []
+
+        # Bound on the first frame, so a subsystem without its update method fails that
+        # frame (and sets ERROR) rather than the constructor
+        self._subsystem_updates = None
+
         self._initialize_game()
 
     def update(self, delta_time: float) -> Dict:
@@ -68,23 +92,26 @@ class Game:
 
         try:
             scaled_delta = delta_time * self.time_scale
-            updates = {
-                'time': self.current_time,
-                'events': [],
-                'metrics': {}
-            }
+            events = self._frame_events
+            del events[:]
 
-            self._update_core_systems(scaled_delta, updates)
+            if self._subsystem_updates is None:
+                self._subsystem_updates = tuple(
+                    getattr(getattr(self, name), method) for name, method in SUBSYSTEM_UPDATES
+                )
 
-            self._update_social_systems(scaled_delta, updates)
+            for update_subsystem in self._subsystem_updates:
+                update_subsystem(scaled_delta, events)
 
-            combat_updates = self.combat.update(scaled_delta)
-            updates['events'].extend(combat_updates.get('events', []))
+            metrics = {}
+            self._update_performance_metrics(metrics, delta_time)
 
-            sim_updates = self.simulation.update(scaled_delta)
-            updates['events'].extend(sim_updates.get('events', []))
-
-            self._update_performance_metrics(updates['metrics'])
+            # The frame buffer is reused next frame; callers get their own list
+            updates = {
+                'time': self.current_time,
+                'events': list(events),
+                'metrics': metrics
+            }
 
             self.current_time += scaled_delta
             return {'success': True, 'updates': updates}
@@ -97,12 +124,12 @@ class Game:
     def add_player(self, player_data: Dict) -> Dict:
 
         try:
-            player_id = str(uuid.uuid4())
+            player_id = next_uuid()
 
             player = {
                 'id': player_id,
                 'data': player_data,
-                'joined_at': datetime.now(),
+                'joined_at': monotonic_stamp(),
                 'agents': [],
                 'state': 'active'
             }
@@ -178,31 +205,19 @@ class Game:
         except Exception as e:
             return {'success': False, 'reason': str(e)}
 
-    def _update_core_systems(self, delta_time: float, updates: Dict):
-
-        env_updates = self.environment.update(delta_time)
-        updates['events'].extend(env_updates.get('events', []))
-
-        physics_updates = self.physics.update(delta_time)
-        updates['events'].extend(physics_updates.get('events', []))
-
-        interaction_updates = self.interaction.update_all(delta_time)
-        updates['events'].extend(interaction_updates.get('events', []))
+    def _update_performance_metrics(self, metrics: Dict, delta_time: float):
 
-    def _update_social_systems(self, delta_time: float, updates: Dict):
-
-        rel_updates = self.relationships.update(delta_time)
-        updates['events'].extend(rel_updates.get('events', []))
-
-        faction_updates = self.factions.update(delta_time)
-        updates['events'].extend(faction_updates.get('events', []))
-
-    def _update_performance_metrics(self, metrics: Dict):
+        self._metrics_accum_time += delta_time
+        if not self._slow_metrics or self._metrics_accum_time >= SLOW_METRICS_INTERVAL:
+            self._slow_metrics = {
+                'memory_usage': self._get_memory_usage(),
+                'cpu_usage': self._get_cpu_usage()
+            }
+            self._metrics_accum_time = 0.0
 
         metrics.update({
             'fps': self._calculate_fps(),
             'active_players': len(self.players),
-            'active_agents': len(self.ai_agents),
-            'memory_usage': self._get_memory_usage(),
-            'cpu_usage': self._get_cpu_usage()
-        })
\ No newline at end of file
+            'active_agents': len(self.ai_agents)
+        })
+        metrics.update(self._slow_metrics)
\ No newline at end of file
@@ -0,0 +1,40 @@
+# src/game/ids.py
+
+from datetime import datetime
+from typing import List
+import os
+import time
+import uuid
+
+UUID_BATCH_SIZE = 1024
+
+_uuid_batch: List[str] = []
+
+# Pairs the monotonic clock with wall time once, so stamps convert only when serialized
+_WALL_ANCHOR_NS = time.time_ns()
+_MONOTONIC_ANCHOR_NS = time.monotonic_ns()
+
+def _refill_uuids():
+
+    # One urandom call per batch instead of one per id
+    raw = os.urandom(16 * UUID_BATCH_SIZE)
+    _uuid_batch.extend(
+        str(uuid.UUID(bytes=raw[i:i + 16], version=4))
+        for i in range(0, len(raw), 16)
+    )
+
+# A forked worker must not hand out the ids its parent already had queued
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_uuid_batch.clear)
+
+def next_uuid() -> str:
+
+    if not _uuid_batch:
+        _refill_uuids()
+    return _uuid_batch.pop()
+
+def monotonic_stamp() -> int:
+    return time.monotonic_ns()
+
+def stamp_to_datetime(stamp: int) -> datetime:
+    return datetime.fromtimestamp((_WALL_ANCHOR_NS + stamp - _MONOTONIC_ANCHOR_NS) / 1e9)
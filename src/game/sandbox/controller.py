@@ -1,13 +1,36 @@
+from collections import OrderedDict
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, NamedTuple, Optional
 from enum import Enum
+import atexit
+import copy
 import logging
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener
+import os
+import pickle
+import queue
+import shutil
+import tempfile
 from threading import Lock
+import weakref
+
+import numpy as np
+
+from ..ids import monotonic_stamp
+
+SAVE_STORE_PREFIX = 'verai_turn_store_'
+HOT_SAVE_STATES = 3
+
+LOG_QUEUE_SIZE = 10_000
+LOG_BATCH_SIZE = 64
+
+_log_listener: Optional[QueueListener] = None
 
 class ControlCommand(Enum):
     START = "start"
     PAUSE = "pause"
-    RESUME = "resume"    STOP = "stop"
+    RESUME = "resume"
+    STOP = "stop"
     RESET = "reset"
     SAVE = "save"
     LOAD = "load"
@@ -19,17 +42,97 @@ class SimulationState(Enum):
     STOPPED = "stopped"
     ERROR = "error"
 
+class CommandLogEntry(NamedTuple):
+    timestamp: datetime
+    command: str
+    params: Optional[Dict]
+    result: Dict
+
+class _ArrayPatch(NamedTuple):
+    indices: np.ndarray
+    values: np.ndarray
+
+def _diff_state(state: Dict, base: Dict) -> Dict:
+
+    changed = {}
+    for key, value in state.items():
+        if key not in base:
+            changed[key] = value
+            continue
+
+        old = base[key]
+        if isinstance(value, np.ndarray) and isinstance(old, np.ndarray) and value.shape == old.shape:
+            flat = value.reshape(-1)
+            indices = np.flatnonzero(flat != old.reshape(-1))
+            if indices.size:
+                changed[key] = _ArrayPatch(indices, flat[indices])
+            continue
+
+        try:
+            same = bool(value == old)
+        except (TypeError, ValueError):
+            same = False
+        if not same:
+            changed[key] = value
+
+    return {
+        'changed': changed,
+        'removed': [key for key in base if key not in state]
+    }
+
+def _apply_diff(base: Dict, diff: Dict) -> Dict:
+
+    state = copy.deepcopy(base)
+    for key in diff['removed']:
+        del state[key]
+
+    for key, value in diff['changed'].items():
+        if isinstance(value, _ArrayPatch):
+            state[key].reshape(-1)[value.indices] = value.values
+        else:
+            state[key] = value
+
+    return state
+
 class SandboxController:
 
-    def __init__(self, simulation: 'SandboxSimulation'):
+    def __init__(self, simulation: 'SandboxSimulation', save_store_dir: Optional[str] = None):
         self.simulation = simulation
-        self.command_history: List[Dict] = []
-        self.save_states: Dict[str, Any] = {}
+        self._command_history: List[CommandLogEntry] = []
+        # Log entries are committed to the history in batches; reading command_history flushes first
+        self._history_buffer: List[CommandLogEntry] = []
+        self._history_buffer_limit = 64
+        # Saves are diffs against one base snapshot, stored on disk; only the newest few stay in memory
+        self.save_states: 'OrderedDict[str, str]' = OrderedDict()
+        self._hot_saves: 'OrderedDict[str, Dict]' = OrderedDict()
+        self._base_snapshot: Optional[Dict] = None
+        # Simulations that can stream themselves skip the dict snapshot entirely
+        self._streams_state = hasattr(simulation, 'save_to') and hasattr(simulation, 'load_from')
+        # Without an explicit directory saves go to a private temp dir, removed on shutdown or exit
+        if save_store_dir is None:
+            self.save_store_dir = tempfile.mkdtemp(prefix=SAVE_STORE_PREFIX)
+            self._remove_store = weakref.finalize(self, shutil.rmtree, self.save_store_dir, True)
+        else:
+            self.save_store_dir = save_store_dir
+            self._remove_store = None
         self.active_commands: Dict[str, Dict] = {}
 
-        self._lock = Lock()  # Neu: Thread-Lock
-        self.is_processing = False
+        # Held only while a command runs; callers that find it taken are turned away
+        self._busy = Lock()
+
+        # Every handler takes params, even the ones that ignore it
+        self._dispatch = {
+            ControlCommand.START: self._start_simulation,
+            ControlCommand.PAUSE: lambda params: self._pause_simulation(),
+            ControlCommand.RESUME: lambda params: self._resume_simulation(),
+            ControlCommand.STOP: lambda params: self._stop_simulation(),
+            ControlCommand.RESET: lambda params: self._reset_simulation(),
+            ControlCommand.SAVE: self._save_state,
+            ControlCommand.LOAD: self._load_state
+        }
         self.last_update = datetime.now()
+        # Wall clock read once per command and shared by everything that command records
+        self._command_time = self.last_update
         self.error_count = 0
 
         self.MAX_HISTORY_ENTRIES = 1000
@@ -39,60 +142,98 @@ class SandboxController:
 
     def _setup_logging(self):
 
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            filename='sandbox_controller.log'
-        )
+        global _log_listener
+
+        root = logging.getLogger()
+        if _log_listener is not None or root.handlers:
+            return
+
+        # Records are handed to a background thread and written to the file in batches;
+        # an ERROR record flushes the batch straight away
+        file_handler = logging.FileHandler('sandbox_controller.log')
+        file_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+        batching_handler = MemoryHandler(LOG_BATCH_SIZE, flushLevel=logging.ERROR, target=file_handler)
+
+        log_queue = queue.Queue(maxsize=LOG_QUEUE_SIZE)
+        root.setLevel(logging.INFO)
+        root.addHandler(QueueHandler(log_queue))
+
+        _log_listener = QueueListener(log_queue, batching_handler)
+        _log_listener.start()
+        atexit.register(_log_listener.stop)
+
+    @property
+    def command_history(self) -> List[CommandLogEntry]:
+
+        self.flush_history()
+        return self._command_history
+
+    def flush_history(self):
+
+        if self._history_buffer:
+            self._command_history.extend(self._history_buffer)
+            self._history_buffer.clear()
+            self._trim_history()
 
     def _trim_history(self):
 
-        if len(self.command_history) > self.MAX_HISTORY_ENTRIES:
-            self.command_history = self.command_history[-self.MAX_HISTORY_ENTRIES:]
+        if len(self._command_history) > self.MAX_HISTORY_ENTRIES:
+            self._command_history = self._command_history[-self.MAX_HISTORY_ENTRIES:]
+
+    def shutdown(self):
+
+        self.flush_history()
+        self._hot_saves.clear()
+
+        if self._remove_store is not None:
+            self._remove_store()
+        else:
+            for path in self.save_states.values():
+                if os.path.exists(path):
+                    os.remove(path)
+
+        self.save_states.clear()
 
     def _trim_save_states(self):
 
-        if len(self.save_states) > self.MAX_SAVE_STATES:
-            oldest_save = min(self.save_states.keys())
-            del self.save_states[oldest_save]
+        # Save ids are increasing timestamps, so insertion order is already oldest first
+        while len(self.save_states) > self.MAX_SAVE_STATES:
+            oldest_save, path = self.save_states.popitem(last=False)
+            self._hot_saves.pop(oldest_save, None)
+            if os.path.exists(path):
+                os.remove(path)
+
+    def _cache_hot_save(self, save_id: str, diff: Dict):
+
+        self._hot_saves[save_id] = diff
+        self._hot_saves.move_to_end(save_id)
+        if len(self._hot_saves) > HOT_SAVE_STATES:
+            self._hot_saves.popitem(last=False)
 
     def execute_command(self, command: ControlCommand, params: Dict = None) -> Dict:
 
-        with self._lock:  # Neu: Thread-safe execution
-            if self.is_processing:
-                return {'success': False, 'reason': 'Controller is busy'}
-
-            self.is_processing = True
-            result = {'success': False, 'command': command.value}
-
-            try:
-                if command == ControlCommand.START:
-                    result = self._start_simulation(params)
-                elif command == ControlCommand.PAUSE:
-                    result = self._pause_simulation()
-                elif command == ControlCommand.RESUME:
-                    result = self._resume_simulation()
-                elif command == ControlCommand.STOP:
-                    result = self._stop_simulation()
-                elif command == ControlCommand.RESET:
-                    result = self._reset_simulation()
-                elif command == ControlCommand.SAVE:
-                    result = self._save_state(params)
-                elif command == ControlCommand.LOAD:
-                    result = self._load_state(params)
-
-                self._log_command(command, params, result)
-                self._trim_history()  
-
-            except Exception as e:
-                logging.error(f"Command execution error: {str(e)}")
-                result['reason'] = str(e)
-                self.error_count += 1
-
-            finally:
-                self.is_processing = False
-
-            return result
+        if not self._busy.acquire(blocking=False):
+            return {'success': False, 'reason': 'Controller is busy'}
+
+        self._command_time = datetime.now()
+        result = {'success': False, 'command': command.value}
+
+        try:
+            handler = self._dispatch.get(command)
+            if handler is not None:
+                result = handler(params)
+
+            self._log_command(command, params, result)
+
+        except Exception as e:
+            logging.error(f"Command execution error: {str(e)}")
+            result['reason'] = str(e)
+            self.error_count += 1
+
+        finally:
+            self._busy.release()
+
+        return result
 
     def _start_simulation(self, params: Optional[Dict]) -> Dict:
 
@@ -105,7 +246,9 @@ class SandboxController:
                 self._apply_simulation_params(params)
 
             self.simulation.state = SimulationState.RUNNING
-            self.last_update = datetime.now()
+            self.last_update = self._command_time
+            if not self._streams_state:
+                self._base_snapshot = copy.deepcopy(self.simulation.get_state())
 
             return {
                 'success': True,
@@ -119,17 +262,34 @@ class SandboxController:
 
     def _save_state(self, params: Optional[Dict]) -> Dict:
 
-        save_id = str(datetime.now().timestamp())
+        save_id = str(monotonic_stamp())
 
         try:
-            state_data = self.simulation.get_state()
-            self.save_states[save_id] = state_data
-            self._trim_save_states()  
+            os.makedirs(self.save_store_dir, exist_ok=True)
+
+            if self._streams_state:
+                path = os.path.join(self.save_store_dir, f'{save_id}.npz')
+                with open(path, 'wb') as f:
+                    self.simulation.save_to(f)
+            else:
+                state_data = self.simulation.get_state()
+                if self._base_snapshot is None:
+                    self._base_snapshot = copy.deepcopy(state_data)
+
+                diff = _diff_state(state_data, self._base_snapshot)
+
+                path = os.path.join(self.save_store_dir, f'{save_id}.pkl')
+                with open(path, 'wb') as f:
+                    pickle.dump(diff, f, protocol=pickle.HIGHEST_PROTOCOL)
+                self._cache_hot_save(save_id, diff)
+
+            self.save_states[save_id] = path
+            self._trim_save_states()
 
             return {
                 'success': True,
                 'save_id': save_id,
-                'timestamp': datetime.now()
+                'timestamp': self._command_time
             }
 
         except Exception as e:
@@ -143,13 +303,22 @@ class SandboxController:
             return {'success': False, 'reason': 'Save state not found'}
 
         try:
-            state_data = self.save_states[save_id]
-            self.simulation.set_state(state_data)
+            if self._streams_state:
+                with open(self.save_states[save_id], 'rb') as f:
+                    self.simulation.load_from(f)
+            else:
+                diff = self._hot_saves.get(save_id)
+                if diff is None:
+                    with open(self.save_states[save_id], 'rb') as f:
+                        diff = pickle.load(f)
+                    self._cache_hot_save(save_id, diff)
+
+                self.simulation.set_state(_apply_diff(self._base_snapshot, diff))
 
             return {
                 'success': True,
                 'save_id': save_id,
-                'timestamp': datetime.now()
+                'timestamp': self._command_time
             }
 
         except Exception as e:
@@ -158,10 +327,7 @@ class SandboxController:
 
     def _log_command(self, command: ControlCommand, params: Dict, result: Dict):
 
-        log_entry = {
-            'timestamp': datetime.now(),
-            'command': command.value,
-            'params': params,
-            'result': result
-        }
-        self.command_history.append(log_entry)
+        self._history_buffer.append(CommandLogEntry(self._command_time, command.value, params, result))
+
+        if len(self._history_buffer) >= self._history_buffer_limit:
+            self.flush_history()
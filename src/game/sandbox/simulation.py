@@ -1,19 +1,86 @@
 # src/game/sandbox/simulation.py
 
-from typing import Dict, List, Optional, Tuple, Any
-from dataclasses import dataclass
+from typing import BinaryIO, Dict, List, Optional, Tuple, Any
+from dataclasses import asdict, dataclass
 import numpy as np
+import json
+import pickle
 import uuid
 from enum import Enum
 import logging
 from datetime import datetime
 
-from ..ai_agents.core.agent_brain import AgentBrain
-from ..game.combat.system import CombatSystem
-from ..game.social.relationships import RelationshipSystem
-from ..game.social.faction import FactionSystem
-from ..game.world.environment import EnvironmentSystem
-from ..game.world.physics import PhysicsSystem
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    from scipy.spatial import cKDTree
+except ImportError:
+    cKDTree = None
+
+from ...ai_agents.core.agent_brain import AgentBrain, AgentBrainBatch
+from ..combat.system import CombatStats, CombatSystem
+from ..social.relationships import RelationshipSystem
+from ..social.faction import FactionSystem
+from ..world.environment import EnvironmentSystem
+from ..world.physics import PhysicsProperties, PhysicsSystem
+
+MAX_AGENTS = 4096
+AGENT_TILE = 1024
+CONTEXT_RADIUS = 25.0
+
+# Subsystems written into a save alongside the agent slot arrays
+_SAVED_SUBSYSTEMS = ('environment', 'physics', 'combat_manager', 'social_manager', 'faction_manager')
+
+def _unpack_meta(packed: bytes, meta_format: str) -> Dict:
+
+    if meta_format == 'json':
+        return json.loads(packed)
+
+    if msgpack is None:
+        raise RuntimeError('Save was written with msgpack, which is not installed')
+    return msgpack.unpackb(packed)
+
+def _advance_agents(health: np.ndarray, alive: np.ndarray) -> np.ndarray:
+
+    # Death checks for a tile of agent slots; returns the slots that died
+    np.clip(health, 0.0, None, out=health)
+
+    died = alive & (health <= 0.0)
+    alive[died] = False
+
+    return np.flatnonzero(died)
+
+class _GridIndex:
+
+    # Uniform-grid stand-in for cKDTree.query_ball_point when scipy is not installed
+    def __init__(self, points: np.ndarray, cell_size: float):
+        self.points = points
+        self.cell_size = cell_size
+        self.cells: Dict[Tuple[int, int, int], List[int]] = {}
+
+        for index, cell in enumerate(np.floor(points / cell_size).astype(np.int64).tolist()):
+            self.cells.setdefault(tuple(cell), []).append(index)
+
+    def query_ball_point(self, point: np.ndarray, r: float) -> List[int]:
+
+        cx, cy, cz = np.floor(point / self.cell_size).astype(np.int64).tolist()
+        reach = int(np.ceil(r / self.cell_size))
+        span = range(-reach, reach + 1)
+
+        candidates = [
+            index
+            for dx in span for dy in span for dz in span
+            for index in self.cells.get((cx + dx, cy + dy, cz + dz), ())
+        ]
+        if not candidates:
+            return []
+
+        candidates = np.array(candidates)
+        offsets = self.points[candidates] - point
+        return candidates[np.einsum('ij,ij->i', offsets, offsets) <= r * r].tolist()
 
 class SimulationState(Enum):
     INITIALIZING = "initializing"
@@ -22,7 +89,7 @@ class SimulationState(Enum):
     STOPPED = "stopped"
     ERROR = "error"
 
-@dataclass
+@dataclass(slots=True)
 class SimulationStats:
     active_agents: int = 0
     total_interactions: int = 0
@@ -42,7 +109,21 @@ class SandboxSimulation:
 
         self.environment = EnvironmentSystem()
         self.physics = PhysicsSystem()
-        self.agents: Dict[str, AgentBrain] = {}
+
+        # Per-agent numeric state lives in slot-indexed arrays; brains sit in the matching slot
+        # and are kept after death so the next agent spawned there reuses them. Position and
+        # velocity are owned by the agent's physics body
+        self._agent_hp = np.zeros(MAX_AGENTS, dtype=np.float32)
+        self._agent_alive = np.zeros(MAX_AGENTS, dtype=bool)
+        self._agent_faction = np.full(MAX_AGENTS, -1, dtype=np.int32)
+        self._agent_brains: List[Optional[AgentBrain]] = [None] * MAX_AGENTS
+        self._slot_ids: List[Optional[str]] = [None] * MAX_AGENTS
+        self._id_to_slot: Dict[str, int] = {}
+        self._free_slots: List[int] = list(range(MAX_AGENTS - 1, -1, -1))
+        self._slot_high_water = 0
+        # Inference requests queued by brains during a tick, evaluated together at its end
+        self.inference_batch = AgentBrainBatch()
+
         self.combat_manager = self._initialize_combat_manager()
         self.social_manager = self._initialize_social_manager()
         self.faction_manager = self._initialize_faction_manager()
@@ -52,47 +133,45 @@ class SandboxSimulation:
         self.event_log: List[Dict] = []
         self.performance_metrics: Dict[str, float] = {}
 
+        # Scratch for ticks without a caller-supplied buffer; update() returns a copy of it
+        self._tick_events_buf: List[Dict] = []
+        self._tick_metrics: Dict = {}
+
         self._initialize_simulation()
 
-    def update(self, delta_time: float) -> Dict:
+    def update(self, delta_time: float, out_events: Optional[List[Dict]] = None) -> Dict:
 
         if self.state != SimulationState.RUNNING:
             return {'success': False, 'reason': f'Simulation not running: {self.state}'}
 
         scaled_delta = delta_time * self.time_scale
-        updates = {
-            'time': self.current_time,
-            'events': [],
-            'metrics': {}
-        }
+
+        if out_events is None:
+            out_events = self._tick_events_buf
+            out_events.clear()
+
+        start_time = self.current_time
+        metrics = self._tick_metrics
+        metrics.clear()
 
         try:
 
             self._pre_update(scaled_delta)
 
-            env_updates = self.environment.update(scaled_delta)
-            physics_updates = self.physics.update(scaled_delta)
+            self.environment.update(scaled_delta, out_events)
+            self.physics.update(scaled_delta, out_events)
 
-            agent_updates = self._update_agents(scaled_delta)
+            self._update_agents(scaled_delta, out_events)
 
-            combat_updates = self._resolve_combat(scaled_delta)
+            self._resolve_combat(scaled_delta, out_events)
 
-            social_updates = self._update_social(scaled_delta)
+            self._update_social(scaled_delta, out_events)
 
-            faction_updates = self._update_factions(scaled_delta)
+            self._update_factions(scaled_delta, out_events)
 
             self._post_update(scaled_delta)
 
-            updates['events'].extend(self._collect_events(
-                env_updates,
-                physics_updates,
-                agent_updates,
-                combat_updates,
-                social_updates,
-                faction_updates
-            ))
-
-            self._update_metrics(updates['metrics'])
+            self._update_metrics(metrics)
 
             self.current_time += scaled_delta
 
@@ -101,6 +180,12 @@ class SandboxSimulation:
             self.state = SimulationState.ERROR
             return {'success': False, 'reason': str(e)}
 
+        updates = {
+            'time': start_time,
+            'events': list(out_events),
+            'metrics': dict(metrics)
+        }
+
         return {'success': True, 'updates': updates}
 
     def add_agent(self,
@@ -108,17 +193,33 @@ class SandboxSimulation:
                  initial_position: Tuple[float, float, float],
                  properties: Dict) -> Dict:
 
-        agent_id = str(uuid.uuid4())
+        if not self._free_slots:
+            return {'success': False, 'reason': 'Agent capacity reached'}
 
-        agent = AgentBrain(agent_id=agent_id, properties=properties)
+        agent_id = str(uuid.uuid4())
 
-        combat_component = CombatSystem(agent_id=agent_id)
+        combat_component = CombatSystem(agent_id=agent_id, initial_stats=CombatStats())
         social_component = RelationshipSystem(agent_id=agent_id)
 
         physics_properties = self._generate_physics_properties(agent_type)
         self.physics.add_object(agent_id, physics_properties, initial_position)
 
-        self.agents[agent_id] = agent
+        slot = self._free_slots.pop()
+        self._slot_high_water = max(self._slot_high_water, slot + 1)
+
+        agent = self._agent_brains[slot]
+        if agent is None:
+            agent = AgentBrain(properties.get('personality', {}))
+        else:
+            agent.reinit(properties.get('personality', {}))
+
+        self.physics.set_velocity(agent_id, properties.get('velocity', (0.0, 0.0, 0.0)))
+        self._agent_hp[slot] = properties.get('health', 100.0)
+        self._agent_alive[slot] = True
+        self._agent_faction[slot] = properties.get('faction_index', -1)
+        self._agent_brains[slot] = agent
+        self._slot_ids[slot] = agent_id
+        self._id_to_slot[agent_id] = slot
         self.stats.active_agents += 1
 
         return {
@@ -131,29 +232,221 @@ class SandboxSimulation:
             }
         }
 
-    def _update_agents(self, delta_time: float) -> List[Dict]:
+    def remove_agent(self, agent_id: str) -> Dict:
+
+        slot = self._id_to_slot.get(agent_id)
+        if slot is None:
+            return {'success': False, 'reason': 'Agent not found'}
+
+        if self._agent_alive[slot]:
+            self._agent_alive[slot] = False
+            self.stats.active_agents -= 1
 
-        updates = []
+        self._release_slot(slot)
+        return {'success': True, 'agent_id': agent_id}
 
-        for agent_id, agent in self.agents.items():
+    def _release_slot(self, slot: int):
 
-            context = self._get_agent_context(agent_id)
+        agent_id = self._slot_ids[slot]
+        del self._id_to_slot[agent_id]
+        self._slot_ids[slot] = None
+        self.physics.remove_object(agent_id)
+        self._free_slots.append(slot)
 
-            agent_update = agent.update(delta_time, context)
+    def _pre_update(self, delta_time: float):
 
-            self._process_agent_decisions(agent_id, agent_update)
+        # Neighbour lookups for the whole tick go through one index built here
+        self._tick_live_slots = np.flatnonzero(self._agent_alive[:self._slot_high_water])
+        points = self._agent_positions(self._tick_live_slots)
+
+        if cKDTree is not None:
+            self._tick_spatial = cKDTree(points)
+        else:
+            self._tick_spatial = _GridIndex(points, CONTEXT_RADIUS)
+
+    def _get_agent_context(self, agent_id: str) -> Dict:
+
+        slot = self._id_to_slot[agent_id]
+        position = self.physics.pos[self.physics.rows([agent_id])[0]].copy()
+        nearby = self._tick_live_slots[self._tick_spatial.query_ball_point(position, CONTEXT_RADIUS)]
+
+        return {
+            'position': position,
+            'health': float(self._agent_hp[slot]),
+            'faction_index': int(self._agent_faction[slot]),
+            'nearby_agents': [
+                self._slot_ids[other] for other in nearby
+                if other != slot and self._agent_alive[other]
+            ]
+        }
 
-            updates.append({
-                'agent_id': agent_id,
-                'update': agent_update
-            })
+    def _agent_positions(self, slots: np.ndarray) -> np.ndarray:
 
-        return updates
+        return self.physics.pos[self.physics.rows([self._slot_ids[slot] for slot in slots])]
 
-    def _resolve_combat(self, delta_time: float) -> List[Dict]:
+    def _apply_config(self, config: Dict):
 
-        combat_events = []
+        # Only keys that differ are written, so a forked copy keeps sharing the rest of its pages
+        for key, value in config.items():
+            if self.config.get(key) != value:
+                self.config[key] = value
 
+        self.time_scale = self.config.get('time_scale', self.time_scale)
+
+    def save_to(self, fp: BinaryIO):
+
+        # Slot arrays go in as-is; the small non-array state rides along as one packed blob,
+        # tagged with its encoding so it reads back whichever serializer is installed later
+        high_water = self._slot_high_water
+        meta = {
+            'simulation_id': self.simulation_id,
+            'current_time': self.current_time,
+            'time_scale': self.time_scale,
+            'stats': asdict(self.stats),
+            'slot_ids': self._slot_ids[:high_water],
+            'personalities': [
+                brain.personality if agent_id is not None and brain is not None else None
+                for agent_id, brain in zip(self._slot_ids[:high_water], self._agent_brains[:high_water])
+            ]
+        }
+
+        if msgpack is not None:
+            meta_format = 'msgpack'
+            packed = msgpack.packb(meta)
+        else:
+            meta_format = 'json'
+            packed = json.dumps(meta).encode()
+
+        # Environment, physics, combat, social and faction state have no array form; pickled whole
+        subsystems = pickle.dumps(
+            {name: getattr(self, name) for name in _SAVED_SUBSYSTEMS},
+            protocol=pickle.HIGHEST_PROTOCOL
+        )
+
+        # Positions and velocities are copied out of physics for slots holding an agent
+        occupied = np.array([agent_id is not None for agent_id in self._slot_ids[:high_water]], dtype=bool)
+        occupied_slots = np.flatnonzero(occupied)
+        rows = self.physics.rows([self._slot_ids[slot] for slot in occupied_slots])
+        pos = np.zeros((high_water, 3), dtype=np.float32)
+        vel = np.zeros((high_water, 3), dtype=np.float32)
+        pos[occupied_slots] = self.physics.pos[rows]
+        vel[occupied_slots] = self.physics.vel[rows]
+
+        np.savez(
+            fp,
+            pos=pos,
+            vel=vel,
+            hp=self._agent_hp[:high_water],
+            alive=self._agent_alive[:high_water],
+            faction=self._agent_faction[:high_water],
+            meta=np.frombuffer(packed, dtype=np.uint8),
+            meta_format=np.array(meta_format),
+            subsystems=np.frombuffer(subsystems, dtype=np.uint8)
+        )
+
+    def load_from(self, fp: BinaryIO):
+
+        with np.load(fp) as data:
+            meta = _unpack_meta(data['meta'].tobytes(), str(data['meta_format']))
+            subsystems = pickle.loads(data['subsystems'].tobytes())
+            high_water = len(meta['slot_ids'])
+
+            for name, column in (('hp', self._agent_hp), ('alive', self._agent_alive),
+                                 ('faction', self._agent_faction)):
+                column[:high_water] = data[name]
+            self._agent_alive[high_water:] = False
+            pos = data['pos']
+            vel = data['vel']
+
+        for name in _SAVED_SUBSYSTEMS:
+            setattr(self, name, subsystems[name])
+
+        self.simulation_id = meta['simulation_id']
+        self.current_time = meta['current_time']
+        self.time_scale = meta['time_scale']
+        self.stats = SimulationStats(**meta['stats'])
+
+        self._slot_ids = meta['slot_ids'] + [None] * (MAX_AGENTS - high_water)
+        self._id_to_slot = {
+            agent_id: slot for slot, agent_id in enumerate(self._slot_ids) if agent_id is not None
+        }
+        self._free_slots = [slot for slot in range(MAX_AGENTS - 1, -1, -1) if self._slot_ids[slot] is None]
+        self._slot_high_water = high_water
+
+        for slot, personality in enumerate(meta['personalities']):
+            if self._slot_ids[slot] is None:
+                continue
+
+            brain = self._agent_brains[slot]
+            if brain is None:
+                self._agent_brains[slot] = AgentBrain(personality or {})
+            else:
+                brain.reinit(personality or {})
+
+        self._sync_physics_rows(pos, vel)
+
+    def _sync_physics_rows(self, pos: np.ndarray, vel: np.ndarray):
+
+        # Physics bodies must match the restored agents one to one; bodies missing from the
+        # restored physics state are rebuilt from the saved slot positions
+        physics = self.physics
+        for agent_id in physics.object_ids:
+            if agent_id not in self._id_to_slot:
+                physics.remove_object(agent_id)
+
+        for agent_id, slot in self._id_to_slot.items():
+            if not physics.has_object(agent_id):
+                physics.add_object(
+                    agent_id,
+                    PhysicsProperties(),
+                    tuple(pos[slot].tolist())
+                )
+                physics.set_velocity(agent_id, tuple(vel[slot].tolist()))
+
+    def _update_agents(self, delta_time: float, out_events: List[Dict]):
+
+        # Deaths and decisions run one tile at a time so the tile stays cached across stages
+        high_water = self._slot_high_water
+
+        for start in range(0, high_water, AGENT_TILE):
+            stop = min(start + AGENT_TILE, high_water)
+
+            died = _advance_agents(
+                self._agent_hp[start:stop],
+                self._agent_alive[start:stop]
+            ) + start
+            self.stats.active_agents -= len(died)
+
+            for slot in died:
+                out_events.append({'agent_id': self._slot_ids[slot], 'update': {'died': True}})
+                self._release_slot(slot)
+
+            live = np.flatnonzero(self._agent_alive[start:stop]) + start
+            agent_ids = [self._slot_ids[slot] for slot in live]
+            brains = [self._agent_brains[slot] for slot in live]
+
+            # Every live brain in the tile perceives and decides in one batched pass per network
+            decisions = self.inference_batch.process_inputs(
+                brains,
+                [self._get_agent_context(agent_id) for agent_id in agent_ids]
+            )
+
+            for agent_id, brain, decision in zip(agent_ids, brains, decisions):
+                agent_update = brain.update(delta_time)
+                agent_update['updates']['decisions'].append(decision['decision'])
+
+                self._process_agent_decisions(agent_id, agent_update)
+                out_events.append({
+                    'agent_id': agent_id,
+                    'update': agent_update
+                })
+
+        # Anything submitted through AgentBrain.infer during the tick resolves here
+        self.inference_batch.flush()
+
+    def _resolve_combat(self, delta_time: float, out_events: List[Dict]):
+
+        first_event = len(out_events)
         engagements = self._get_active_combat()
 
         for engagement in engagements:
@@ -164,15 +457,13 @@ class SandboxSimulation:
             )
 
             self._apply_combat_results(result)
-            combat_events.append(result)
-
-        self.stats.combat_events += len(combat_events)
-        return combat_events
+            out_events.append(result)
 
-    def _update_social(self, delta_time: float) -> List[Dict]:
+        self.stats.combat_events += len(out_events) - first_event
 
-        social_events = []
+    def _update_social(self, delta_time: float, out_events: List[Dict]):
 
+        first_event = len(out_events)
         interactions = self._get_pending_interactions()
 
         for interaction in interactions:
@@ -184,7 +475,6 @@ class SandboxSimulation:
             )
 
             self._apply_social_results(result)
-            social_events.append(result)
+            out_events.append(result)
 
-        self.stats.social_events += len(social_events)
-        return social_events
\ No newline at end of file
+        self.stats.social_events += len(out_events) - first_event
\ No newline at end of file
@@ -0,0 +1,41 @@
+# src/game/sandbox/zygote.py
+
+from typing import Any, Callable, Dict, Optional
+import multiprocessing
+import uuid
+
+from .simulation import SandboxSimulation
+
+# Built once per parent process; forked workers inherit it copy-on-write
+_baseline: Optional[SandboxSimulation] = None
+
+def _warm() -> SandboxSimulation:
+
+    global _baseline
+
+    if _baseline is None:
+        _baseline = SandboxSimulation()
+    return _baseline
+
+def _run_worker(config: Optional[Dict], worker: Callable[[SandboxSimulation], Any]):
+
+    simulation = _warm()
+    simulation.simulation_id = str(uuid.uuid4())
+    simulation._apply_config(config or {})
+
+    worker(simulation)
+
+def spawn(config: Optional[Dict],
+          worker: Callable[[SandboxSimulation], Any]) -> multiprocessing.Process:
+
+    # Without fork each worker has to build its own simulation from scratch
+    if 'fork' in multiprocessing.get_all_start_methods():
+        _warm()
+        context = multiprocessing.get_context('fork')
+    else:
+        context = multiprocessing.get_context('spawn')
+
+    process = context.Process(target=_run_worker, args=(config, worker), daemon=True)
+    process.start()
+
+    return process
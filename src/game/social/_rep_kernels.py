@@ -0,0 +1,50 @@
+# src/game/social/_rep_kernels.py
+
+import numpy as np
+
+from .._jit import prange, select_kernel
+
+def _decay_and_classify_numpy(matrix: np.ndarray,
+                              rates: np.ndarray,
+                              baseline: float,
+                              delta_time: float,
+                              thresholds: np.ndarray,
+                              min_change: float,
+                              out_old: np.ndarray,
+                              out_tiers: np.ndarray,
+                              out_changed: np.ndarray):
+
+    out_old[...] = matrix
+    matrix -= (matrix - baseline) * (rates * delta_time)
+    np.clip(matrix, 0.0, 100.0, out=matrix)
+
+    np.greater(np.abs(matrix - out_old), min_change, out=out_changed)
+    out_tiers[...] = np.searchsorted(thresholds, matrix, side='right')
+
+def _decay_and_classify_loops(matrix: np.ndarray,
+                              rates: np.ndarray,
+                              baseline: float,
+                              delta_time: float,
+                              thresholds: np.ndarray,
+                              min_change: float,
+                              out_old: np.ndarray,
+                              out_tiers: np.ndarray,
+                              out_changed: np.ndarray):
+
+    # Decay, clip, change test and tier lookup fused into one pass per value
+    for row in prange(matrix.shape[0]):
+        for column in range(matrix.shape[1]):
+            old = matrix[row, column]
+            value = old - (old - baseline) * (rates[column] * delta_time)
+            value = 0.0 if value < 0.0 else (100.0 if value > 100.0 else value)
+
+            tier = 0
+            while tier < thresholds.shape[0] and value >= thresholds[tier]:
+                tier += 1
+
+            out_old[row, column] = old
+            out_changed[row, column] = abs(value - old) > min_change
+            out_tiers[row, column] = tier
+            matrix[row, column] = value
+
+decay_and_classify = select_kernel(_decay_and_classify_loops, _decay_and_classify_numpy)
@@ -3,16 +3,26 @@
 from typing import Dict, List, Optional, Set
 import numpy as np
 from enum import Enum
+from types import MappingProxyType
 from dataclasses import dataclass
 import uuid
 
+from ..ids import monotonic_stamp, stamp_to_datetime
+from .faction_system import _RANK_PERMISSIONS as _SYSTEM_RANK_PERMISSIONS
+
 class FactionType(Enum):
-    COMBAT = "combat"    TRADE = "trade"
+    COMBAT = "combat"
+    TRADE = "trade"
     EXPLORATION = "exploration"
     SPIRITUAL = "spiritual"
     TECHNOLOGICAL = "technological"
 
-@dataclass
+# Same tables as faction_system, keyed by the rank strings this module uses
+_RANK_PERMISSIONS = {rank.value: permissions for rank, permissions in _SYSTEM_RANK_PERMISSIONS.items()}
+
+TERRITORY_CAPACITY = 16
+
+@dataclass(slots=True)
 class FactionStats:
     influence: float = 100.0
     resources: float = 1000.0
@@ -31,18 +41,46 @@ class FactionSystem:
         self.faction_type = faction_type
         self.stats = initial_stats or FactionStats()
 
+        # Read once per tick and shared by every join/claim in it; converted only for display
+        self._now_cache = monotonic_stamp()
+
         self.members: Set[str] = set()
         self.leaders: Set[str] = set()
         self.allies: Dict[str, float] = {}  # faction_id: alliance_strength
         self.rivals: Dict[str, float] = {}  # faction_id: rivalry_strength
 
-        self.controlled_territories: Dict[str, Dict] = {}
-        self.resource_production: Dict[str, float] = {}
+        # Territories live in parallel arrays indexed by claim order; resource names map to columns
+        self._terr_idx: Dict[str, int] = {}
+        self._terr_ids: List[str] = []
+        self._terr_claimed = np.zeros(TERRITORY_CAPACITY, dtype=np.int64)
+        self._terr_dev = np.zeros(TERRITORY_CAPACITY, dtype=np.int32)
+        self._terr_res = np.zeros((TERRITORY_CAPACITY, 0), dtype=np.float32)
+        self._terr_prod = np.zeros((TERRITORY_CAPACITY, 0), dtype=np.float32)
+        self._terr_defenders: List[List[str]] = []
+        self._terr_projects: List[List[Dict]] = []
+        self._resource_idx: Dict[str, int] = {}
         self.tech_tree_progress: Dict[str, float] = {}
 
         self.policies: Dict[str, Dict] = {}
         self.active_projects: List[Dict] = []
         self.faction_history: List[Dict] = []
+        # Changes made between ticks, handed to the tick's event buffer on the next update
+        self._pending_events: List[Dict] = []
+
+    def update(self, delta_time: float, out_events: Optional[List[Dict]] = None) -> Dict:
+
+        self._now_cache = monotonic_stamp()
+
+        if self._pending_events:
+            if out_events is not None:
+                out_events.extend(self._pending_events)
+            self._pending_events.clear()
+
+        return {'success': True}
+
+    def _record_event(self, event_type: str, **details):
+
+        self._pending_events.append({'type': event_type, 'faction_id': self.faction_id, **details})
 
     def add_member(self,
                   agent_id: str,
@@ -54,7 +92,7 @@ class FactionSystem:
 
         member_data = {
             'rank': rank,
-            'joined_date': np.datetime64('now'),
+            'joined_ts': self._now_cache,
             'contribution': contribution,
             'achievements': [],
             'permissions': self._get_rank_permissions(rank)
@@ -65,6 +103,7 @@ class FactionSystem:
             self.leaders.add(agent_id)
 
         self.stats.members += 1
+        self._record_event('member_joined', agent_id=agent_id, rank=rank)
 
         return {
             'success': True,
@@ -77,39 +116,94 @@ class FactionSystem:
                         resources: Optional[Dict] = None) -> Dict:
 
         if action == "claim":
-            if territory_id in self.controlled_territories:
+            if territory_id in self._terr_idx:
                 return {'success': False, 'reason': 'Territory already claimed'}
 
-            territory_data = {
-                'claimed_date': np.datetime64('now'),
-                'resources': resources or {},
-                'development_level': 1,
-                'defenders': [],
-                'projects': []
-            }
+            idx = len(self._terr_ids)
+            if idx == len(self._terr_dev):
+                self._grow_territories()
+
+            self._terr_idx[territory_id] = idx
+            self._terr_ids.append(territory_id)
+            self._terr_claimed[idx] = self._now_cache
+            self._terr_dev[idx] = 1
+            self._terr_defenders.append([])
+            self._terr_projects.append([])
+
+            for resource, amount in (resources or {}).items():
+                column = self._resource_column(resource)
+                self._terr_res[idx, column] = amount
+            self._update_resource_production(idx)
 
-            self.controlled_territories[territory_id] = territory_data
             self.stats.territory += 1
+            self._record_event('territory_claimed', territory_id=territory_id)
 
         elif action == "develop":
-            if territory_id not in self.controlled_territories:
+            idx = self._terr_idx.get(territory_id)
+            if idx is None:
                 return {'success': False, 'reason': 'Territory not controlled'}
 
-            territory = self.controlled_territories[territory_id]
-            development_cost = self._calculate_development_cost(territory)
+            development_cost = self._calculate_development_cost(idx)
 
             if self.stats.resources >= development_cost:
                 self.stats.resources -= development_cost
-                territory['development_level'] += 1
-                self._update_resource_production(territory_id)
+                self._terr_dev[idx] += 1
+                self._update_resource_production(idx)
+                self._record_event('territory_developed', territory_id=territory_id, level=int(self._terr_dev[idx]))
             else:
                 return {'success': False, 'reason': 'Insufficient resources'}
 
         return {
             'success': True,
-            'territory_data': self.controlled_territories.get(territory_id, {})
+            'territory_data': self.territory_data(territory_id)
+        }
+
+    @property
+    def resource_production(self) -> Dict[str, float]:
+
+        totals = self._terr_prod[:len(self._terr_ids)].sum(axis=0)
+        return {resource: float(totals[column]) for resource, column in self._resource_idx.items()}
+
+    def territory_data(self, territory_id: str) -> Dict:
+
+        idx = self._terr_idx.get(territory_id)
+        if idx is None:
+            return {}
+
+        return {
+            'claimed_date': stamp_to_datetime(int(self._terr_claimed[idx])),
+            'resources': {
+                resource: float(self._terr_res[idx, column])
+                for resource, column in self._resource_idx.items()
+                if self._terr_res[idx, column]
+            },
+            'development_level': int(self._terr_dev[idx]),
+            'defenders': self._terr_defenders[idx],
+            'projects': self._terr_projects[idx]
         }
 
+    def _update_resource_production(self, idx: int):
+        self._terr_prod[idx] = self._terr_res[idx] * self._terr_dev[idx]
+
+    def _resource_column(self, resource: str) -> int:
+
+        column = self._resource_idx.get(resource)
+        if column is None:
+            column = len(self._resource_idx)
+            self._resource_idx[resource] = column
+            self._terr_res = np.pad(self._terr_res, ((0, 0), (0, 1)))
+            self._terr_prod = np.pad(self._terr_prod, ((0, 0), (0, 1)))
+
+        return column
+
+    def _grow_territories(self):
+
+        rows = len(self._terr_dev)
+        self._terr_claimed = np.pad(self._terr_claimed, (0, rows))
+        self._terr_dev = np.pad(self._terr_dev, (0, rows))
+        self._terr_res = np.pad(self._terr_res, ((0, rows), (0, 0)))
+        self._terr_prod = np.pad(self._terr_prod, ((0, rows), (0, 0)))
+
     def form_alliance(self,
                      target_faction_id: str,
                      alliance_terms: Dict) -> Dict:
@@ -122,6 +216,7 @@ class FactionSystem:
         self.allies[target_faction_id] = alliance_strength
 
         self._apply_alliance_benefits(target_faction_id, alliance_terms)
+        self._record_event('alliance_formed', other_id=target_faction_id, value=alliance_strength)
 
         return {
             'success': True,
@@ -141,6 +236,7 @@ class FactionSystem:
         self.rivals[target_faction_id] = rivalry_strength
 
         self._apply_rivalry_effects(target_faction_id)
+        self._record_event('rivalry_declared', other_id=target_faction_id, value=rivalry_strength)
 
         return {
             'success': True,
@@ -148,6 +244,9 @@ class FactionSystem:
             'reason': rivalry_reason
         }
 
+    def _get_rank_permissions(self, rank: str) -> MappingProxyType:
+        return _RANK_PERMISSIONS.get(rank, _RANK_PERMISSIONS['outsider'])
+
     def _calculate_alliance_strength(self, terms: Dict) -> float:
 
         strength = 0.5  # Base strength
@@ -1,12 +1,22 @@
 # src/game/social/faction_system.py
 
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, List, Optional, Set, Tuple, Any
 from enum import Enum
+from types import MappingProxyType
 from dataclasses import dataclass
 import uuid
 from datetime import datetime
 import logging
 import numpy as np
+
+from .._jit import prange, select_kernel
+
+FACTION_CAPACITY = 64
+RELATIONSHIP_DRIFT_RATE = 0.01
+REL_UPDATE_INTERVAL = 0.25
+
+INFLUENCE_COMPONENTS = ('territory', 'resource', 'diplomatic', 'member')
+
 class FactionType(Enum):
     MILITARY = "military"
     MERCHANT = "merchant"
@@ -15,6 +25,47 @@ class FactionType(Enum):
     NEUTRAL = "neutral"
     ROGUE = "rogue"
 
+_TYPE_INDEX = {faction_type: i for i, faction_type in enumerate(FactionType)}
+
+# Resting relationship each pair of faction types drifts toward, in FactionType order
+TYPE_AFFINITY = np.array([
+    #  MIL   MER   SPI   SCI   NEU   ROG
+    [ 0.2,  0.0, -0.1,  0.1,  0.0, -0.3],
+    [ 0.0,  0.2,  0.0,  0.1,  0.1, -0.3],
+    [-0.1,  0.0,  0.2,  0.0,  0.1, -0.2],
+    [ 0.1,  0.1,  0.0,  0.2,  0.0, -0.2],
+    [ 0.0,  0.1,  0.1,  0.0,  0.0, -0.1],
+    [-0.3, -0.3, -0.2, -0.2, -0.1,  0.1]
+], dtype=np.float32)
+
+def _drift_relationships_numpy(rel: np.ndarray,
+                               types: np.ndarray,
+                               affinity: np.ndarray,
+                               rate_dt: float):
+
+    rel += (affinity[types[:, None], types[None, :]] - rel) * rate_dt
+    np.clip(rel, -1.0, 1.0, out=rel)
+    np.fill_diagonal(rel, 0.0)
+
+def _drift_relationships_loops(rel: np.ndarray,
+                               types: np.ndarray,
+                               affinity: np.ndarray,
+                               rate_dt: float):
+
+    n = rel.shape[0]
+
+    for i in prange(n):
+        type_i = types[i]
+        for j in range(n):
+            if i == j:
+                rel[i, j] = 0.0
+                continue
+
+            value = rel[i, j] + (affinity[type_i, types[j]] - rel[i, j]) * rate_dt
+            rel[i, j] = min(max(value, -1.0), 1.0)
+
+_drift_relationships = select_kernel(_drift_relationships_loops, _drift_relationships_numpy)
+
 class FactionRank(Enum):
     LEADER = "leader"
     ELDER = "elder"
@@ -30,7 +81,50 @@ class DiplomaticStatus(Enum):
     HOSTILE = "hostile"
     WAR = "war"
 
-@dataclass
+# Shared read-only tables; callers that need to mutate take a copy
+_NO_PERMISSIONS = MappingProxyType(dict.fromkeys(
+    ('invite', 'kick', 'promote', 'manage_territory', 'manage_resources', 'diplomacy'),
+    False
+))
+
+_RANK_PERMISSIONS = {
+    FactionRank.LEADER: MappingProxyType({
+        'invite': True,
+        'kick': True,
+        'promote': True,
+        'manage_territory': True,
+        'manage_resources': True,
+        'diplomacy': True
+    }),
+    FactionRank.ELDER: MappingProxyType({
+        'invite': True,
+        'kick': True,
+        'promote': True,
+        'manage_territory': True,
+        'manage_resources': True,
+        'diplomacy': False
+    }),
+    FactionRank.VETERAN: MappingProxyType({
+        'invite': True,
+        'kick': False,
+        'promote': False,
+        'manage_territory': True,
+        'manage_resources': False,
+        'diplomacy': False
+    }),
+    FactionRank.MEMBER: _NO_PERMISSIONS,
+    FactionRank.RECRUIT: _NO_PERMISSIONS,
+    FactionRank.OUTSIDER: _NO_PERMISSIONS
+}
+
+_DEFAULT_POLICIES = MappingProxyType({
+    'recruitment': 'open',
+    'tax_rate': 0.1,
+    'diplomatic_stance': DiplomaticStatus.NEUTRAL,
+    'territory_expansion': True
+})
+
+@dataclass(slots=True)
 class FactionMember:
     id: str
     rank: FactionRank
@@ -42,18 +136,35 @@ class FactionMember:
 
 class FactionSystem:
 
-    def __init__(self):
-        self.factions: Dict[str, Dict] = {}
-        self.relationships: Dict[str, Dict[str, float]] = {}
+    def __init__(self, type_affinity: Optional[np.ndarray] = None):
+        # Factions are keyed internally by a small int slot; the UUID is only for callers
+        self.factions: Dict[int, Dict] = {}
+        self._uuid_to_id: Dict[str, int] = {}
+        self._faction_ids: List[str] = []
+
+        # Pairwise relationships live in one matrix indexed by faction slot
+        self._faction_type_vec = np.zeros(FACTION_CAPACITY, dtype=np.int8)
+        self._rel_matrix = np.zeros((FACTION_CAPACITY, FACTION_CAPACITY), dtype=np.float32)
+        self._allied_mask = np.zeros((FACTION_CAPACITY, FACTION_CAPACITY), dtype=bool)
+        self._conflict_mask = np.zeros((FACTION_CAPACITY, FACTION_CAPACITY), dtype=bool)
+        self._time_since_rel_update = 0.0
+        # Resting relationship per pair of faction types; TYPE_AFFINITY unless the caller supplies one
+        self.type_affinity = np.asarray(type_affinity if type_affinity is not None else TYPE_AFFINITY, dtype=np.float32)
+        if self.type_affinity.shape != TYPE_AFFINITY.shape:
+            raise ValueError(f'type_affinity must have shape {TYPE_AFFINITY.shape}')
         self.alliance_threshold = 0.7
         self.conflict_threshold = -0.3
 
-        self.faction_history: Dict[str, List[Dict]] = {}
+        self.faction_history: Dict[int, List[Dict]] = {}
         self.diplomatic_events: List[Dict] = []
         self.territory_control: Dict[str, List[str]] = {}
 
-        self.influence_scores: Dict[str, float] = {}
-        self.resource_pools: Dict[str, Dict[str, int]] = {}
+        self.influence_scores: Dict[int, float] = {}
+        # Influence components are only recomputed after something touched their inputs
+        self._influence_dirty: Dict[int, Set[str]] = {}
+        self._influence_cache: Dict[int, Dict[str, float]] = {}
+        self._influence_pending: Set[int] = set()
+        self.resource_pools: Dict[int, Dict[str, int]] = {}
 
     def create_faction(self,
                       name: str,
@@ -63,6 +174,7 @@ class FactionSystem:
 
         try:
             faction_id = str(uuid.uuid4())
+            fid = self._initialize_relationships(faction_id, faction_type)
 
             faction = {
                 'id': faction_id,
@@ -74,7 +186,7 @@ class FactionSystem:
                 'resources': initial_resources or {},
                 'territory': [],
                 'relationships': {},
-                'policies': self._default_policies(),
+                'policies': dict(_DEFAULT_POLICIES),
                 'stats': {
                     'influence': 0.0,
                     'member_count': 1,
@@ -82,11 +194,13 @@ class FactionSystem:
                 }
             }
 
-            self._add_member(faction_id, leader_id, FactionRank.LEADER)
+            self._add_member(fid, leader_id, FactionRank.LEADER)
 
-            self._initialize_relationships(faction_id)
-
-            self.factions[faction_id] = faction
+            self.factions[fid] = faction
+            self._influence_cache[fid] = dict.fromkeys(INFLUENCE_COMPONENTS, 0.0)
+            self._influence_dirty[fid] = set()
+            for component in INFLUENCE_COMPONENTS:
+                self._mark_influence_dirty(fid, component)
 
             return {
                 'success': True,
@@ -108,15 +222,22 @@ class FactionSystem:
 
         try:
 
-            self._update_relationships(delta_time)
+            # Relationship drift is slow, so it runs on the accumulated time every REL_UPDATE_INTERVAL
+            self._time_since_rel_update += delta_time
+            relationships_updated = self._time_since_rel_update >= REL_UPDATE_INTERVAL
+            if relationships_updated:
+                self._update_relationships(self._time_since_rel_update)
+                self._time_since_rel_update = 0.0
 
             self._update_resources(delta_time)
 
             self._update_territories(delta_time)
 
-            self._update_influence_scores()
+            if self._influence_pending:
+                self._update_influence_scores()
 
-            self._check_diplomatic_events(updates)
+            if relationships_updated:
+                self._check_diplomatic_events(updates)
 
             return {'success': True, 'updates': updates}
 
@@ -130,35 +251,43 @@ class FactionSystem:
                                action_type: str,
                                details: Dict) -> Dict:
 
+        initiator = self._uuid_to_id.get(initiator_id)
+        target = self._uuid_to_id.get(target_id)
+        if initiator is None or target is None:
+            return {'success': False, 'reason': 'Faction not found'}
+
         try:
             if not self._validate_diplomatic_action(
-                initiator_id,
-                target_id,
+                initiator,
+                target,
                 action_type,
                 details
             ):
                 return {'success': False, 'reason': 'Invalid diplomatic action'}
 
             result = self._execute_diplomatic_action(
-                initiator_id,
-                target_id,
+                initiator,
+                target,
                 action_type,
                 details
             )
 
             self._update_relationship_from_action(
-                initiator_id,
-                target_id,
+                initiator,
+                target,
                 action_type,
                 result
             )
 
+            self._mark_influence_dirty(initiator, 'diplomatic')
+            self._mark_influence_dirty(target, 'diplomatic')
+
             return {
                 'success': True,
                 'result': result,
                 'relationship_change': self._get_relationship_change(
-                    initiator_id,
-                    target_id
+                    initiator,
+                    target
                 )
             }
 
@@ -170,16 +299,20 @@ class FactionSystem:
                         territory_id: str,
                         action: str) -> Dict:
 
+        fid = self._uuid_to_id.get(faction_id)
+        if fid is None:
+            return {'success': False, 'reason': 'Faction not found'}
+
         try:
             if action == "claim":
-                result = self._claim_territory(faction_id, territory_id)
+                result = self._claim_territory(fid, territory_id)
             elif action == "abandon":
-                result = self._abandon_territory(faction_id, territory_id)
+                result = self._abandon_territory(fid, territory_id)
             else:
                 return {'success': False, 'reason': 'Invalid territory action'}
 
             if result['success']:
-                self._update_influence_from_territory(faction_id)
+                self._mark_influence_dirty(fid, 'territory')
 
             return result
 
@@ -192,62 +325,109 @@ class FactionSystem:
                         amount: int,
                         action: str) -> Dict:
 
+        fid = self._uuid_to_id.get(faction_id)
+        if fid is None:
+            return {'success': False, 'reason': 'Faction not found'}
+
         try:
             if action == "add":
-                result = self._add_resources(faction_id, resource_type, amount)
+                result = self._add_resources(fid, resource_type, amount)
             elif action == "remove":
-                result = self._remove_resources(faction_id, resource_type, amount)
+                result = self._remove_resources(fid, resource_type, amount)
             elif action == "trade":
-                result = self._trade_resources(faction_id, resource_type, amount)
+                result = self._trade_resources(fid, resource_type, amount)
             else:
                 return {'success': False, 'reason': 'Invalid resource action'}
 
             if result['success']:
-                self._update_faction_stats(faction_id)
+                self._update_faction_stats(fid)
+                self._mark_influence_dirty(fid, 'resource')
 
             return result
 
         except Exception as e:
             return {'success': False, 'reason': str(e)}
 
+    def _get_rank_permissions(self, rank: FactionRank) -> MappingProxyType:
+        return _RANK_PERMISSIONS[rank]
+
+    def get_relationship(self, faction_id: str, other_id: str) -> float:
+
+        return float(self._rel_matrix[self._uuid_to_id[faction_id], self._uuid_to_id[other_id]])
+
+    def _initialize_relationships(self, faction_id: str, faction_type: FactionType) -> int:
+
+        fid = len(self._faction_ids)
+        if fid == len(self._faction_type_vec):
+            self._grow_relationships()
+
+        self._uuid_to_id[faction_id] = fid
+        self._faction_ids.append(faction_id)
+        self._faction_type_vec[fid] = _TYPE_INDEX[faction_type]
+
+        return fid
+
+    def _grow_relationships(self):
+
+        old = len(self._faction_type_vec)
+        new = old * 2
+
+        self._faction_type_vec = np.resize(self._faction_type_vec, new)
+        for name in ('_rel_matrix', '_allied_mask', '_conflict_mask'):
+            matrix = getattr(self, name)
+            grown = np.zeros((new, new), dtype=matrix.dtype)
+            grown[:old, :old] = matrix
+            setattr(self, name, grown)
+
     def _update_relationships(self, delta_time: float):
 
-        for faction_id in self.factions:
-            for other_id in self.factions:
-                if faction_id != other_id:
+        n = len(self._faction_ids)
+        if n < 2:
+            return
+
+        rel = self._rel_matrix[:n, :n]
+        _drift_relationships(rel, self._faction_type_vec[:n], self.type_affinity, RELATIONSHIP_DRIFT_RATE * delta_time)
 
-                    change = self._calculate_natural_relationship_change(
-                        faction_id,
-                        other_id,
-                        delta_time
-                    )
+        self._check_relationship_thresholds(rel, n)
 
-                    self._apply_relationship_change(
-                        faction_id,
-                        other_id,
-                        change
-                    )
+    def _check_relationship_thresholds(self, rel: np.ndarray, n: int):
 
-                    self._check_relationship_thresholds(
-                        faction_id,
-                        other_id
-                    )
+        allied = rel > self.alliance_threshold
+        conflict = rel < self.conflict_threshold
+
+        # Only edges that crossed a threshold this tick become events
+        for event_type, mask, previous in (
+            ('alliance_threshold', allied, self._allied_mask[:n, :n]),
+            ('conflict_threshold', conflict, self._conflict_mask[:n, :n])
+        ):
+            for i, j in np.argwhere(mask & ~previous):
+                self.diplomatic_events.append({
+                    'type': event_type,
+                    'faction_id': self._faction_ids[i],
+                    'other_id': self._faction_ids[j],
+                    'value': float(rel[i, j])
+                })
+            previous[:] = mask
+
+    def _mark_influence_dirty(self, fid: int, component: str):
+
+        self._influence_dirty[fid].add(component)
+        self._influence_pending.add(fid)
 
     def _update_influence_scores(self):
 
-        for faction_id, faction in self.factions.items():
+        for fid in self._influence_pending:
+            dirty = self._influence_dirty[fid]
+            cache = self._influence_cache[fid]
+            total_influence = self.influence_scores.get(fid, 0.0)
 
-            territory_influence = self._calculate_territory_influence(faction_id)
-            resource_influence = self._calculate_resource_influence(faction_id)
-            diplomatic_influence = self._calculate_diplomatic_influence(faction_id)
-            member_influence = self._calculate_member_influence(faction_id)
+            for component in dirty:
+                value = getattr(self, f'_calculate_{component}_influence')(fid)
+                total_influence += value - cache[component]
+                cache[component] = value
+            dirty.clear()
 
-            total_influence = (
-                territory_influence +
-                resource_influence +
-                diplomatic_influence +
-                member_influence
-            )
+            self.factions[fid]['stats']['influence'] = total_influence
+            self.influence_scores[fid] = total_influence
 
-            faction['stats']['influence'] = total_influence
-            self.influence_scores[faction_id] = total_influence
\ No newline at end of file
+        self._influence_pending.clear()
@@ -3,11 +3,15 @@
 from typing import Dict, List, Optional, Tuple
 import numpy as np
 from enum import Enum
-import networkx as nx
 from dataclasses import dataclass
 import uuid
 
-class RelationType(Enum):    ALLY = "ally"
+from .._kernels import calc_trust_change
+
+RELATIONSHIP_CAPACITY = 32
+
+class RelationType(Enum):
+    ALLY = "ally"
     RIVAL = "rival"
     NEUTRAL = "neutral"
     MENTOR = "mentor"
@@ -15,7 +19,12 @@ class RelationType(Enum):    ALLY = "ally"
     ENEMY = "enemy"
     FRIEND = "friend"
 
-@dataclass
+_RELATION_TYPES = tuple(RelationType)
+_TYPE_CODE = {relation_type: code for code, relation_type in enumerate(_RELATION_TYPES)}
+ALLY_CODE = _TYPE_CODE[RelationType.ALLY]
+RIVAL_CODE = _TYPE_CODE[RelationType.RIVAL]
+
+@dataclass(slots=True)
 class SocialStats:
     influence: float = 10.0
     charisma: float = 10.0
@@ -29,8 +38,24 @@ class RelationshipSystem:
     def __init__(self, agent_id: str, initial_stats: Optional[SocialStats] = None):
         self.agent_id = agent_id
         self.stats = initial_stats or SocialStats()
+        self._refresh_stat_bonuses()
         self.relationships = {}
-        self.social_network = nx.Graph()
+
+        # Node 0 is this agent; every other node is a target with its relationship numbers in the same slot
+        self._nodes: Dict[str, int] = {agent_id: 0}
+        self._node_ids: List[str] = [agent_id]
+        self._strength = np.zeros(RELATIONSHIP_CAPACITY, dtype=np.float32)
+        self._trust = np.zeros(RELATIONSHIP_CAPACITY, dtype=np.float32)
+        self._type_code = np.zeros(RELATIONSHIP_CAPACITY, dtype=np.int8)
+        self._related = np.zeros(RELATIONSHIP_CAPACITY, dtype=bool)
+        self._evolution_dirty = False
+
+        # Social network as CSR adjacency, rebuilt from the edge list only when read after a change
+        self._edge_src: List[int] = []
+        self._edge_dst: List[int] = []
+        self._row_ptr = np.zeros(2, dtype=np.int32)
+        self._col_idx = np.zeros(0, dtype=np.int32)
+        self._csr_dirty = False
         self.interaction_history = []
         self.reputation_by_faction = {}
 
@@ -58,24 +83,113 @@ class RelationshipSystem:
         if not self._validate_relationship_parameters(target_id, initial_strength):
             return {'success': False, 'reason': 'Invalid relationship parameters'}
 
-        relationship_data = {
-            'type': relation_type,
-            'strength': initial_strength,
-            'trust_level': self._calculate_initial_trust(initial_strength),
+        slot = self._node(target_id)
+        self._strength[slot] = initial_strength
+        self._trust[slot] = self._calculate_initial_trust(initial_strength)
+        self._type_code[slot] = _TYPE_CODE[relation_type]
+        self._related[slot] = True
+
+        self.relationships[target_id] = {
             'interaction_count': 0,
             'last_interaction': None,
-            'shared_experiences': [],
-            'mutual_connections': []
+            'shared_experiences': []
         }
-
-        self.relationships[target_id] = relationship_data
-        self._update_social_network(target_id, relationship_data)
+        self._update_social_network(slot)
 
         return {
             'success': True,
-            'relationship': relationship_data
+            'relationship': self.get_relationship(target_id)
         }
 
+    def get_relationship(self, target_id: str) -> Optional[Dict]:
+
+        if target_id not in self.relationships:
+            return None
+
+        slot = self._nodes[target_id]
+        return {
+            'type': _RELATION_TYPES[self._type_code[slot]],
+            'strength': float(self._strength[slot]),
+            'trust_level': float(self._trust[slot]),
+            'mutual_connections': self.mutual_connections(target_id),
+            **self.relationships[target_id]
+        }
+
+    def add_connection(self, node_a: str, node_b: str):
+        self._add_edge(self._node(node_a), self._node(node_b))
+
+    def mutual_connections(self, target_id: str) -> List[str]:
+
+        slot = self._nodes.get(target_id)
+        if slot is None:
+            return []
+
+        mutual = np.intersect1d(self._neighbors(0), self._neighbors(slot), assume_unique=True)
+        return [self._node_ids[node] for node in mutual.tolist()]
+
+    def _node(self, node_id: str) -> int:
+
+        slot = self._nodes.get(node_id)
+        if slot is None:
+            slot = len(self._node_ids)
+            if slot == len(self._strength):
+                for name in ('_strength', '_trust', '_type_code', '_related'):
+                    column = getattr(self, name)
+                    setattr(self, name, np.concatenate([column, np.zeros_like(column)]))
+
+            self._nodes[node_id] = slot
+            self._node_ids.append(node_id)
+            self._csr_dirty = True
+
+        return slot
+
+    def _update_social_network(self, slot: int):
+        self._add_edge(0, slot)
+
+    def _add_edge(self, node_a: int, node_b: int):
+
+        # Undirected: stored once per direction
+        self._edge_src += (node_a, node_b)
+        self._edge_dst += (node_b, node_a)
+        self._csr_dirty = True
+
+    def _neighbors(self, node: int) -> np.ndarray:
+
+        if self._csr_dirty:
+            self._rebuild_csr()
+        return self._col_idx[self._row_ptr[node]:self._row_ptr[node + 1]]
+
+    def _rebuild_csr(self):
+
+        src = np.array(self._edge_src, dtype=np.int32)
+        dst = np.array(self._edge_dst, dtype=np.int32)
+
+        # Drop duplicate edges so neighbor slices stay unique
+        keys = np.unique(src.astype(np.int64) * len(self._node_ids) + dst)
+        src, dst = np.divmod(keys, len(self._node_ids))
+
+        self._col_idx = dst.astype(np.int32)
+        self._row_ptr = np.zeros(len(self._node_ids) + 1, dtype=np.int32)
+        np.cumsum(np.bincount(src, minlength=len(self._node_ids)), out=self._row_ptr[1:])
+        self._csr_dirty = False
+
+    def update_stats(self, **changes) -> Dict:
+
+        unknown = [name for name in changes if not hasattr(self.stats, name)]
+        if unknown:
+            return {'success': False, 'reason': f'Unknown stats: {unknown}'}
+
+        for name, value in changes.items():
+            setattr(self.stats, name, value)
+
+        self._refresh_stat_bonuses()
+        return {'success': True, 'stats': self.stats}
+
+    def _refresh_stat_bonuses(self):
+
+        # Stats change rarely; terms derived from them are cached until update_stats
+        self._charisma_bonus = (self.stats.charisma / 100) * 0.15
+
     def interact(self,
                 target_id: str,
                 interaction_type: str,
@@ -114,10 +228,9 @@ class RelationshipSystem:
         base_chance = 0.5
 
         if target_id in self.relationships:
-            relationship = self.relationships[target_id]
-            base_chance += relationship['strength'] * 0.2
+            base_chance += float(self._strength[self._nodes[target_id]]) * 0.2
 
-        base_chance += (self.stats.charisma / 100) * 0.15
+        base_chance += self._charisma_bonus
 
         if context.get('environment_friendly', True):
             base_chance += 0.1
@@ -126,6 +239,25 @@ class RelationshipSystem:
 
         return min(max(base_chance, 0.1), 0.9)
 
+    def score_interactions_batch(self,
+                                 target_ids: List[str],
+                                 environment_friendly: np.ndarray,
+                                 previous_success: np.ndarray) -> np.ndarray:
+
+        # Vector form of _calculate_interaction_success; unknown targets contribute no strength
+        slots = np.fromiter((self._nodes.get(target_id, 0) for target_id in target_ids), dtype=np.intp, count=len(target_ids))
+        strength = np.where(self._related[slots], self._strength[slots].astype(np.float64), 0.0)
+
+        base_chance = (
+            0.5
+            + strength * 0.2
+            + self._charisma_bonus
+            + np.asarray(environment_friendly, dtype=bool) * 0.1
+            + np.asarray(previous_success, dtype=bool) * 0.05
+        )
+
+        return np.clip(base_chance, 0.1, 0.9)
+
     def _update_relationship(self,
                            target_id: str,
                            interaction_outcome: Dict):
@@ -133,11 +265,11 @@ class RelationshipSystem:
         if target_id not in self.relationships:
             return
 
-        relationship = self.relationships[target_id]
+        slot = self._nodes[target_id]
 
         delta = interaction_outcome['relationship_delta']
-        relationship['strength'] = max(min(
-            relationship['strength'] + delta,
+        self._strength[slot] = max(min(
+            self._strength[slot] + delta,
             1.0
         ), 0.0)
 
@@ -145,29 +277,48 @@ class RelationshipSystem:
             interaction_outcome['success'],
             interaction_outcome['impact']
         )
-        relationship['trust_level'] += trust_change
+        self._trust[slot] += trust_change
 
-        relationship['interaction_count'] += 1
+        self.relationships[target_id]['interaction_count'] += 1
 
-        self._check_relationship_evolution(target_id)
+        # Evolution is settled for every relationship at once on the next update
+        self._evolution_dirty = True
 
     def _calculate_trust_change(self,
                               success: bool,
                               impact: float) -> float:
 
-        base_change = 0.05 if success else -0.05
-        return base_change * impact
+        return calc_trust_change(success, impact)
+
+    def update(self, delta_time: float, out_events: Optional[List[Dict]] = None) -> Dict:
+
+        if self._evolution_dirty:
+            self.tick_evolution(out_events)
+        return {'success': True}
+
+    def tick_evolution(self, out_events: Optional[List[Dict]] = None):
 
-    def _check_relationship_evolution(self, target_id: str):
+        n = len(self._node_ids)
+        strength = self._strength[:n]
+        trust = self._trust[:n]
+        codes = self._type_code[:n]
+        related = self._related[:n]
 
-        relationship = self.relationships[target_id]
+        ally = related & (strength >= 0.8) & (trust >= 0.7) & (codes != ALLY_CODE)
+        rival = related & (strength <= 0.2) & (trust <= 0.3) & (codes != RIVAL_CODE)
 
-        if relationship['strength'] >= 0.8 and relationship['trust_level'] >= 0.7:
-            if relationship['type'] != RelationType.ALLY:
-                relationship['type'] = RelationType.ALLY
-                self._notify_relationship_change(target_id, RelationType.ALLY)
+        codes[ally] = ALLY_CODE
+        codes[rival] = RIVAL_CODE
+        self._evolution_dirty = False
 
-        elif relationship['strength'] <= 0.2 and relationship['trust_level'] <= 0.3:
-            if relationship['type'] != RelationType.RIVAL:
-                relationship['type'] = RelationType.RIVAL
-                self._notify_relationship_change(target_id, RelationType.RIVAL)
\ No newline at end of file
+        for relation, changed in ((RelationType.ALLY, ally), (RelationType.RIVAL, rival)):
+            for slot in np.flatnonzero(changed).tolist():
+                target_id = self._node_ids[slot]
+                self._notify_relationship_change(target_id, relation)
+                if out_events is not None:
+                    out_events.append({
+                        'type': 'relationship_changed',
+                        'agent_id': self.agent_id,
+                        'target_id': target_id,
+                        'relationship': relation
+                    })
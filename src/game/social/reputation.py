@@ -3,10 +3,18 @@
 from typing import Dict, List, Optional, Tuple
 from enum import Enum
 from dataclasses import dataclass
-import uuid
-from datetime import datetime
 import logging
 import numpy as np
+
+from .._kernels import TIER_BOUNDS, get_reputation_tier
+from ..ids import next_uuid, monotonic_stamp
+from ._rep_kernels import decay_and_classify
+
+REPUTATION_CAPACITY = 256
+REPUTATION_BASELINE = 50.0
+UPDATE_THRESHOLD = 0.1
+HISTORY_CAPACITY = 128
+
 class ReputationType(Enum):
     GENERAL = "general"           
     COMBAT = "combat"            
@@ -26,10 +34,45 @@ class ReputationTier(Enum):
     DUBIOUS = "dubious"         # 15-29
     INFAMOUS = "infamous"       # 0-14
 
-@dataclass
+# Tier lower bounds, ascending; a value's tier is how many bounds it has reached
+_TIER_THRESHOLDS = np.array(TIER_BOUNDS, dtype=np.float32)
+_TIERS = (
+    ReputationTier.INFAMOUS,
+    ReputationTier.DUBIOUS,
+    ReputationTier.NEUTRAL,
+    ReputationTier.KNOWN,
+    ReputationTier.RESPECTED,
+    ReputationTier.RENOWNED,
+    ReputationTier.LEGENDARY
+)
+
+def _tiers_for(values: np.ndarray) -> np.ndarray:
+    return np.searchsorted(_TIER_THRESHOLDS, values, side='right')
+
+_REP_TYPES = tuple(ReputationType)
+_REP_COLUMN = {rep_type: column for column, rep_type in enumerate(_REP_TYPES)}
+
+def _event_column(context: Dict) -> int:
+
+    # Single- and bulk-event paths both route on context['reputation_type'], a ReputationType or its value
+    return _REP_COLUMN[ReputationType(context.get('reputation_type', ReputationType.GENERAL))]
+
+# Fraction of the distance to the baseline each reputation type loses per second, in ReputationType order
+REPUTATION_DECAY_RATES = np.array([
+    0.010,  # GENERAL
+    0.020,  # COMBAT
+    0.015,  # TRADING
+    0.010,  # DIPLOMATIC
+    0.020,  # SOCIAL
+    0.005,  # HONOR
+    0.020,  # INFLUENCE
+    0.005   # EXPERTISE
+], dtype=np.float32)
+
+@dataclass(slots=True)
 class ReputationEvent:
     event_id: str
-    timestamp: datetime
+    timestamp: int
     actor_id: str
     target_id: str
     event_type: str
@@ -37,36 +80,112 @@ class ReputationEvent:
     context: Dict
     witnesses: List[str]
 
+# Numeric fields of a history entry; the string and dict fields live in a parallel list
+HISTORY_DTYPE = np.dtype([
+    ('timestamp', np.int64),
+    ('event_code', np.int32),
+    ('change', np.float32)
+])
+
+class ReputationHistory:
+
+    # Fixed-size ring of an entity's most recent events; the oldest entry is overwritten once full
+    __slots__ = ('actor_id', '_records', '_details', '_head', '_count')
+
+    def __init__(self, actor_id: str, capacity: int = HISTORY_CAPACITY):
+        self.actor_id = actor_id
+        self._records = np.zeros(capacity, dtype=HISTORY_DTYPE)
+        self._details: List[Optional[Tuple]] = [None] * capacity
+        self._head = 0
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def append(self,
+               timestamp: int,
+               event_code: int,
+               change: float,
+               details: Tuple):
+
+        head = self._head
+        self._records[head] = (timestamp, event_code, change)
+        self._details[head] = details
+
+        self._head = (head + 1) % len(self._records)
+        if self._count < len(self._records):
+            self._count += 1
+
+    def _indices(self, limit: Optional[int]) -> np.ndarray:
+
+        n = self._count if limit is None else min(limit, self._count)
+        return (self._head - n + np.arange(n)) % len(self._records)
+
+    def records(self, limit: Optional[int] = None) -> np.ndarray:
+        return self._records[self._indices(limit)]
+
+    def events(self, limit: Optional[int] = None) -> List[ReputationEvent]:
+
+        indices = self._indices(limit).tolist()
+        records = self._records[indices]
+
+        return [
+            ReputationEvent(
+                event_id=event_id,
+                timestamp=timestamp,
+                actor_id=self.actor_id,
+                target_id=target_id,
+                event_type=event_type,
+                reputation_change=change,
+                context=context,
+                witnesses=witnesses
+            )
+            for (event_id, target_id, event_type, context, witnesses), timestamp, change in zip(
+                (self._details[i] for i in indices),
+                records['timestamp'].tolist(),
+                records['change'].tolist()
+            )
+        ]
+
 class ReputationSystem:
 
-    def __init__(self):
-        self.reputations: Dict[str, Dict[ReputationType, float]] = {}
-        self.reputation_history: Dict[str, List[ReputationEvent]] = {}
+    def __init__(self, decay_rates: Optional[np.ndarray] = None):
+        # One row per entity, one column per ReputationType
+        self._rep_matrix = np.zeros((REPUTATION_CAPACITY, len(_REP_TYPES)), dtype=np.float32)
+        self._row_of: Dict[str, int] = {}
+        self._entity_ids: List[str] = []
+        self.reputation_history: Dict[str, ReputationHistory] = {}
         self.faction_modifiers: Dict[str, Dict[str, float]] = {}
+        self._faction_cache: Dict[Tuple[str, str], float] = {}
+        # Per-type decay toward the baseline; REPUTATION_DECAY_RATES unless the caller supplies its own
+        self.decay_rates = np.asarray(
+            decay_rates if decay_rates is not None else REPUTATION_DECAY_RATES,
+            dtype=np.float32
+        )
+        if self.decay_rates.shape != REPUTATION_DECAY_RATES.shape:
+            raise ValueError(f'decay_rates must have shape {REPUTATION_DECAY_RATES.shape}')
         self.event_weights: Dict[str, float] = self._initialize_event_weights()
+        self._index_event_weights()
 
     def create_reputation_profile(self, entity_id: str) -> Dict:
 
-        try:
-            if entity_id in self.reputations:
-                return {'success': False, 'reason': 'Profile already exists'}
+        if entity_id in self._row_of:
+            return {'success': False, 'reason': 'Profile already exists'}
 
-            reputation_values = {
-                rep_type: 50.0  
-                for rep_type in ReputationType
-            }
+        row = len(self._entity_ids)
+        if row == len(self._rep_matrix):
+            self._rep_matrix = np.concatenate([self._rep_matrix, np.zeros_like(self._rep_matrix)])
 
-            self.reputations[entity_id] = reputation_values
-            self.reputation_history[entity_id] = []
+        self._row_of[entity_id] = row
+        self._entity_ids.append(entity_id)
+        self._rep_matrix[row] = REPUTATION_BASELINE
+        self.reputation_history[entity_id] = ReputationHistory(entity_id)
 
-            return {
-                'success': True,
-                'entity_id': entity_id,
-                'reputation': reputation_values
-            }
-
-        except Exception as e:
-            return {'success': False, 'reason': str(e)}
+        return {
+            'success': True,
+            'entity_id': entity_id,
+            'reputation': self._reputation_values(row)
+        }
 
     def record_event(self,
                     actor_id: str,
@@ -74,131 +193,213 @@ class ReputationSystem:
                     context: Dict,
                     witnesses: List[str] = None) -> Dict:
 
-        try:
-            event_id = str(uuid.uuid4())
-            timestamp = datetime.now()
+        if actor_id not in self._row_of:
+            return {'success': False, 'reason': 'Entity not found'}
 
-            reputation_change = self._calculate_reputation_change(
-                actor_id,
-                event_type,
-                context
-            )
+        event_id = next_uuid()
+        timestamp = monotonic_stamp()
 
-            event = ReputationEvent(
-                event_id=event_id,
-                timestamp=timestamp,
-                actor_id=actor_id,
-                target_id=context.get('target_id', ''),
-                event_type=event_type,
-                reputation_change=reputation_change,
-                context=context,
-                witnesses=witnesses or []
-            )
+        reputation_change = self._calculate_reputation_change(
+            actor_id,
+            event_type,
+            context
+        )
 
-            self._update_reputation(event)
+        event = ReputationEvent(
+            event_id=event_id,
+            timestamp=timestamp,
+            actor_id=actor_id,
+            target_id=context.get('target_id', ''),
+            event_type=event_type,
+            reputation_change=reputation_change,
+            context=context,
+            witnesses=witnesses or []
+        )
 
-            self.reputation_history[actor_id].append(event)
+        self._update_reputation(event)
 
-            return {
-                'success': True,
-                'event_id': event_id,
-                'reputation_change': reputation_change
-            }
+        self.reputation_history[actor_id].append(
+            timestamp,
+            self._event_code.get(event_type, -1),
+            reputation_change,
+            (event_id, event.target_id, event_type, context, event.witnesses)
+        )
 
-        except Exception as e:
-            return {'success': False, 'reason': str(e)}
+        return {
+            'success': True,
+            'event_id': event_id,
+            'reputation_change': reputation_change
+        }
+
+    def record_events_bulk(self,
+                          actor_ids: List[str],
+                          event_types: List[str],
+                          contexts: List[Dict],
+                          witnesses_list: Optional[List[List[str]]] = None) -> Dict:
+
+        if not len(actor_ids) == len(event_types) == len(contexts):
+            return {'success': False, 'reason': 'Mismatched batch lengths'}
+
+        row_of = self._row_of
+        rows = np.fromiter((row_of.get(actor_id, -1) for actor_id in actor_ids), dtype=np.intp, count=len(actor_ids))
+        if (rows < 0).any():
+            return {'success': False, 'reason': 'Entity not found'}
+
+        columns = np.fromiter((_event_column(context) for context in contexts), dtype=np.intp, count=len(contexts))
+
+        event_code = self._event_code
+        codes = np.fromiter((event_code.get(event_type, -1) for event_type in event_types), dtype=np.intp, count=len(event_types))
+        base = self._event_weights_arr[codes]
+        context_modifiers = np.fromiter((self._get_context_modifier(context) for context in contexts), dtype=np.float64, count=len(contexts))
+        faction_modifiers = np.fromiter(
+            (self._get_faction_modifier(actor_id, context.get('faction_id')) for actor_id, context in zip(actor_ids, contexts)),
+            dtype=np.float64,
+            count=len(actor_ids)
+        )
+
+        changes = np.clip(base * context_modifiers * faction_modifiers, -100, 100)
+
+        # Repeated (row, column) pairs accumulate instead of overwriting each other
+        np.add.at(self._rep_matrix, (rows, columns), changes)
+        np.clip(self._rep_matrix, 0.0, 100.0, out=self._rep_matrix)
+
+        timestamp = monotonic_stamp()
+        witnesses_list = witnesses_list or [None] * len(actor_ids)
+        event_ids = []
+        history = self.reputation_history
+
+        for actor_id, event_type, code, context, witnesses, change in zip(
+                actor_ids, event_types, codes.tolist(), contexts, witnesses_list, changes.tolist()):
+            event_id = next_uuid()
+            history[actor_id].append(
+                timestamp,
+                code,
+                change,
+                (event_id, context.get('target_id', ''), event_type, context, witnesses or [])
+            )
+            event_ids.append(event_id)
+
+        return {
+            'success': True,
+            'event_ids': event_ids,
+            'reputation_changes': changes.tolist()
+        }
 
     def get_reputation(self,
                       entity_id: str,
                       reputation_type: Optional[ReputationType] = None) -> Dict:
 
-        try:
-            if entity_id not in self.reputations:
-                return {'success': False, 'reason': 'Entity not found'}
-
-            if reputation_type:
-                value = self.reputations[entity_id][reputation_type]
-                tier = self._get_reputation_tier(value)
-                return {
-                    'success': True,
-                    'value': value,
-                    'tier': tier,
-                    'type': reputation_type
-                }
-            else:
-
-                return {
-                    'success': True,
-                    'reputations': {
-                        rep_type: {
-                            'value': value,
-                            'tier': self._get_reputation_tier(value)
-                        }
-                        for rep_type, value in self.reputations[entity_id].items()
+        row = self._row_of.get(entity_id)
+        if row is None:
+            return {'success': False, 'reason': 'Entity not found'}
+
+        if reputation_type:
+            value = float(self._rep_matrix[row, _REP_COLUMN[reputation_type]])
+            tier = self._get_reputation_tier(value)
+            return {
+                'success': True,
+                'value': value,
+                'tier': tier,
+                'type': reputation_type
+            }
+        else:
+
+            values = self._rep_matrix[row]
+            return {
+                'success': True,
+                'reputations': {
+                    rep_type: {
+                        'value': value,
+                        'tier': _TIERS[tier]
                     }
+                    for rep_type, value, tier in zip(_REP_TYPES, values.tolist(), _tiers_for(values).tolist())
                 }
+            }
+
+    def get_history(self,
+                    entity_id: str,
+                    limit: Optional[int] = None) -> Dict:
 
-        except Exception as e:
-            return {'success': False, 'reason': str(e)}
+        history = self.reputation_history.get(entity_id)
+        if history is None:
+            return {'success': False, 'reason': 'Entity not found'}
+
+        return {'success': True, 'events': history.events(limit)}
 
     def modify_faction_relations(self,
                                faction_id: str,
                                entity_id: str,
                                modifier: float) -> Dict:
 
-        try:
-            if faction_id not in self.faction_modifiers:
-                self.faction_modifiers[faction_id] = {}
+        if faction_id not in self.faction_modifiers:
+            self.faction_modifiers[faction_id] = {}
 
-            self.faction_modifiers[faction_id][entity_id] = modifier
+        self.faction_modifiers[faction_id][entity_id] = modifier
+        self._faction_cache.pop((entity_id, faction_id), None)
 
-            return {
-                'success': True,
-                'faction_id': faction_id,
-                'entity_id': entity_id,
-                'modifier': modifier
-            }
-
-        except Exception as e:
-            return {'success': False, 'reason': str(e)}
+        return {
+            'success': True,
+            'faction_id': faction_id,
+            'entity_id': entity_id,
+            'modifier': modifier
+        }
 
     def decay_reputation(self, delta_time: float) -> Dict:
 
-        try:
-            updates = []
+        values = self._rep_matrix[:len(self._entity_ids)]
+        old_values = np.empty_like(values)
+        tiers = np.empty(values.shape, dtype=np.int8)
+        changed = np.empty(values.shape, dtype=np.bool_)
+
+        # Every value relaxes toward the baseline at its type's rate
+        decay_and_classify(
+            values,
+            self.decay_rates,
+            REPUTATION_BASELINE,
+            delta_time,
+            _TIER_THRESHOLDS,
+            UPDATE_THRESHOLD,
+            old_values,
+            tiers,
+            changed
+        )
+
+        rows, columns = np.nonzero(changed)
+        updates = [
+            {
+                'entity_id': self._entity_ids[row],
+                'type': _REP_TYPES[column],
+                'old_value': float(old_values[row, column]),
+                'new_value': float(values[row, column]),
+                'tier': _TIERS[tiers[row, column]]
+            }
+            for row, column in zip(rows.tolist(), columns.tolist())
+        ]
 
-            for entity_id in self.reputations:
-                for rep_type in self.reputations[entity_id]:
-                    old_value = self.reputations[entity_id][rep_type]
+        return {'success': True, 'updates': updates}
 
-                    decay = self._calculate_decay(
-                        old_value,
-                        rep_type,
-                        delta_time
-                    )
+    def _index_event_weights(self):
 
-                    new_value = max(0, min(100, old_value - decay))
-                    self.reputations[entity_id][rep_type] = new_value
+        # Event types map to small codes; the trailing 0.0 slot is what unknown types (code -1) read
+        self._event_code: Dict[str, int] = {event_type: code for code, event_type in enumerate(self.event_weights)}
+        self._event_weights_arr = np.array([*self.event_weights.values(), 0.0], dtype=np.float64)
 
-                    if abs(new_value - old_value) > 0.1:
-                        updates.append({
-                            'entity_id': entity_id,
-                            'type': rep_type,
-                            'old_value': old_value,
-                            'new_value': new_value
-                        })
+    def _update_reputation(self, event: ReputationEvent):
 
-            return {'success': True, 'updates': updates}
+        row = self._row_of[event.actor_id]
+        column = _event_column(event.context)
+        value = self._rep_matrix[row, column] + event.reputation_change
+        self._rep_matrix[row, column] = min(max(value, 0.0), 100.0)
 
-        except Exception as e:
-            return {'success': False, 'reason': str(e)}
+    def _reputation_values(self, row: int) -> Dict[ReputationType, float]:
+        return dict(zip(_REP_TYPES, self._rep_matrix[row].tolist()))
 
     def _calculate_reputation_change(self,
                                    actor_id: str,
                                    event_type: str,
                                    context: Dict) -> float:
 
-        base_change = self.event_weights.get(event_type, 0.0)
+        base_change = float(self._event_weights_arr[self._event_code.get(event_type, -1)])
 
         context_modifier = self._get_context_modifier(context)
 
@@ -211,19 +412,15 @@ class ReputationSystem:
 
         return max(-100, min(100, change))
 
-    def _get_reputation_tier(self, value: float) -> ReputationTier:
+    def _get_faction_modifier(self,
+                              actor_id: str,
+                              faction_id: Optional[str]) -> float:
 
-        if value >= 90:
-            return ReputationTier.LEGENDARY
-        elif value >= 75:
-            return ReputationTier.RENOWNED
-        elif value >= 60:
-            return ReputationTier.RESPECTED
-        elif value >= 45:
-            return ReputationTier.KNOWN
-        elif value >= 30:
-            return ReputationTier.NEUTRAL
-        elif value >= 15:
-            return ReputationTier.DUBIOUS
-        else:
-            return ReputationTier.INFAMOUS
+        key = (actor_id, faction_id)
+        modifier = self._faction_cache.get(key)
+        if modifier is None:
+            modifier = self._faction_cache[key] = self.faction_modifiers.get(faction_id, {}).get(actor_id, 1.0)
+        return modifier
+
+    def _get_reputation_tier(self, value: float) -> ReputationTier:
+        return _TIERS[get_reputation_tier(value)]
@@ -4,10 +4,13 @@ from typing import Dict, List, Optional, Tuple, Set
 import numpy as np
 from enum import Enum
 from dataclasses import dataclass
-import uuid
+
+from .._kernels import weather_impact_row
+from ..ids import next_uuid
 
 class BiomeType(Enum):
-    DOJO = "dojo"    ARENA = "arena"
+    DOJO = "dojo"
+    ARENA = "arena"
     WILDERNESS = "wilderness"
     SETTLEMENT = "settlement"
     SACRED_GROUNDS = "sacred_grounds"
@@ -20,7 +23,12 @@ class WeatherEffect(Enum):
     MYSTIC_AURA = "mystic_aura"
     CORRUPTED_MIST = "corrupted_mist"
 
-@dataclass
+EFFECT_CAPACITY = 32
+
+_IMPACT_KEYS = ('visibility', 'movement_speed', 'resource_generation', 'magic_potency', 'stability')
+_EFFECT_IDX = {effect: row for row, effect in enumerate(WeatherEffect)}
+
+@dataclass(slots=True)
 class EnvironmentStats:
     size: Tuple[float, float, float]
     population_capacity: int
@@ -29,18 +37,40 @@ class EnvironmentStats:
     stability: float
     magic_potency: float
 
+_BIOME_IDX = {biome: row for row, biome in enumerate(BiomeType)}
+
+# Default stats per biome, in BiomeType order:
+# size x, size y, size z, population capacity, resource richness, danger, stability, magic potency
+_BIOME_STATS_TABLE = np.array([
+    [100.0, 100.0, 30.0, 50.0, 0.5, 0.2, 0.9, 0.7],  # DOJO
+    [200.0, 200.0, 50.0, 100.0, 0.3, 0.8, 0.7, 0.5],  # ARENA
+    [150.0, 150.0, 40.0, 75.0, 0.4, 0.5, 0.8, 0.6],  # WILDERNESS
+    [150.0, 150.0, 40.0, 75.0, 0.4, 0.5, 0.8, 0.6],  # SETTLEMENT
+    [150.0, 150.0, 40.0, 75.0, 0.4, 0.5, 0.8, 0.6],  # SACRED_GROUNDS
+    [150.0, 150.0, 40.0, 75.0, 0.4, 0.5, 0.8, 0.6]   # CORRUPTED
+])
+
 class EnvironmentSystem:
 
     def __init__(self,
                  environment_id: Optional[str] = None,
                  biome_type: BiomeType = BiomeType.ARENA,
                  initial_stats: Optional[EnvironmentStats] = None):
-        self.environment_id = environment_id or str(uuid.uuid4())
+        self.environment_id = environment_id or next_uuid()
         self.biome_type = biome_type
         self.stats = initial_stats or self._generate_default_stats()
 
         self.current_weather = WeatherEffect.CLEAR
-        self.active_effects: List[Dict] = []
+
+        # Active effects as parallel columns; the first _eff_count entries are live
+        self._eff_count = 0
+        self._eff_duration = np.zeros(EFFECT_CAPACITY, dtype=np.float64)
+        self._eff_intensity = np.zeros(EFFECT_CAPACITY, dtype=np.float32)
+        self._eff_type = np.zeros(EFFECT_CAPACITY, dtype=np.int16)
+        self._eff_meta: List[Dict] = []
+        self._effect_types: List = []
+        self._effect_code: Dict = {}
+
         self.dynamic_objects: Dict[str, Dict] = {}
         self.static_objects: Dict[str, Dict] = {}
 
@@ -56,33 +86,15 @@ class EnvironmentSystem:
 
     def _generate_default_stats(self) -> EnvironmentStats:
 
-        base_stats = {
-            BiomeType.DOJO: EnvironmentStats(
-                size=(100.0, 100.0, 30.0),
-                population_capacity=50,
-                resource_richness=0.5,
-                danger_level=0.2,
-                stability=0.9,
-                magic_potency=0.7
-            ),
-            BiomeType.ARENA: EnvironmentStats(
-                size=(200.0, 200.0, 50.0),
-                population_capacity=100,
-                resource_richness=0.3,
-                danger_level=0.8,
-                stability=0.7,
-                magic_potency=0.5
-            ),
-
-        }
-        return base_stats.get(self.biome_type, EnvironmentStats(
-            size=(150.0, 150.0, 40.0),
-            population_capacity=75,
-            resource_richness=0.4,
-            danger_level=0.5,
-            stability=0.8,
-            magic_potency=0.6
-        ))
+        sx, sy, sz, capacity, richness, danger, stability, magic = _BIOME_STATS_TABLE[_BIOME_IDX[self.biome_type]].tolist()
+        return EnvironmentStats(
+            size=(sx, sy, sz),
+            population_capacity=int(capacity),
+            resource_richness=richness,
+            danger_level=danger,
+            stability=stability,
+            magic_potency=magic
+        )
 
     def update_environment(self, delta_time: float) -> Dict:
 
@@ -155,50 +167,87 @@ class EnvironmentSystem:
             'duration': duration
         }
 
+    @property
+    def active_effects(self) -> List[Dict]:
+
+        return [
+            {**meta, 'type': self._effect_types[code], 'duration': duration, 'intensity': intensity}
+            for meta, code, duration, intensity in zip(
+                self._eff_meta,
+                self._eff_type[:self._eff_count].tolist(),
+                self._eff_duration[:self._eff_count].tolist(),
+                self._eff_intensity[:self._eff_count].tolist()
+            )
+        ]
+
+    def add_active_effect(self,
+                          effect_type,
+                          duration: float,
+                          intensity: float = 1.0,
+                          **meta) -> Dict:
+
+        code = self._effect_code.get(effect_type)
+        if code is None:
+            code = self._effect_code[effect_type] = len(self._effect_types)
+            self._effect_types.append(effect_type)
+
+        n = self._eff_count
+        if n == len(self._eff_duration):
+            self._eff_duration = np.concatenate([self._eff_duration, np.zeros_like(self._eff_duration)])
+            self._eff_intensity = np.concatenate([self._eff_intensity, np.zeros_like(self._eff_intensity)])
+            self._eff_type = np.concatenate([self._eff_type, np.zeros_like(self._eff_type)])
+
+        self._eff_duration[n] = duration
+        self._eff_intensity[n] = intensity
+        self._eff_type[n] = code
+        self._eff_meta.append(meta)
+        self._eff_count = n + 1
+
+        return {
+            'success': True,
+            'effect_type': effect_type,
+            'duration': duration
+        }
+
     def _update_active_effects(self,
                              delta_time: float,
                              updates: Dict):
 
-        for effect in self.active_effects[:]:  # Copy list for safe removal
-            effect['duration'] -= delta_time
-
-            if effect['duration'] <= 0:
-                self.active_effects.remove(effect)
-                updates['effects_removed'].append(effect['type'])
-                continue
-
-            self._apply_effect_impacts(effect, delta_time)
+        n = self._eff_count
+        if not n:
+            return
+
+        durations = self._eff_duration[:n]
+        durations -= delta_time
+        alive = durations > 0
+
+        if not alive.all():
+            updates['effects_removed'].extend(
+                self._effect_types[code] for code in self._eff_type[:n][~alive].tolist()
+            )
+
+            # Compact survivors to the front, keeping their order
+            keep = np.flatnonzero(alive)
+            n = len(keep)
+            self._eff_duration[:n] = self._eff_duration[keep]
+            self._eff_intensity[:n] = self._eff_intensity[keep]
+            self._eff_type[:n] = self._eff_type[keep]
+            self._eff_meta = [self._eff_meta[i] for i in keep.tolist()]
+            self._eff_count = n
+
+            if not n:
+                return
+
+        # Summed intensity per effect type, indexed by type code
+        intensity_by_type = np.bincount(
+            self._eff_type[:n],
+            weights=self._eff_intensity[:n],
+            minlength=len(self._effect_types)
+        )
+        self._apply_effect_impacts(intensity_by_type, delta_time)
 
     def _calculate_weather_impacts(self,
                                  weather: WeatherEffect,
                                  intensity: float) -> Dict:
 
-        impacts = {
-            'visibility': 1.0,
-            'movement_speed': 1.0,
-            'resource_generation': 1.0,
-            'magic_potency': 1.0,
-            'stability': 0.0
-        }
-
-        if weather == WeatherEffect.RAIN:
-            impacts.update({
-                'visibility': 0.7 * intensity,
-                'movement_speed': 0.8 * intensity,
-                'resource_generation': 1.2 * intensity
-            })
-        elif weather == WeatherEffect.STORM:
-            impacts.update({
-                'visibility': 0.4 * intensity,
-                'movement_speed': 0.6 * intensity,
-                'stability': -0.2 * intensity,
-                'magic_potency': 1.3 * intensity
-            })
-        elif weather == WeatherEffect.MYSTIC_AURA:
-            impacts.update({
-                'magic_potency': 1.5 * intensity,
-                'resource_generation': 1.3 * intensity,
-                'stability': 0.1 * intensity
-            })
-
-        return impacts
\ No newline at end of file
+        return dict(zip(_IMPACT_KEYS, weather_impact_row(_EFFECT_IDX[weather], intensity)))
@@ -3,11 +3,15 @@
 from typing import Dict, List, Optional, Tuple, Any
 from enum import Enum
 from dataclasses import dataclass
-import uuid
 from datetime import datetime
+from itertools import count
+import heapq
 import numpy as np
 
-class InteractionType(Enum):    DIALOGUE = "dialogue"
+from ..ids import next_uuid, monotonic_stamp
+
+class InteractionType(Enum):
+    DIALOGUE = "dialogue"
     TRADE = "trade"
     COMBAT = "combat"
     SOCIAL = "social"
@@ -15,13 +19,24 @@ class InteractionType(Enum):    DIALOGUE = "dialogue"
     QUEST = "quest"
     SPECIAL = "special"
 
+_TYPE_CODE = {interaction_type: code for code, interaction_type in enumerate(InteractionType)}
+
 class InteractionPriority(Enum):
     LOW = 0
     MEDIUM = 1
     HIGH = 2
     CRITICAL = 3
 
-@dataclass
+# Numeric fields of a finished interaction; 256 entries of 16 bytes fill a 4 KiB chunk
+HISTORY_DTYPE = np.dtype([
+    ('timestamp', np.int64),
+    ('type_code', np.int16),
+    ('priority', np.int16),
+    ('event_count', np.int32)
+])
+HISTORY_CHUNK = 4096 // HISTORY_DTYPE.itemsize
+
+@dataclass(slots=True)
 class InteractionContext:
     location: Tuple[float, float, float]
     participants: List[str]
@@ -34,10 +49,21 @@ class InteractionSystem:
 
     def __init__(self):
         self.active_interactions: Dict[str, Dict] = {}
-        self.interaction_history: List[Dict] = []
+
+        # Finished interactions: fixed-size numeric chunks plus their dicts in a parallel list
+        self._hist_chunks: List[np.ndarray] = []
+        self._hist_n = 0
+        self._hist_payloads: List[Dict] = []
         self.pending_interactions: Dict[str, List[Dict]] = {}
         self.interaction_rules = self._load_interaction_rules()
 
+        # (-priority, seq, interaction_id); entries for finished interactions are skipped lazily
+        self._priority_heap: List[Tuple[int, int, str]] = []
+        self._priority_seq = count()
+
+        # Dialogue lines waiting for flush_dialogue(): (interaction_id, speaker_id, dialogue_data)
+        self._pending_dialogue: List[Tuple[str, str, Dict]] = []
+
     def create_interaction(self,
                          interaction_type: InteractionType,
                          initiator_id: str,
@@ -45,44 +71,98 @@ class InteractionSystem:
                          context: InteractionContext,
                          priority: InteractionPriority = InteractionPriority.MEDIUM) -> Dict:
 
-        try:
-            interaction_id = str(uuid.uuid4())
+        interaction_id = next_uuid()
 
-            validation = self._validate_interaction(
-                interaction_type,
-                initiator_id,
-                target_ids,
-                context
-            )
+        validation = self._validate_interaction(
+            interaction_type,
+            initiator_id,
+            target_ids,
+            context
+        )
 
-            if not validation['valid']:
-                return {'success': False, 'reason': validation['reason']}
+        if not validation['valid']:
+            return {'success': False, 'reason': validation['reason']}
 
-            interaction = {
-                'id': interaction_id,
-                'type': interaction_type,
-                'initiator': initiator_id,
-                'targets': target_ids,
-                'context': context,
-                'priority': priority,
-                'state': 'initializing',
-                'start_time': datetime.now(),
-                'events': [],
-                'outcomes': {}
-            }
+        interaction = {
+            'id': interaction_id,
+            'type': interaction_type,
+            'initiator': initiator_id,
+            'targets': target_ids,
+            'context': context,
+            'priority': priority,
+            'state': 'initializing',
+            'start_time': monotonic_stamp(),
+            'events': [],
+            'outcomes': {}
+        }
+
+        self._initialize_interaction_type(interaction)
+
+        self.active_interactions[interaction_id] = interaction
+        self._push_priority(interaction_id, priority)
+
+        return {
+            'success': True,
+            'interaction_id': interaction_id,
+            'interaction': interaction
+        }
+
+    @property
+    def interaction_history(self) -> List[Dict]:
+        return self._hist_payloads
+
+    def count_history(self, interaction_type: InteractionType) -> int:
+
+        code = _TYPE_CODE[interaction_type]
+        return sum(
+            int(np.count_nonzero(chunk['type_code'] == code))
+            for chunk in self._history_chunks()
+        )
 
-            self._initialize_interaction_type(interaction)
+    def _history_chunks(self):
 
-            self.active_interactions[interaction_id] = interaction
+        full, tail = divmod(self._hist_n, HISTORY_CHUNK)
+        yield from self._hist_chunks[:full]
+        if tail:
+            yield self._hist_chunks[full][:tail]
 
-            return {
-                'success': True,
-                'interaction_id': interaction_id,
-                'interaction': interaction
-            }
+    def _append_history(self, interaction: Dict):
 
-        except Exception as e:
-            return {'success': False, 'reason': str(e)}
+        slot = self._hist_n % HISTORY_CHUNK
+        if slot == 0:
+            self._hist_chunks.append(np.empty(HISTORY_CHUNK, dtype=HISTORY_DTYPE))
+
+        self._hist_chunks[-1][slot] = (
+            monotonic_stamp(),
+            _TYPE_CODE[interaction['type']],
+            interaction['priority'].value,
+            len(interaction['events'])
+        )
+        self._hist_payloads.append(interaction)
+        self._hist_n += 1
+
+    def next_critical(self) -> Optional[Dict]:
+
+        # Highest-priority live interaction, oldest first within a priority
+        heap = self._priority_heap
+        while heap:
+            interaction = self.active_interactions.get(heap[0][2])
+            if interaction is not None and interaction['state'] != 'completed':
+                return interaction
+            heapq.heappop(heap)
+
+        return None
+
+    def _push_priority(self, interaction_id: str, priority: InteractionPriority):
+
+        heap = self._priority_heap
+
+        # Stale entries buried below the top would otherwise accumulate
+        if len(heap) > 2 * len(self.active_interactions) + 64:
+            heap[:] = [entry for entry in heap if entry[2] in self.active_interactions]
+            heapq.heapify(heap)
+
+        heapq.heappush(heap, (-priority.value, next(self._priority_seq), interaction_id))
 
     def update_interaction(self,
                          interaction_id: str,
@@ -92,63 +172,86 @@ class InteractionSystem:
         if interaction_id not in self.active_interactions:
             return {'success': False, 'reason': 'Interaction not found'}
 
-        try:
-            interaction = self.active_interactions[interaction_id]
-
-            if not self._validate_action(action, actor_id, interaction):
-                return {'success': False, 'reason': 'Invalid action'}
+        interaction = self.active_interactions[interaction_id]
 
-            result = self._process_action(action, interaction)
+        if not self._validate_action(action, actor_id, interaction):
+            return {'success': False, 'reason': 'Invalid action'}
 
-            interaction['events'].append({
-                'timestamp': datetime.now(),
-                'actor': actor_id,
-                'action': action,
-                'result': result
-            })
+        result = self._process_action(action, interaction)
 
-            if self._check_interaction_completion(interaction):
-                self._complete_interaction(interaction_id)
+        interaction['events'].append({
+            'timestamp': monotonic_stamp(),
+            'actor': actor_id,
+            'action': action,
+            'result': result
+        })
 
-            return {
-                'success': True,
-                'result': result,
-                'interaction_state': interaction['state']
-            }
+        if self._check_interaction_completion(interaction):
+            self._complete_interaction(interaction_id)
 
-        except Exception as e:
-            return {'success': False, 'reason': str(e)}
+        return {
+            'success': True,
+            'result': result,
+            'interaction_state': interaction['state']
+        }
 
     def handle_dialogue(self,
                        interaction_id: str,
                        speaker_id: str,
                        dialogue_data: Dict) -> Dict:
 
-        try:
+        interaction = self.active_interactions.get(interaction_id)
+        if not interaction or interaction['type'] != InteractionType.DIALOGUE:
+            return {'success': False, 'reason': 'Invalid dialogue interaction'}
+
+        return self._finish_dialogue(
+            speaker_id,
+            dialogue_data,
+            interaction,
+            self._analyze_dialogue_sentiment(dialogue_data['content'])
+        )
+
+    def queue_dialogue(self,
+                      interaction_id: str,
+                      speaker_id: str,
+                      dialogue_data: Dict) -> Dict:
+
+        interaction = self.active_interactions.get(interaction_id)
+        if not interaction or interaction['type'] != InteractionType.DIALOGUE:
+            return {'success': False, 'reason': 'Invalid dialogue interaction'}
+
+        self._pending_dialogue.append((interaction_id, speaker_id, dialogue_data))
+
+        return {'success': True, 'queued': len(self._pending_dialogue)}
+
+    def flush_dialogue(self) -> List[Dict]:
+
+        pending, self._pending_dialogue = self._pending_dialogue, []
+        if not pending:
+            return []
+
+        # Every distinct line in the frame is scored once, in one batch
+        texts = list(dict.fromkeys(dialogue_data['content'] for _, _, dialogue_data in pending))
+        sentiments = dict(zip(texts, self._analyze_dialogue_sentiments(texts)))
+
+        results = []
+        for interaction_id, speaker_id, dialogue_data in pending:
             interaction = self.active_interactions.get(interaction_id)
-            if not interaction or interaction['type'] != InteractionType.DIALOGUE:
-                return {'success': False, 'reason': 'Invalid dialogue interaction'}
+            if not interaction:
+                results.append({'success': False, 'reason': 'Invalid dialogue interaction', 'interaction_id': interaction_id})
+                continue
 
-            response = self._process_dialogue(
+            result = self._finish_dialogue(
                 speaker_id,
                 dialogue_data,
-                interaction
+                interaction,
+                sentiments[dialogue_data['content']]
             )
 
-            self._update_relationships_from_dialogue(
-                speaker_id,
-                interaction['targets'],
-                response
-            )
+            result['interaction_id'] = interaction_id
+            results.append(result)
 
-            return {
-                'success': True,
-                'response': response,
-                'effects': self._calculate_dialogue_effects(response)
-            }
-
-        except Exception as e:
-            return {'success': False, 'reason': str(e)}
+        return results
 
     def handle_training(self,
                        interaction_id: str,
@@ -156,30 +259,26 @@ class InteractionSystem:
                        student_id: str,
                        training_data: Dict) -> Dict:
 
-        try:
-            interaction = self.active_interactions.get(interaction_id)
-            if not interaction or interaction['type'] != InteractionType.TRAINING:
-                return {'success': False, 'reason': 'Invalid training interaction'}
-
-            results = self._calculate_training_results(
-                trainer_id,
-                student_id,
-                training_data
-            )
+        interaction = self.active_interactions.get(interaction_id)
+        if not interaction or interaction['type'] != InteractionType.TRAINING:
+            return {'success': False, 'reason': 'Invalid training interaction'}
 
-            self._apply_training_effects(
-                student_id,
-                results
-            )
+        results = self._calculate_training_results(
+            trainer_id,
+            student_id,
+            training_data
+        )
 
-            return {
-                'success': True,
-                'results': results,
-                'improvements': self._calculate_improvements(results)
-            }
+        self._apply_training_effects(
+            student_id,
+            results
+        )
 
-        except Exception as e:
-            return {'success': False, 'reason': str(e)}
+        return {
+            'success': True,
+            'results': results,
+            'improvements': self._calculate_improvements(results)
+        }
 
     def handle_special_interaction(self,
                                  interaction_id: str,
@@ -187,43 +286,69 @@ class InteractionSystem:
                                  participants: List[str],
                                  special_data: Dict) -> Dict:
 
-        try:
-            interaction = self.active_interactions.get(interaction_id)
-            if not interaction or interaction['type'] != InteractionType.SPECIAL:
-                return {'success': False, 'reason': 'Invalid special interaction'}
+        interaction = self.active_interactions.get(interaction_id)
+        if not interaction or interaction['type'] != InteractionType.SPECIAL:
+            return {'success': False, 'reason': 'Invalid special interaction'}
 
-            validation = self._validate_special_interaction(
-                special_type,
-                participants,
-                special_data
-            )
+        validation = self._validate_special_interaction(
+            special_type,
+            participants,
+            special_data
+        )
 
-            if not validation['valid']:
-                return {'success': False, 'reason': validation['reason']}
+        if not validation['valid']:
+            return {'success': False, 'reason': validation['reason']}
 
-            effects = self._process_special_effects(
-                special_type,
-                participants,
-                special_data
-            )
+        effects = self._process_special_effects(
+            special_type,
+            participants,
+            special_data
+        )
+
+        self._apply_special_effects(effects)
+
+        return {
+            'success': True,
+            'effects': effects,
+            'impact': self._calculate_special_impact(effects)
+        }
+
+    def _finish_dialogue(self,
+                        speaker_id: str,
+                        dialogue_data: Dict,
+                        interaction: Dict,
+                        sentiment) -> Dict:
+
+        response = self._process_dialogue(
+            speaker_id,
+            dialogue_data,
+            interaction,
+            sentiment
+        )
+
+        self._update_relationships_from_dialogue(
+            speaker_id,
+            interaction['targets'],
+            response
+        )
 
-            self._apply_special_effects(effects)
+        return {
+            'success': True,
+            'response': response,
+            'effects': self._calculate_dialogue_effects(response)
+        }
 
-            return {
-                'success': True,
-                'effects': effects,
-                'impact': self._calculate_special_impact(effects)
-            }
+    def _analyze_dialogue_sentiments(self, texts: List[str]) -> List:
 
-        except Exception as e:
-            return {'success': False, 'reason': str(e)}
+        # Batched analyzers override this; the default scores line by line
+        return [self._analyze_dialogue_sentiment(text) for text in texts]
 
     def _process_dialogue(self,
                          speaker_id: str,
                          dialogue_data: Dict,
-                         interaction: Dict) -> Dict:
+                         interaction: Dict,
+                         sentiment) -> Dict:
 
-        sentiment = self._analyze_dialogue_sentiment(dialogue_data['content'])
         context = self._get_dialogue_context(interaction)
 
         response = self._generate_dialogue_response(
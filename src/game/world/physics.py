@@ -1,15 +1,43 @@
 # src/game/world/physics.py
 
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
 import numpy as np
 from dataclasses import dataclass
-from enum import Enum
-
-class PhysicsLayer(Enum):
-    DEFAULT = "default"
-    COMBAT = "combat"    INTERACTION = "interaction"
-    TRIGGER = "trigger"
-    PROJECTILE = "projectile"
+from enum import IntFlag
+import time
+
+from .._jit import HAVE_NUMBA, prange, select_kernel
+
+PHYSICS_CAPACITY = 64
+# Single precision is plenty at 60 Hz and halves the bandwidth of every column pass
+PHYSICS_DTYPE = np.float32
+COLLISION_CAPACITY = 1024
+
+# Per-body columns, all indexed by the body's row; rows [0, _count) are live
+_ROW_ARRAYS = (
+    'pos', 'vel', 'ang_vel', 'force', 'torque', 'rot',
+    'mass', 'inv_mass', 'friction', 'restitution', 'gravity_scale', 'gravity_accel', 'radius', 'collision_layer',
+    'collision_mask', 'kinematic', 'awake'
+)
+
+# Spatial hash for the broad phase (Teschner et al.); a body's cell and its 26 neighbours are searched
+_HASH_PRIMES = np.array([73856093, 19349663, 83492791], dtype=np.int64)
+# Sweep-and-prune keeps its x-sorted order between frames; past this shift (in body diameters) the hash grid is used
+SAP_MAX_SHIFT = 1.0
+
+_NEIGHBOR_OFFSETS = np.array(
+    [(x, y, z) for x in (-1, 0, 1) for y in (-1, 0, 1) for z in (-1, 0, 1)],
+    dtype=np.int64
+)
+
+class PhysicsLayer(IntFlag):
+    DEFAULT = 1
+    COMBAT = 2
+    INTERACTION = 4
+    TRIGGER = 8
+    PROJECTILE = 16
+
+ALL_LAYERS = PhysicsLayer.DEFAULT | PhysicsLayer.COMBAT | PhysicsLayer.INTERACTION | PhysicsLayer.TRIGGER | PhysicsLayer.PROJECTILE
 
 @dataclass
 class PhysicsProperties:
@@ -19,19 +47,273 @@ class PhysicsProperties:
     is_kinematic: bool = False
     gravity_scale: float = 1.0
     collision_layer: PhysicsLayer = PhysicsLayer.DEFAULT
+    radius: float = 0.5
+    # Layers this body may touch; a pair collides only if each one's layer is in the other's mask
+    collision_mask: PhysicsLayer = ALL_LAYERS
+
+def _integrate_rotations(rot: np.ndarray, w: np.ndarray, dt: float, rows: np.ndarray):
+
+    # q' = q + 0.5 * (0, w) * q * dt for (x, y, z, w)-ordered quaternions, then renormalize
+    q = rot[rows]
+    w = w[rows]
+    v = q[:, :3]
+    s = q[:, 3:]
+    dv = 0.5 * (s * w + np.cross(w, v))
+    ds = -0.5 * np.einsum('ij,ij->i', w, v)
+
+    q[:, :3] += dv * dt
+    q[:, 3] += ds * dt
+
+    # One fused pass for all squared norms; the floor keeps degenerate quaternions finite
+    norms_sq = np.maximum(np.einsum('ij,ij->i', q, q), 1e-30)
+    q *= (1.0 / np.sqrt(norms_sq))[:, None]
+    rot[rows] = q
+
+def _substep_numpy(pos: np.ndarray,
+                   vel: np.ndarray,
+                   ang_vel: np.ndarray,
+                   rot: np.ndarray,
+                   force: np.ndarray,
+                   torque: np.ndarray,
+                   inv_mass: np.ndarray,
+                   friction: np.ndarray,
+                   gravity_accel: np.ndarray,
+                   rows: np.ndarray,
+                   dt: float):
+
+    inv_mass = inv_mass[rows, None]
+    damping = 1.0 - friction[rows, None] * dt
+
+    acceleration = force[rows] * inv_mass + gravity_accel[rows]
+    velocity = (vel[rows] + acceleration * dt) * damping
+    angular_velocity = (ang_vel[rows] + torque[rows] * inv_mass * dt) * damping
+
+    vel[rows] = velocity
+    ang_vel[rows] = angular_velocity
+    pos[rows] += velocity * dt
+    _integrate_rotations(rot, ang_vel, dt, rows)
+
+    force[rows] = 0.0
+    torque[rows] = 0.0
+
+def _substep_loops(pos: np.ndarray,
+                   vel: np.ndarray,
+                   ang_vel: np.ndarray,
+                   rot: np.ndarray,
+                   force: np.ndarray,
+                   torque: np.ndarray,
+                   inv_mass: np.ndarray,
+                   friction: np.ndarray,
+                   gravity_accel: np.ndarray,
+                   rows: np.ndarray,
+                   dt: float):
+
+    # Forces, velocities, positions, rotation and force reset in one pass per body
+    for j in prange(rows.shape[0]):
+        i = rows[j]
+        im = inv_mass[i]
+        damping = 1.0 - friction[i] * dt
+
+        vx = (vel[i, 0] + (force[i, 0] * im + gravity_accel[i, 0]) * dt) * damping
+        vy = (vel[i, 1] + (force[i, 1] * im + gravity_accel[i, 1]) * dt) * damping
+        vz = (vel[i, 2] + (force[i, 2] * im + gravity_accel[i, 2]) * dt) * damping
+        wx = (ang_vel[i, 0] + torque[i, 0] * im * dt) * damping
+        wy = (ang_vel[i, 1] + torque[i, 1] * im * dt) * damping
+        wz = (ang_vel[i, 2] + torque[i, 2] * im * dt) * damping
+
+        vel[i, 0] = vx
+        vel[i, 1] = vy
+        vel[i, 2] = vz
+        ang_vel[i, 0] = wx
+        ang_vel[i, 1] = wy
+        ang_vel[i, 2] = wz
+        pos[i, 0] += vx * dt
+        pos[i, 1] += vy * dt
+        pos[i, 2] += vz * dt
+
+        qx = rot[i, 0]
+        qy = rot[i, 1]
+        qz = rot[i, 2]
+        qw = rot[i, 3]
+        nx = qx + 0.5 * (wx * qw + wy * qz - wz * qy) * dt
+        ny = qy + 0.5 * (wy * qw + wz * qx - wx * qz) * dt
+        nz = qz + 0.5 * (wz * qw + wx * qy - wy * qx) * dt
+        nw = qw - 0.5 * (wx * qx + wy * qy + wz * qz) * dt
+
+        inv_norm = 1.0 / np.sqrt(max(nx * nx + ny * ny + nz * nz + nw * nw, 1e-30))
+        rot[i, 0] = nx * inv_norm
+        rot[i, 1] = ny * inv_norm
+        rot[i, 2] = nz * inv_norm
+        rot[i, 3] = nw * inv_norm
+
+        for k in range(3):
+            force[i, k] = 0.0
+            torque[i, k] = 0.0
+
+def _sphere_contacts_numpy(pos: np.ndarray,
+                           radius: np.ndarray,
+                           layer: np.ndarray,
+                           mask: np.ndarray,
+                           first: np.ndarray,
+                           second: np.ndarray,
+                           out_normal: np.ndarray,
+                           out_penetration: np.ndarray,
+                           out_hit: np.ndarray):
+
+    np.subtract(pos[second], pos[first], out=out_normal)
+    distance = np.sqrt(np.einsum('ij,ij->i', out_normal, out_normal))
+    np.subtract(radius[first] + radius[second], distance, out=out_penetration)
+
+    np.greater(out_penetration, 0.0, out=out_hit)
+    out_hit &= (layer[first] & mask[second]) != 0
+    out_hit &= (layer[second] & mask[first]) != 0
+
+    # Coincident centres get an arbitrary but finite up normal
+    separated = distance > 0.0
+    out_normal[separated] /= distance[separated, None]
+    out_normal[~separated] = (0.0, 1.0, 0.0)
+
+def _sphere_contacts_loops(pos: np.ndarray,
+                           radius: np.ndarray,
+                           layer: np.ndarray,
+                           mask: np.ndarray,
+                           first: np.ndarray,
+                           second: np.ndarray,
+                           out_normal: np.ndarray,
+                           out_penetration: np.ndarray,
+                           out_hit: np.ndarray):
+
+    # Distance, layer filter, normal and depth per pair; each pair writes only its own slot
+    for k in prange(first.shape[0]):
+        i = first[k]
+        j = second[k]
+        dx = pos[j, 0] - pos[i, 0]
+        dy = pos[j, 1] - pos[i, 1]
+        dz = pos[j, 2] - pos[i, 2]
+        distance = np.sqrt(dx * dx + dy * dy + dz * dz)
+        penetration = radius[i] + radius[j] - distance
+
+        out_penetration[k] = penetration
+        out_hit[k] = penetration > 0.0 and (layer[i] & mask[j]) != 0 and (layer[j] & mask[i]) != 0
+
+        if distance > 0.0:
+            out_normal[k, 0] = dx / distance
+            out_normal[k, 1] = dy / distance
+            out_normal[k, 2] = dz / distance
+        else:
+            out_normal[k, 0] = 0.0
+            out_normal[k, 1] = 1.0
+            out_normal[k, 2] = 0.0
+
+_substep = select_kernel(_substep_loops, _substep_numpy)
+_sphere_contacts = select_kernel(_sphere_contacts_loops, _sphere_contacts_numpy)
+
+class CollisionBuffer:
+
+    # Contacts for one update as parallel arrays; cleared, not reallocated, every frame
+    __slots__ = ('a', 'b', 'normal', 'penetration', 'size')
+
+    def __init__(self, capacity: int = COLLISION_CAPACITY):
+        self.a = np.empty(capacity, dtype=np.int32)
+        self.b = np.empty(capacity, dtype=np.int32)
+        self.normal = np.empty((capacity, 3), dtype=PHYSICS_DTYPE)
+        self.penetration = np.empty(capacity, dtype=PHYSICS_DTYPE)
+        self.size = 0
+
+    def __len__(self) -> int:
+        return self.size
+
+    def clear(self):
+        self.size = 0
+
+    def copy(self) -> 'CollisionBuffer':
+
+        # Independent buffer holding just the live contacts
+        size = self.size
+        copied = CollisionBuffer(max(size, 1))
+        copied.extend(self.a[:size], self.b[:size], self.normal[:size], self.penetration[:size])
+        return copied
+
+    def extend(self, a: np.ndarray, b: np.ndarray, normal: np.ndarray, penetration: np.ndarray):
+
+        start = self.size
+        end = start + len(a)
+        if end > len(self.a):
+            self._grow(end)
+
+        self.a[start:end] = a
+        self.b[start:end] = b
+        self.normal[start:end] = normal
+        self.penetration[start:end] = penetration
+        self.size = end
+
+    def _grow(self, needed: int):
+
+        capacity = len(self.a)
+        while capacity < needed:
+            capacity *= 2
+
+        for name in self.__slots__[:-1]:
+            column = getattr(self, name)
+            grown = np.empty((capacity,) + column.shape[1:], dtype=column.dtype)
+            grown[:self.size] = column[:self.size]
+            setattr(self, name, grown)
 
 class PhysicsSystem:
 
     def __init__(self, gravity: Tuple[float, float, float] = (0.0, -9.81, 0.0)):
-        self.gravity = np.array(gravity)
-        self.objects: Dict[str, Dict] = {}
+        self._id_to_row: Dict[str, int] = {}
+
+        self._count = 0
+        self._row_ids: List[str] = []
+        self._properties: List[PhysicsProperties] = []
+        self.pos = np.zeros((PHYSICS_CAPACITY, 3), dtype=PHYSICS_DTYPE)
+        self.vel = np.zeros((PHYSICS_CAPACITY, 3), dtype=PHYSICS_DTYPE)
+        self.ang_vel = np.zeros((PHYSICS_CAPACITY, 3), dtype=PHYSICS_DTYPE)
+        self.force = np.zeros((PHYSICS_CAPACITY, 3), dtype=PHYSICS_DTYPE)
+        self.torque = np.zeros((PHYSICS_CAPACITY, 3), dtype=PHYSICS_DTYPE)
+        self.rot = np.zeros((PHYSICS_CAPACITY, 4), dtype=PHYSICS_DTYPE)
+
+        # PhysicsProperties unpacked into columns; inv_mass is kept so the solver never divides
+        self.mass = np.ones(PHYSICS_CAPACITY, dtype=PHYSICS_DTYPE)
+        self.inv_mass = np.ones(PHYSICS_CAPACITY, dtype=PHYSICS_DTYPE)
+        self.friction = np.zeros(PHYSICS_CAPACITY, dtype=PHYSICS_DTYPE)
+        self.restitution = np.zeros(PHYSICS_CAPACITY, dtype=PHYSICS_DTYPE)
+        self.gravity_scale = np.zeros(PHYSICS_CAPACITY, dtype=PHYSICS_DTYPE)
+        # gravity * gravity_scale per body, rewritten only when either side changes
+        self.gravity_accel = np.zeros((PHYSICS_CAPACITY, 3), dtype=PHYSICS_DTYPE)
+        self.gravity = gravity
+        self.radius = np.zeros(PHYSICS_CAPACITY, dtype=PHYSICS_DTYPE)
+        self.collision_layer = np.zeros(PHYSICS_CAPACITY, dtype=np.uint32)
+        self.collision_mask = np.zeros(PHYSICS_CAPACITY, dtype=np.uint32)
+        self.kinematic = np.zeros(PHYSICS_CAPACITY, dtype=bool)
+        self.awake = np.zeros(PHYSICS_CAPACITY, dtype=bool)
+
+        # Awake dynamic rows, gathered once per update and shared by every substep
+        self._active_rows = np.zeros(0, dtype=np.intp)
+
+        # Rows sorted by AABB min x from the previous broad phase, and the keys they were sorted by
+        self._sap_order: Optional[np.ndarray] = None
+        self._sap_keys: Optional[np.ndarray] = None
         self.constraints: List[Dict] = []
         self.collision_pairs: List[Tuple[str, str]] = []
 
+        # Filled in place by every substep; update() hands out a copy
+        self._collisions = CollisionBuffer()
+
+        # Narrow-phase scratch, one slot per candidate pair; doubled when a substep has more candidates
+        self._scratch_normal = np.empty((COLLISION_CAPACITY, 3), dtype=PHYSICS_DTYPE)
+        self._scratch_penetration = np.empty(COLLISION_CAPACITY, dtype=PHYSICS_DTYPE)
+        self._scratch_hit = np.empty(COLLISION_CAPACITY, dtype=bool)
+
         self.time_step = 1/60  # 60 Hz physics update
         self.max_substeps = 8
         self.solver_iterations = 10
 
+        # Compile the substep kernel up front instead of inside the first frame
+        if HAVE_NUMBA:
+            self._integrate(0.0)
+
         self.performance_metrics = {
             'average_update_time': 0.0,
             'collision_checks': 0,
@@ -44,21 +326,32 @@ class PhysicsSystem:
                   position: Tuple[float, float, float],
                   rotation: Tuple[float, float, float, float] = (0, 0, 0, 1)) -> Dict:
 
-        if object_id in self.objects:
+        if object_id in self._id_to_row:
             return {'success': False, 'reason': 'Object already exists'}
 
+        row = self._count
+        if row == len(self.pos):
+            self._grow()
+
+        self.pos[row] = position
+        self.rot[row] = rotation
+        self.vel[row] = 0.0
+        self.ang_vel[row] = 0.0
+        self.force[row] = 0.0
+        self.torque[row] = 0.0
+        self._write_properties(row, properties)
+        self.awake[row] = True
+
+        self._count = row + 1
+        self._id_to_row[object_id] = row
+        self._row_ids.append(object_id)
+        self._properties.append(properties)
+
         object_data = {
             'properties': properties,
-            'position': np.array(position),
-            'rotation': np.array(rotation),
-            'velocity': np.zeros(3),
-            'angular_velocity': np.zeros(3),
-            'forces': np.zeros(3),
-            'torques': np.zeros(3),
-            'awake': True
+            'row': row
         }
 
-        self.objects[object_id] = object_data
         self.performance_metrics['active_objects'] += 1
 
         return {
@@ -66,54 +359,171 @@ class PhysicsSystem:
             'object_data': object_data
         }
 
-    def update(self, delta_time: float) -> Dict:
+    def remove_object(self, object_id: str) -> Dict:
 
-        updates = {
-            'collisions': [],
-            'position_updates': {},
-            'performance': {}
-        }
+        row = self._id_to_row.pop(object_id, None)
+        if row is None:
+            return {'success': False, 'reason': 'Object not found'}
+
+        # The last row moves into the freed one so live rows stay contiguous
+        last = self._count - 1
+        if row != last:
+            for name in _ROW_ARRAYS:
+                column = getattr(self, name)
+                column[row] = column[last]
+
+            moved_id = self._row_ids[last]
+            self._row_ids[row] = moved_id
+            self._properties[row] = self._properties[last]
+            self._id_to_row[moved_id] = row
+
+        self._row_ids.pop()
+        self._properties.pop()
+        self._count = last
+        self.performance_metrics['active_objects'] -= 1
+
+        return {'success': True, 'object_id': object_id}
+
+    @property
+    def object_ids(self) -> List[str]:
+        return list(self._row_ids)
+
+    def has_object(self, object_id: str) -> bool:
+        return object_id in self._id_to_row
+
+    def rows(self, object_ids: List[str]) -> np.ndarray:
+
+        # Rows move when objects are removed, so look them up fresh rather than holding on
+        id_to_row = self._id_to_row
+        return np.fromiter((id_to_row[object_id] for object_id in object_ids),
+                           dtype=np.int64, count=len(object_ids))
+
+    def set_velocity(self, object_id: str, velocity: Tuple[float, float, float]) -> Dict:
+
+        row = self._id_to_row.get(object_id)
+        if row is None:
+            return {'success': False, 'reason': 'Object not found'}
+
+        self.vel[row] = velocity
+        self.awake[row] = True
+
+        return {'success': True, 'object_id': object_id}
+
+    def set_properties(self, object_id: str, properties: PhysicsProperties) -> Dict:
+
+        row = self._id_to_row.get(object_id)
+        if row is None:
+            return {'success': False, 'reason': 'Object not found'}
+
+        self._properties[row] = properties
+        self._write_properties(row, properties)
+
+        return {'success': True, 'properties': properties}
 
-        start_time = np.datetime64('now')
+    @property
+    def gravity(self) -> np.ndarray:
+        return self._gravity
 
+    @gravity.setter
+    def gravity(self, gravity: Tuple[float, float, float]):
+
+        self._gravity = np.array(gravity, dtype=PHYSICS_DTYPE)
+        n = self._count
+        self.gravity_accel[:n] = self._gravity * self.gravity_scale[:n, None]
+
+    def _write_properties(self, row: int, properties: PhysicsProperties):
+
+        self.mass[row] = properties.mass
+        self.inv_mass[row] = 1.0 / properties.mass
+        self.friction[row] = properties.friction
+        self.restitution[row] = properties.restitution
+        self.gravity_scale[row] = properties.gravity_scale
+        self.gravity_accel[row] = self._gravity * properties.gravity_scale
+        self.radius[row] = properties.radius
+        self.collision_layer[row] = properties.collision_layer
+        self.collision_mask[row] = properties.collision_mask
+        self.kinematic[row] = properties.is_kinematic
+
+    def _grow(self):
+
+        for name in _ROW_ARRAYS:
+            column = getattr(self, name)
+            setattr(self, name, np.concatenate([column, np.zeros_like(column)]))
+
+    def update(self, delta_time: float, out_events: Optional[List[Dict]] = None) -> Dict:
+
+        self._collisions.clear()
+
+        start_time = time.perf_counter_ns()
+
+        n = self._count
+        self._active_rows = np.flatnonzero(self.awake[:n] & ~self.kinematic[:n])
         substep_time = delta_time / self.max_substeps
 
         for _ in range(self.max_substeps):
             self._update_forces()
             self._integrate(substep_time)
-            collisions = self._detect_collisions()
-            self._resolve_collisions(collisions)
+            first_contact = self._detect_collisions()
+            self._resolve_collisions(first_contact)
 
-            updates['collisions'].extend(collisions)
-
-        end_time = np.datetime64('now')
-        update_time = (end_time - start_time).astype(float)
+        update_time = (time.perf_counter_ns() - start_time) * 1e-9
         self._update_performance_metrics(update_time)
 
-        updates['performance'] = self.performance_metrics
-        updates['position_updates'] = self._get_position_updates()
+        if out_events is not None and self._collisions.size:
+            self._emit_collision_events(out_events)
 
-        return updates
+        # Copies, so a held result is not changed by later updates or row swaps
+        return {
+            'collisions': self._collisions.copy(),
+            'position_updates': self._get_position_updates(),
+            'object_ids': list(self._row_ids),
+            'performance': dict(self.performance_metrics)
+        }
+
+    def _emit_collision_events(self, out_events: List[Dict]):
+
+        # One event per colliding pair, even if it touched in several substeps
+        contacts = self._collisions
+        size = contacts.size
+        pairs = contacts.a[:size].astype(np.int64) * len(self._row_ids) + contacts.b[:size]
+        _, first = np.unique(pairs, return_index=True)
+
+        row_ids = self._row_ids
+        for k in np.sort(first).tolist():
+            out_events.append({
+                'type': 'collision',
+                'object_id': row_ids[contacts.a[k]],
+                'other_id': row_ids[contacts.b[k]],
+                'normal': tuple(contacts.normal[k].tolist()),
+                'penetration': float(contacts.penetration[k])
+            })
 
     def apply_force(self,
                    object_id: str,
                    force: Tuple[float, float, float],
                    point: Optional[Tuple[float, float, float]] = None) -> Dict:
 
-        if object_id not in self.objects:
+        row = self._id_to_row.get(object_id)
+        if row is None:
             return {'success': False, 'reason': 'Object not found'}
 
-        obj = self.objects[object_id]
-
-        if point is None:
+        # Scalar element updates; a temporary array per call costs more than the add itself
+        fx, fy, fz = force
+        row_force = self.force[row]
+        row_force[0] += fx
+        row_force[1] += fy
+        row_force[2] += fz
 
-            obj['forces'] += np.array(force)
-        else:
+        if point is not None:
+            position = self.pos[row]
+            rx = point[0] - position[0]
+            ry = point[1] - position[1]
+            rz = point[2] - position[2]
 
-            obj['forces'] += np.array(force)
-            r = np.array(point) - obj['position']
-            torque = np.cross(r, force)
-            obj['torques'] += torque
+            row_torque = self.torque[row]
+            row_torque[0] += ry * fz - rz * fy
+            row_torque[1] += rz * fx - rx * fz
+            row_torque[2] += rx * fy - ry * fx
 
         return {
             'success': True,
@@ -121,43 +531,189 @@ class PhysicsSystem:
             'applied_point': point
         }
 
+    def apply_forces(self,
+                     object_ids: Sequence[str],
+                     forces: np.ndarray,
+                     points: Optional[np.ndarray] = None) -> Dict:
+
+        forces = np.asarray(forces, dtype=PHYSICS_DTYPE).reshape(-1, 3)
+        if len(object_ids) != len(forces) or (points is not None and len(points) != len(forces)):
+            return {'success': False, 'reason': 'Mismatched batch lengths'}
+
+        id_to_row = self._id_to_row
+        rows = np.fromiter((id_to_row.get(object_id, -1) for object_id in object_ids), dtype=np.intp, count=len(object_ids))
+        if (rows < 0).any():
+            return {'success': False, 'reason': 'Object not found'}
+
+        # Repeated ids accumulate, matching the same forces applied one call at a time
+        np.add.at(self.force, rows, forces)
+        if points is not None:
+            r = np.asarray(points, dtype=PHYSICS_DTYPE) - self.pos[rows]
+            np.add.at(self.torque, rows, np.cross(r, forces))
+
+        return {'success': True, 'applied_count': len(rows)}
+
     def _integrate(self, dt: float):
 
-        for obj in self.objects.values():
-            if not obj['properties'].is_kinematic and obj['awake']:
+        n = self._count
+        _substep(
+            self.pos[:n],
+            self.vel[:n],
+            self.ang_vel[:n],
+            self.rot[:n],
+            self.force[:n],
+            self.torque[:n],
+            self.inv_mass[:n],
+            self.friction[:n],
+            self.gravity_accel[:n],
+            self._active_rows,
+            dt
+        )
+
+    def _broad_phase(self) -> List[Tuple[str, str]]:
+
+        first, second = self._broad_phase_rows()
+        row_ids = self._row_ids
+        return [(row_ids[i], row_ids[j]) for i, j in zip(first.tolist(), second.tolist())]
+
+    def _broad_phase_rows(self) -> Tuple[np.ndarray, np.ndarray]:
+
+        n = self._count
+        if n < 2:
+            empty = np.zeros(0, dtype=np.intp)
+            return empty, empty
+
+        keys = self.pos[:n, 0] - self.radius[:n]
+        previous = self._sap_keys
+        self._sap_keys = keys
+
+        # Nearly static scenes reuse last frame's order; large motion or a changed body count goes to the grid
+        if previous is not None and len(previous) == n:
+            shift = float(np.abs(keys - previous).max())
+            if shift <= SAP_MAX_SHIFT * 2.0 * float(self.radius[:n].max()):
+                return self._sweep_and_prune(keys)
+
+        self._sap_order = None
+        return self._hash_grid_pairs()
+
+    def _sweep_and_prune(self, keys: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+
+        n = len(keys)
+        order = self._sap_order
+        if order is None or len(order) != n:
+            order = np.argsort(keys, kind='stable')
+        else:
+            # Almost sorted already, which the stable sort handles in close to linear time
+            order = order[np.argsort(keys[order], kind='stable')]
+        self._sap_order = order
+
+        sorted_lo = keys[order]
+        sorted_hi = self.pos[order, 0] + self.radius[order]
+
+        # Each box overlaps in x with the boxes after it whose min x is below its max x
+        ends = np.searchsorted(sorted_lo, sorted_hi, side='right')
+        counts = np.maximum(ends - np.arange(1, n + 1), 0)
+
+        total = int(counts.sum())
+        if not total:
+            empty = np.zeros(0, dtype=np.intp)
+            return empty, empty
+
+        starts = np.arange(1, n + 1)
+        within = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+        first = order[np.repeat(np.arange(n), counts)]
+        second = order[np.repeat(starts, counts) + within]
+
+        reach = self.radius[first] + self.radius[second]
+        gap = np.abs(self.pos[first, 1:] - self.pos[second, 1:])
+        overlap = (gap[:, 0] <= reach) & (gap[:, 1] <= reach)
+
+        first = first[overlap]
+        second = second[overlap]
+        return np.minimum(first, second), np.maximum(first, second)
+
+    def _hash_grid_pairs(self) -> Tuple[np.ndarray, np.ndarray]:
+
+        n = self._count
+
+        # Cells span the largest diameter, so any overlapping pair shares a cell or neighbours
+        cell_size = max(2.0 * float(self.radius[:n].max()), 1e-6)
+        cells = np.floor(self.pos[:n] / cell_size).astype(np.int64)
+        mask = (1 << max(4, (2 * n - 1).bit_length())) - 1
+
+        keys = self._cell_hash(cells) & mask
+        order = np.argsort(keys, kind='stable')
+        sorted_keys = keys[order]
+        rows = np.arange(n)
+
+        first_parts = []
+        second_parts = []
+        for offset in _NEIGHBOR_OFFSETS:
+            neighbor_keys = self._cell_hash(cells + offset) & mask
+            starts = np.searchsorted(sorted_keys, neighbor_keys, side='left')
+            counts = np.searchsorted(sorted_keys, neighbor_keys, side='right') - starts
+
+            total = int(counts.sum())
+            if not total:
+                continue
+
+            # Expand each body's bucket range into explicit (body, candidate) pairs
+            within = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+            first_parts.append(np.repeat(rows, counts))
+            second_parts.append(order[np.repeat(starts, counts) + within])
+
+        first = np.concatenate(first_parts)
+        second = np.concatenate(second_parts)
+
+        # Neighbouring cells can hash to the same bucket; keep each unordered pair once
+        keep = first < second
+        codes = np.unique(first[keep] * n + second[keep])
+        return codes // n, codes % n
+
+    @staticmethod
+    def _cell_hash(cells: np.ndarray) -> np.ndarray:
+
+        hashed = cells * _HASH_PRIMES
+        return hashed[:, 0] ^ hashed[:, 1] ^ hashed[:, 2]
+
+    def _get_position_updates(self) -> np.ndarray:
 
-                acceleration = (obj['forces'] / obj['properties'].mass +
-                              self.gravity * obj['properties'].gravity_scale)
-                obj['velocity'] += acceleration * dt
-                obj['angular_velocity'] += (obj['torques'] /
-                                          obj['properties'].mass) * dt
+        # Ordered like updates['object_ids']
+        return self.pos[:self._count].copy()
 
-                obj['velocity'] *= (1.0 - obj['properties'].friction * dt)
-                obj['angular_velocity'] *= (1.0 - obj['properties'].friction * dt)
+    def _detect_collisions(self) -> int:
 
-                obj['position'] += obj['velocity'] * dt
+        # Appends this substep's contacts to the frame buffer and returns where they start
+        collisions = self._collisions
+        first_contact = len(collisions)
 
-                w = obj['angular_velocity']
-                q = obj['rotation']
-                q_dot = 0.5 * np.quaternion(0, w[0], w[1], w[2]) * q
-                obj['rotation'] += q_dot * dt
-                obj['rotation'] /= np.linalg.norm(obj['rotation'])
+        first, second = self._broad_phase_rows()
+        self.performance_metrics['collision_checks'] = len(first)
 
-                obj['forces'].fill(0)
-                obj['torques'].fill(0)
+        # Narrow phase for every candidate at once: spheres touch when centre distance < radius sum
+        count = len(first)
+        if count > len(self._scratch_hit):
+            self._grow_scratch(count)
 
-    def _detect_collisions(self) -> List[Dict]:
+        normal = self._scratch_normal[:count]
+        penetration = self._scratch_penetration[:count]
+        hit = self._scratch_hit[:count]
+        _sphere_contacts(
+            self.pos, self.radius, self.collision_layer, self.collision_mask,
+            first, second, normal, penetration, hit
+        )
 
-        collisions = []
-        self.performance_metrics['collision_checks'] = 0
+        if hit.any():
+            collisions.extend(first[hit], second[hit], normal[hit], penetration[hit])
 
-        potential_pairs = self._broad_phase()
+        return first_contact
 
-        for obj1_id, obj2_id in potential_pairs:
-            self.performance_metrics['collision_checks'] += 1
+    def _grow_scratch(self, needed: int):
 
-            if self._check_collision(obj1_id, obj2_id):
-                collision_data = self._generate_collision_data(obj1_id, obj2_id)
-                collisions.append(collision_data)
+        capacity = len(self._scratch_hit)
+        while capacity < needed:
+            capacity *= 2
 
-        return collisions
\ No newline at end of file
+        self._scratch_normal = np.empty((capacity, 3), dtype=PHYSICS_DTYPE)
+        self._scratch_penetration = np.empty(capacity, dtype=PHYSICS_DTYPE)
+        self._scratch_hit = np.empty(capacity, dtype=bool)
\ No newline at end of file
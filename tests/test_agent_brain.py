@@ -0,0 +1,106 @@
+# tests/test_agent_brain.py
+
+import unittest
+import asyncio
+import sys
+import os
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+try:
+    import tensorflow
+except ImportError:
+    tensorflow = None
+
+if tensorflow is not None:
+    from src.ai_agents.core import agent_brain
+    from src.ai_agents.core.agent_brain import AgentBrain, AgentBrainBatch
+    from src.ai_agents.core.personality import PersonalitySystem
+
+    class StubbedPersonalitySystem(PersonalitySystem):
+
+        def _load_personality_types(self):
+            return {}
+
+        def _load_behavior_patterns(self):
+            return {}
+
+        def _calculate_behavior_weights(self, traits):
+            return {}
+
+    class StubbedAgentBrain(AgentBrain):
+
+        def _update_state(self, input_data):
+            self.current_state = {'tick': input_data['tick']}
+
+        def _learn_from_experience(self, input_data, decision):
+            pass
+
+        def _encode_perception(self, input_data):
+            return input_data['perception']
+
+        def _encode_decision(self, perception_result):
+            return np.concatenate([perception_result, perception_result])
+
+@unittest.skipIf(tensorflow is None, 'tensorflow is not installed')
+class TestAgentBrainBatch(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.shared_personality_system = agent_brain.shared_personality_system
+        personality_system = StubbedPersonalitySystem()
+        agent_brain.shared_personality_system = lambda: personality_system
+        cls.brains = [StubbedAgentBrain({'LOYALTY': 0.2 * i}) for i in range(3)]
+
+    @classmethod
+    def tearDownClass(cls):
+        agent_brain.shared_personality_system = cls.shared_personality_system
+
+    def setUp(self):
+        self.rng = np.random.default_rng(3)
+
+    def test_infer_and_flush_match_forward(self):
+
+        batch = AgentBrainBatch()
+        inputs = self.rng.normal(size=(len(self.brains), 64)).astype(np.float32)
+
+        async def infer_all():
+            tasks = [
+                asyncio.ensure_future(brain.infer('decision', x, batch))
+                for brain, x in zip(self.brains, inputs)
+            ]
+            await asyncio.sleep(0)
+            self.assertEqual(len(batch), len(self.brains))
+            batch.flush()
+            return await asyncio.gather(*tasks)
+
+        outputs = asyncio.run(infer_all())
+
+        for brain, x, output in zip(self.brains, inputs, outputs):
+            np.testing.assert_allclose(output, brain._forward('decision', x), rtol=1e-5, atol=1e-6)
+        self.assertEqual(len(batch), 0)
+
+    def test_process_inputs_matches_process_input(self):
+
+        batch = AgentBrainBatch()
+        inputs = [
+            {'tick': i, 'perception': self.rng.normal(size=128).astype(np.float32)}
+            for i in range(len(self.brains))
+        ]
+
+        batched = batch.process_inputs(self.brains, inputs)
+        # Same members again reuse the stacked weights
+        stacked = batch._stacked['decision']
+        batch.process_inputs(self.brains, inputs)
+        self.assertIs(batch._stacked['decision'], stacked)
+
+        for brain, input_data, result in zip(self.brains, inputs, batched):
+            single = brain.process_input(input_data)
+            self.assertEqual(result['decision']['action'], single['decision']['action'])
+            np.testing.assert_allclose(result['decision']['scores'], single['decision']['scores'],
+                                       rtol=1e-5, atol=1e-6)
+            self.assertEqual(result['state_update'], {'tick': input_data['tick']})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -26,26 +26,23 @@ class TestCriticalFixes(unittest.TestCase):
     def setUpClass(cls):
         cls.loop = asyncio.new_event_loop()
         asyncio.set_event_loop(cls.loop)
+        cls.agent_interface = cls.loop.run_until_complete(cls.async_setup())
 
-    def setUp(self):
-        self.mock_sim = MockSimulation()
-        self.controller = SandboxController(self.mock_sim)
-        self.agent_interface = self.loop.run_until_complete(self.async_setup())
-
-    async def async_setup(self):
+    @staticmethod
+    async def async_setup():
         agent_interface = AgentInterface()
         await agent_interface.initialize()
         return agent_interface
 
-    def tearDown(self):
-        self.loop.run_until_complete(self.async_teardown())
-
-    async def async_teardown(self):
-        if hasattr(self, 'agent_interface'):
-            await self.agent_interface.cleanup()
+    def setUp(self):
+        self.mock_sim = MockSimulation()
+        self.controller = SandboxController(self.mock_sim)
+        # The interface is shared by the class and reset between tests
+        self.loop.run_until_complete(self.agent_interface.reset())
 
     @classmethod
     def tearDownClass(cls):
+        cls.loop.run_until_complete(cls.agent_interface.cleanup())
         cls.loop.close()
 
     def test_sandbox_controller_thread_safety(self):
@@ -0,0 +1,123 @@
+# tests/test_interaction.py
+
+import unittest
+import sys
+import os
+from datetime import datetime
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.game.world.interaction import (
+    InteractionSystem, InteractionType, InteractionPriority, InteractionContext
+)
+
+class StubbedInteractionSystem(InteractionSystem):
+
+    def __init__(self):
+        self.sentiment_calls = []
+        super().__init__()
+
+    def _load_interaction_rules(self):
+        return {}
+
+    def _validate_interaction(self, interaction_type, initiator_id, target_ids, context):
+        return {'valid': True}
+
+    def _initialize_interaction_type(self, interaction):
+        interaction['state'] = 'active'
+
+    def _analyze_dialogue_sentiment(self, text):
+        self.sentiment_calls.append(text)
+        return len(text) % 7
+
+    def _finish_dialogue(self, speaker_id, dialogue_data, interaction, sentiment):
+        return {
+            'success': True,
+            'response': (speaker_id, dialogue_data['content'], interaction['id'], sentiment)
+        }
+
+def _context():
+    return InteractionContext(
+        location=(0.0, 0.0, 0.0),
+        participants=['a', 'b'],
+        environment_state={},
+        time=datetime(2024, 1, 1),
+        conditions={}
+    )
+
+class TestInteractionSystem(unittest.TestCase):
+
+    def setUp(self):
+        self.system = StubbedInteractionSystem()
+
+    def _create(self, interaction_type, priority=InteractionPriority.MEDIUM):
+
+        result = self.system.create_interaction(interaction_type, 'a', ['b'], _context(), priority)
+        self.assertTrue(result['success'])
+        return result['interaction_id']
+
+    def test_flush_dialogue_matches_handle_dialogue(self):
+
+        first = self._create(InteractionType.DIALOGUE)
+        second = self._create(InteractionType.DIALOGUE)
+        lines = [
+            (first, 'a', {'content': 'hello there'}),
+            (second, 'b', {'content': 'well met'}),
+            (first, 'b', {'content': 'hello there'})
+        ]
+
+        expected = [self.system.handle_dialogue(*line) for line in lines]
+        self.system.sentiment_calls.clear()
+
+        for line in lines:
+            self.assertTrue(self.system.queue_dialogue(*line)['success'])
+        results = self.system.flush_dialogue()
+
+        self.assertEqual([result['response'] for result in results],
+                         [result['response'] for result in expected])
+        self.assertEqual([result['interaction_id'] for result in results], [first, second, first])
+        # Repeated lines are scored once per flush
+        self.assertEqual(sorted(self.system.sentiment_calls), ['hello there', 'well met'])
+        self.assertEqual(self.system.flush_dialogue(), [])
+
+    def test_queue_dialogue_rejects_other_types(self):
+
+        trade = self._create(InteractionType.TRADE)
+        self.assertFalse(self.system.queue_dialogue(trade, 'a', {'content': 'hi'})['success'])
+
+    def test_next_critical_orders_by_priority_then_age(self):
+
+        low = self._create(InteractionType.SOCIAL, InteractionPriority.LOW)
+        high_old = self._create(InteractionType.COMBAT, InteractionPriority.HIGH)
+        high_new = self._create(InteractionType.TRADE, InteractionPriority.HIGH)
+
+        self.assertEqual(self.system.next_critical()['id'], high_old)
+
+        self.system.active_interactions[high_old]['state'] = 'completed'
+        self.assertEqual(self.system.next_critical()['id'], high_new)
+
+        del self.system.active_interactions[high_new]
+        self.assertEqual(self.system.next_critical()['id'], low)
+
+        del self.system.active_interactions[low]
+        self.assertIsNone(self.system.next_critical())
+
+    def test_count_history_across_chunks(self):
+
+        kinds = [InteractionType.DIALOGUE, InteractionType.TRADE, InteractionType.COMBAT]
+        expected = {kind: 0 for kind in InteractionType}
+
+        for i in range(700):
+            kind = kinds[i % 3 if i % 5 else 0]
+            expected[kind] += 1
+            self.system._append_history({
+                'type': kind,
+                'priority': InteractionPriority.LOW,
+                'events': []
+            })
+
+        for kind in InteractionType:
+            self.assertEqual(self.system.count_history(kind), expected[kind])
+        self.assertEqual(len(self.system.interaction_history), 700)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,122 @@
+# tests/test_kernels.py
+
+import unittest
+import sys
+import os
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.game.world import physics
+from src.game.combat import participants
+from src.game.social import _rep_kernels
+from src.game.social import faction_system
+
+class TestKernelTwins(unittest.TestCase):
+    """Jeder *_loops-Kernel muss dasselbe liefern wie sein *_numpy-Zwilling"""
+
+    def setUp(self):
+        self.rng = np.random.default_rng(7)
+
+    def _run_twins(self, loops, numpy_version, make_args):
+
+        loops_args = make_args()
+        numpy_args = make_args()
+
+        loops_result = loops(*loops_args)
+        numpy_result = numpy_version(*numpy_args)
+
+        for loops_arg, numpy_arg in zip(loops_args, numpy_args):
+            if isinstance(loops_arg, np.ndarray):
+                np.testing.assert_allclose(loops_arg, numpy_arg, rtol=1e-5, atol=1e-6)
+
+        if loops_result is not None:
+            np.testing.assert_array_equal(loops_result, numpy_result)
+
+    def test_substep(self):
+
+        count = 32
+        pos = self.rng.normal(size=(count, 3)).astype(np.float32)
+        vel = self.rng.normal(size=(count, 3)).astype(np.float32)
+        ang_vel = self.rng.normal(size=(count, 3)).astype(np.float32)
+        rot = self.rng.normal(size=(count, 4)).astype(np.float32)
+        rot /= np.linalg.norm(rot, axis=1, keepdims=True)
+        force = self.rng.normal(size=(count, 3)).astype(np.float32)
+        torque = self.rng.normal(size=(count, 3)).astype(np.float32)
+        inv_mass = self.rng.uniform(0.1, 2.0, count).astype(np.float32)
+        friction = self.rng.uniform(0.0, 0.5, count).astype(np.float32)
+        gravity_accel = np.tile(np.float32([0.0, -9.81, 0.0]), (count, 1))
+        rows = np.flatnonzero(self.rng.random(count) < 0.7)
+
+        self._run_twins(
+            physics._substep_loops,
+            physics._substep_numpy,
+            lambda: (pos.copy(), vel.copy(), ang_vel.copy(), rot.copy(), force.copy(),
+                     torque.copy(), inv_mass, friction, gravity_accel, rows, 1 / 60)
+        )
+
+    def test_sphere_contacts(self):
+
+        count = 24
+        pos = self.rng.uniform(-2.0, 2.0, (count, 3)).astype(np.float32)
+        pos[1] = pos[0]  # coincident centres
+        radius = self.rng.uniform(0.2, 1.0, count).astype(np.float32)
+        layer = self.rng.choice([1, 2, 4, 8], count).astype(np.int64)
+        mask = self.rng.integers(0, 16, count).astype(np.int64)
+        first, second = np.triu_indices(count, k=1)
+
+        self._run_twins(
+            physics._sphere_contacts_loops,
+            physics._sphere_contacts_numpy,
+            lambda: (pos, radius, layer, mask, first, second,
+                     np.empty((len(first), 3), dtype=np.float32),
+                     np.empty(len(first), dtype=np.float32),
+                     np.empty(len(first), dtype=bool))
+        )
+
+    def test_tick_kernel(self):
+
+        count = 16
+        positions = self.rng.normal(size=(count, 3)).astype(np.float32)
+        velocities = self.rng.normal(size=(count, 3)).astype(np.float32)
+        velocities[::3] = 0.0
+        cooldowns = self.rng.uniform(0.0, 0.2, (count, 4)).astype(np.float32)
+        status_owner = self.rng.integers(0, count, 40)
+        status_remaining = self.rng.uniform(0.0, 5.0, 40).astype(np.float32)
+        active = self.rng.random(count) < 0.6
+
+        self._run_twins(
+            participants._tick_kernel_loops,
+            participants._tick_kernel_numpy,
+            lambda: (positions.copy(), velocities, cooldowns.copy(), status_remaining.copy(),
+                     status_owner, active, 0.1)
+        )
+
+    def test_decay_and_classify(self):
+
+        matrix = self.rng.uniform(0.0, 100.0, (12, 5)).astype(np.float32)
+        rates = self.rng.uniform(0.0, 0.1, 5).astype(np.float32)
+        thresholds = np.float32([15.0, 30.0, 45.0, 60.0, 75.0, 90.0])
+
+        self._run_twins(
+            _rep_kernels._decay_and_classify_loops,
+            _rep_kernels._decay_and_classify_numpy,
+            lambda: (matrix.copy(), rates, 50.0, 0.5, thresholds, 0.01,
+                     np.empty_like(matrix),
+                     np.empty(matrix.shape, dtype=np.int64),
+                     np.empty(matrix.shape, dtype=bool))
+        )
+
+    def test_drift_relationships(self):
+
+        count = 10
+        rel = self.rng.uniform(-1.0, 1.0, (count, count)).astype(np.float32)
+        types = self.rng.integers(0, len(faction_system.TYPE_AFFINITY), count)
+
+        self._run_twins(
+            faction_system._drift_relationships_loops,
+            faction_system._drift_relationships_numpy,
+            lambda: (rel.copy(), types, faction_system.TYPE_AFFINITY, 0.05)
+        )
+
+if __name__ == '__main__':
+    unittest.main()
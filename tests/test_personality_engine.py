@@ -4,11 +4,12 @@ import unittest
 from src.game.agent_platform.personality_engine import PersonalityEngine, PersonalityTrait, SuperPower
 
 class TestPersonalityEngine(unittest.TestCase):
-    def setUp(self):
-        """Wird vor jedem Test ausgeführt"""
-        self.engine = PersonalityEngine()
+    @classmethod
+    def setUpClass(cls):
+        """Wird einmal vor allen Tests ausgeführt; die Fixtures werden nur gelesen"""
+        cls.engine = PersonalityEngine()
 
-        self.test_traits = {
+        cls.test_traits = {
             PersonalityTrait.AGGRESSION: 0.7,
             PersonalityTrait.COURAGE: 0.6,
             PersonalityTrait.WISDOM: 0.5,
@@ -16,7 +17,7 @@ class TestPersonalityEngine(unittest.TestCase):
             PersonalityTrait.LOYALTY: 0.8
         }
 
-        self.test_powers = [
+        cls.test_powers = [
             SuperPower.TELEKINESIS,
             SuperPower.ENERGY_BLAST
         ]
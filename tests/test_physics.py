@@ -0,0 +1,110 @@
+# tests/test_physics.py
+
+import unittest
+import sys
+import os
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.game.world.physics import PhysicsSystem, PhysicsProperties
+
+class TestPhysicsSystem(unittest.TestCase):
+
+    def setUp(self):
+        self.rng = np.random.default_rng(11)
+        self.physics = PhysicsSystem()
+        self.ids = [f'body_{i}' for i in range(12)]
+        for object_id in self.ids:
+            self.physics.add_object(
+                object_id,
+                PhysicsProperties(radius=float(self.rng.uniform(0.2, 0.8))),
+                tuple(self.rng.uniform(-5.0, 5.0, 3).tolist())
+            )
+
+    def test_apply_forces_matches_apply_force(self):
+
+        other = PhysicsSystem()
+        for object_id in self.ids:
+            other.add_object(object_id, PhysicsProperties(), tuple(self.physics.pos[self.physics._id_to_row[object_id]].tolist()))
+
+        # Repeated ids must accumulate like repeated single calls
+        targets = [self.ids[i] for i in self.rng.integers(0, len(self.ids), 30)]
+        forces = self.rng.normal(size=(30, 3)).astype(np.float32)
+        points = self.rng.normal(size=(30, 3)).astype(np.float32)
+
+        result = self.physics.apply_forces(targets, forces, points)
+        self.assertTrue(result['success'])
+
+        for object_id, force, point in zip(targets, forces.tolist(), points.tolist()):
+            other.apply_force(object_id, tuple(force), tuple(point))
+
+        for object_id in self.ids:
+            row = self.physics._id_to_row[object_id]
+            other_row = other._id_to_row[object_id]
+            np.testing.assert_allclose(self.physics.force[row], other.force[other_row], rtol=1e-5, atol=1e-5)
+            np.testing.assert_allclose(self.physics.torque[row], other.torque[other_row], rtol=1e-5, atol=1e-4)
+
+    def test_apply_forces_rejects_unknown_ids(self):
+
+        result = self.physics.apply_forces(['missing'], np.ones((1, 3)))
+        self.assertFalse(result['success'])
+        self.assertFalse(self.physics.force.any())
+
+    def test_remove_object_keeps_rows_consistent(self):
+
+        positions = {
+            object_id: self.physics.pos[self.physics._id_to_row[object_id]].copy()
+            for object_id in self.ids
+        }
+
+        for object_id in (self.ids[0], self.ids[5], self.ids[-1]):
+            self.assertTrue(self.physics.remove_object(object_id)['success'])
+            del positions[object_id]
+
+        self.assertFalse(self.physics.remove_object(self.ids[0])['success'])
+        self.assertEqual(sorted(self.physics.object_ids), sorted(positions))
+
+        for object_id, position in positions.items():
+            row = self.physics._id_to_row[object_id]
+            self.assertEqual(self.physics.object_ids[row], object_id)
+            np.testing.assert_array_equal(self.physics.pos[row], position)
+
+    def _brute_force_pairs(self):
+
+        n = self.physics._count
+        pos = self.physics.pos[:n].astype(np.float64)
+        radius = self.physics.radius[:n].astype(np.float64)
+
+        pairs = set()
+        for i in range(n):
+            for j in range(i + 1, n):
+                if np.linalg.norm(pos[i] - pos[j]) < radius[i] + radius[j]:
+                    pairs.add((i, j))
+        return pairs
+
+    def _candidate_pairs(self, first, second):
+        return {(min(i, j), max(i, j)) for i, j in zip(first.tolist(), second.tolist())}
+
+    def _pack_bodies(self):
+
+        # Pack the bodies so that plenty of them overlap
+        self.physics.pos[:self.physics._count] *= 0.3
+        expected = self._brute_force_pairs()
+        self.assertTrue(expected)
+        return expected
+
+    def test_hash_grid_finds_every_overlap(self):
+
+        expected = self._pack_bodies()
+        grid_pairs = self._candidate_pairs(*self.physics._hash_grid_pairs())
+        self.assertTrue(expected <= grid_pairs)
+
+    def test_sweep_and_prune_finds_every_overlap(self):
+
+        expected = self._pack_bodies()
+        keys = self.physics.pos[:self.physics._count, 0] - self.physics.radius[:self.physics._count]
+        sap_pairs = self._candidate_pairs(*self.physics._sweep_and_prune(keys))
+        self.assertTrue(expected <= sap_pairs)
+
+if __name__ == '__main__':
+    unittest.main()
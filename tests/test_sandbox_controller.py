@@ -0,0 +1,87 @@
+# tests/test_sandbox_controller.py
+
+import unittest
+import sys
+import os
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.game.sandbox.controller import SandboxController, ControlCommand, SimulationState
+
+class DictSimulation:
+    def __init__(self):
+        self.state = SimulationState.INITIALIZING
+        self.simulation_id = "test_sim_002"
+        self.data = {
+            'tick': 0,
+            'positions': np.zeros((8, 3), dtype=np.float32),
+            'label': 'start'
+        }
+
+    def get_state(self):
+        return self.data
+
+    def set_state(self, state):
+        self.data = state
+
+class TestSandboxControllerSaves(unittest.TestCase):
+
+    def setUp(self):
+        self.simulation = DictSimulation()
+        self.controller = SandboxController(self.simulation)
+        self.controller.execute_command(ControlCommand.START, {})
+
+    def tearDown(self):
+        self.controller.shutdown()
+
+    def _save(self):
+
+        result = self.controller.execute_command(ControlCommand.SAVE, {})
+        self.assertTrue(result['success'], result.get('reason'))
+        return result['save_id']
+
+    def test_diff_save_round_trip(self):
+
+        data = self.simulation.data
+        data['tick'] = 5
+        data['positions'][2] = (1.0, 2.0, 3.0)
+        data['extra'] = [1, 2]
+        first = self._save()
+        expected = {key: (value.copy() if isinstance(value, np.ndarray) else value)
+                    for key, value in data.items()}
+
+        data['tick'] = 9
+        data['positions'][:] = 7.0
+        del data['label']
+        self._save()
+
+        # Force the on-disk path rather than the in-memory hot cache
+        self.controller._hot_saves.clear()
+        result = self.controller.execute_command(ControlCommand.LOAD, {'save_id': first})
+        self.assertTrue(result['success'], result.get('reason'))
+
+        restored = self.simulation.data
+        self.assertEqual(set(restored), set(expected))
+        self.assertEqual(restored['tick'], 5)
+        self.assertEqual(restored['label'], 'start')
+        self.assertEqual(restored['extra'], [1, 2])
+        np.testing.assert_array_equal(restored['positions'], expected['positions'])
+
+    def test_saves_stay_in_store_dir(self):
+
+        save_id = self._save()
+        store_dir = self.controller.save_store_dir
+
+        self.assertEqual(os.path.dirname(self.controller.save_states[save_id]), store_dir)
+        self.assertTrue(os.path.isdir(store_dir))
+
+        self.controller.shutdown()
+        self.assertFalse(os.path.exists(store_dir))
+
+    def test_history_includes_latest_command(self):
+
+        self._save()
+        self.assertEqual(self.controller.command_history[-1].command, ControlCommand.SAVE.value)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,155 @@
+# tests/test_sandbox_simulation.py
+
+import unittest
+import functools
+import multiprocessing
+import io
+import sys
+import os
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.game.sandbox import simulation, zygote
+from src.game.sandbox.simulation import AgentBrain, SandboxSimulation, SimulationState
+from src.game.world.environment import EnvironmentSystem
+from src.game.world.physics import PhysicsProperties
+
+class StubbedEnvironmentSystem(EnvironmentSystem):
+
+    def _initialize_environment(self):
+        pass
+
+class StubbedAgentBrain:
+
+    # Slot bookkeeping is under test here, not inference
+    def __init__(self, personality_traits):
+        self.personality = personality_traits
+
+    def reinit(self, personality_traits):
+        self.personality = personality_traits
+
+def setUpModule():
+    simulation.EnvironmentSystem = StubbedEnvironmentSystem
+    simulation.AgentBrain = StubbedAgentBrain
+
+def tearDownModule():
+    simulation.EnvironmentSystem = EnvironmentSystem
+    simulation.AgentBrain = AgentBrain
+
+class StubbedSandboxSimulation(SandboxSimulation):
+
+    def _default_config(self):
+        return {'time_scale': 1.0}
+
+    def _initialize_combat_manager(self):
+        return None
+
+    def _initialize_social_manager(self):
+        return None
+
+    def _initialize_faction_manager(self):
+        return None
+
+    def _initialize_simulation(self):
+        self.state = SimulationState.RUNNING
+
+    def _generate_physics_properties(self, agent_type):
+        return PhysicsProperties()
+
+def _report_simulation(queue, simulation):
+    queue.put((simulation.simulation_id, simulation.config, simulation.time_scale))
+
+class TestSandboxSimulationSlots(unittest.TestCase):
+
+    def setUp(self):
+        self.simulation = StubbedSandboxSimulation()
+        self.agent_ids = [
+            self.simulation.add_agent('scout', (float(i), 0.0, 2.0), {
+                'personality': {'LOYALTY': 0.1 * i},
+                'health': 50.0 + i,
+                'velocity': (0.0, 0.0, float(i))
+            })['agent_id']
+            for i in range(4)
+        ]
+
+    def _position(self, simulation, agent_id):
+
+        physics = simulation.physics
+        return physics.pos[physics.rows([agent_id])[0]]
+
+    def test_remove_agent_frees_slot_and_body(self):
+
+        removed = self.agent_ids[1]
+        slot = self.simulation._id_to_slot[removed]
+
+        self.assertTrue(self.simulation.remove_agent(removed)['success'])
+        self.assertFalse(self.simulation.remove_agent(removed)['success'])
+
+        self.assertFalse(self.simulation.physics.has_object(removed))
+        self.assertFalse(self.simulation._agent_alive[slot])
+        self.assertEqual(self.simulation.stats.active_agents, 3)
+
+        # The freed slot is the next one handed out, and its brain is reused
+        brain = self.simulation._agent_brains[slot]
+        added = self.simulation.add_agent('scout', (9.0, 9.0, 9.0), {})['agent_id']
+        self.assertEqual(self.simulation._id_to_slot[added], slot)
+        self.assertIs(self.simulation._agent_brains[slot], brain)
+
+        for agent_id in self.agent_ids[2:]:
+            np.testing.assert_array_equal(
+                self._position(self.simulation, agent_id),
+                (float(self.agent_ids.index(agent_id)), 0.0, 2.0)
+            )
+
+    def test_save_and_load_round_trip(self):
+
+        self.simulation.remove_agent(self.agent_ids[0])
+        buffer = io.BytesIO()
+        self.simulation.save_to(buffer)
+        buffer.seek(0)
+
+        restored = StubbedSandboxSimulation()
+        restored.load_from(buffer)
+
+        self.assertEqual(restored.simulation_id, self.simulation.simulation_id)
+        self.assertEqual(restored._id_to_slot, self.simulation._id_to_slot)
+        self.assertEqual(restored.stats.active_agents, 3)
+        self.assertEqual(sorted(restored.physics.object_ids), sorted(self.agent_ids[1:]))
+
+        for agent_id in self.agent_ids[1:]:
+            slot = restored._id_to_slot[agent_id]
+            self.assertEqual(restored._agent_hp[slot], self.simulation._agent_hp[slot])
+            self.assertEqual(restored._agent_brains[slot].personality,
+                             self.simulation._agent_brains[slot].personality)
+            np.testing.assert_array_equal(self._position(restored, agent_id),
+                                          self._position(self.simulation, agent_id))
+
+@unittest.skipUnless('fork' in multiprocessing.get_all_start_methods(), 'fork is not available')
+class TestZygoteSpawn(unittest.TestCase):
+
+    def setUp(self):
+        self.baseline = zygote._baseline
+        zygote._baseline = StubbedSandboxSimulation()
+
+    def tearDown(self):
+        zygote._baseline = self.baseline
+
+    def test_spawn_applies_config_in_child_only(self):
+
+        queue = multiprocessing.get_context('fork').Queue()
+        parent = zygote._baseline
+
+        process = zygote.spawn({'time_scale': 2.0}, functools.partial(_report_simulation, queue))
+        simulation_id, config, time_scale = queue.get(timeout=30)
+        process.join(30)
+
+        self.assertEqual(process.exitcode, 0)
+        self.assertNotEqual(simulation_id, parent.simulation_id)
+        self.assertEqual(config['time_scale'], 2.0)
+        self.assertEqual(time_scale, 2.0)
+        # The warmed parent copy is untouched
+        self.assertEqual(parent.config['time_scale'], 1.0)
+        self.assertEqual(parent.time_scale, 1.0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+# tests/test_skills.py
+
+import unittest
+import sys
+import os
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.game.combat.skills import SkillSystem, SkillData, SkillType
+
+class StubbedSkillSystem(SkillSystem):
+
+    def _apply_modifiers(self, base_value, effect, caster_stats, target_stats, environment):
+        resist = target_stats.get('defense', 0.0) * effect.get('resist', 0.0)
+        return base_value * environment.get('multiplier', 1.0) - resist
+
+    def _calculate_energy_cost(self, skill, caster_stats):
+        return skill.energy_cost * (1.0 - caster_stats.get('focus', 0.0) * 0.01)
+
+class TestSkillEffectsBatch(unittest.TestCase):
+
+    def setUp(self):
+        self.system = StubbedSkillSystem()
+        self.skill = SkillData(
+            id='fireball',
+            name='Fireball',
+            type=SkillType.ATTACK,
+            level=1,
+            base_power=2.0,
+            energy_cost=12.0,
+            cooldown=3.0,
+            range=10.0,
+            area_of_effect=2.0,
+            effects=[
+                {'type': 'damage', 'base_value': 10.0, 'scaling': {'intelligence': 0.8}, 'resist': 0.5},
+                {'type': 'debuff', 'base_value': 2.0, 'scaling': {'intelligence': 0.1, 'wisdom': 0.3}, 'duration': 4},
+                {'type': 'knockback', 'base_value': 1.0}
+            ],
+            requirements={}
+        )
+        self.system.skills[self.skill.id] = self.skill
+        self.caster = {'intelligence': 14.0, 'wisdom': 9.0, 'focus': 20.0}
+        self.environment = {'multiplier': 1.25}
+
+    def test_batch_matches_scalar(self):
+
+        targets = {
+            'defense': np.array([0.0, 5.0, 12.5, 30.0]),
+            'agility': np.array([3.0, 1.0, 7.0, 2.0])
+        }
+
+        batch = self.system.calculate_skill_effects_batch(self.skill.id, self.caster, targets, self.environment)
+        self.assertTrue(batch['success'])
+        self.assertEqual(batch['effects'].shape, (3, 4))
+        self.assertEqual(batch['effect_types'], ['damage', 'debuff', 'knockback'])
+
+        for index in range(4):
+            target = {stat: float(values[index]) for stat, values in targets.items()}
+            scalar = self.system.calculate_skill_effects(self.skill.id, self.caster, target, self.environment)
+
+            np.testing.assert_allclose(batch['effects'][:, index], [effect['value'] for effect in scalar['effects']])
+            self.assertEqual(batch['durations'], [effect['duration'] for effect in scalar['effects']])
+            self.assertEqual(batch['energy_cost'], scalar['energy_cost'])
+
+    def test_unknown_skill(self):
+
+        result = self.system.calculate_skill_effects_batch('missing', self.caster, {}, self.environment)
+        self.assertFalse(result['success'])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+# tests/test_social.py
+
+import unittest
+import sys
+import os
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.game.social.reputation import ReputationSystem, ReputationType
+from src.game.social.relationships import RelationshipSystem, RelationType
+
+class StubbedReputationSystem(ReputationSystem):
+
+    def _initialize_event_weights(self):
+        return {'duel_won': 6.0, 'trade_honored': 2.5, 'betrayal': -15.0}
+
+    def _get_context_modifier(self, context):
+        return context.get('modifier', 1.0)
+
+class StubbedRelationshipSystem(RelationshipSystem):
+
+    def _validate_relationship_parameters(self, target_id, initial_strength):
+        return 0.0 <= initial_strength <= 1.0
+
+    def _calculate_initial_trust(self, initial_strength):
+        return initial_strength
+
+class TestReputationBulk(unittest.TestCase):
+
+    def setUp(self):
+        self.entities = ['ari', 'bo', 'cy']
+        self.events = [
+            ('ari', 'duel_won', {'reputation_type': ReputationType.COMBAT}),
+            ('bo', 'betrayal', {'reputation_type': 'honor', 'modifier': 2.0}),
+            ('ari', 'trade_honored', {'reputation_type': ReputationType.TRADING, 'target_id': 'bo'}),
+            ('ari', 'duel_won', {'reputation_type': 'combat', 'faction_id': 'guild'}),
+            ('cy', 'unknown_event', {}),
+            ('bo', 'trade_honored', {})
+        ]
+
+    def _system(self):
+
+        system = StubbedReputationSystem()
+        for entity_id in self.entities:
+            system.create_reputation_profile(entity_id)
+        system.modify_faction_relations('guild', 'ari', 1.5)
+        return system
+
+    def test_bulk_matches_single_events(self):
+
+        single = self._system()
+        bulk = self._system()
+
+        single_changes = [
+            single.record_event(actor_id, event_type, context)['reputation_change']
+            for actor_id, event_type, context in self.events
+        ]
+        result = bulk.record_events_bulk(*map(list, zip(*self.events)))
+
+        self.assertTrue(result['success'])
+        np.testing.assert_allclose(result['reputation_changes'], single_changes)
+
+        for entity_id in self.entities:
+            for rep_type in ReputationType:
+                self.assertAlmostEqual(
+                    single.get_reputation(entity_id, rep_type)['value'],
+                    bulk.get_reputation(entity_id, rep_type)['value'],
+                    places=4
+                )
+            self.assertEqual(
+                [event.event_type for event in single.get_history(entity_id)['events']],
+                [event.event_type for event in bulk.get_history(entity_id)['events']]
+            )
+
+    def test_bulk_rejects_unknown_entity(self):
+
+        system = self._system()
+        result = system.record_events_bulk(['nobody'], ['duel_won'], [{}])
+        self.assertFalse(result['success'])
+
+class TestRelationshipBatchScoring(unittest.TestCase):
+
+    def test_batch_matches_scalar(self):
+
+        system = StubbedRelationshipSystem('self_agent')
+        for i, strength in enumerate((0.1, 0.4, 0.9)):
+            system.establish_relationship(f'friend_{i}', RelationType.ALLY, strength)
+
+        targets = ['friend_0', 'friend_1', 'friend_2', 'stranger']
+        friendly = np.array([True, False, True, False])
+        previous = np.array([False, True, True, False])
+
+        batch = system.score_interactions_batch(targets, friendly, previous)
+        scalar = [
+            system._calculate_interaction_success(
+                target_id,
+                'chat',
+                {'environment_friendly': bool(f), 'previous_success': bool(p)}
+            )
+            for target_id, f, p in zip(targets, friendly, previous)
+        ]
+
+        np.testing.assert_allclose(batch, scalar, rtol=1e-6)
+
+if __name__ == '__main__':
+    unittest.main()